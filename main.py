@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
 from src.constants import (
     DYNAMIC_PLUGINS_CONFIG_YAML_FILE_PATH,
@@ -8,6 +9,7 @@ from src.constants import (
     GITHUB_TOKEN,
     PR_CREATION_LIMIT,
     UPDATE_PR_STRATEGY,
+    configure_logging,
     logger,
 )
 from src.exceptions import GithubPRFailedException
@@ -23,6 +25,8 @@ from src.utils import build_version_string, rhdh_plugin_needs_update
 
 
 def main():
+    configure_logging()
+
     if not GITHUB_REPOSITORY:
         logger.error("Error: GITHUB_REPOSITORY environment variable is required")
         return
@@ -35,8 +39,8 @@ def main():
     rhdh_config_loader = RHDHPluginsConfigLoader()
     rhdh_config_updater = RHDHPluginConfigUpdater()
     rhdh_plugins = rhdh_config_loader.load_rhdh_plugins()
-    trimmed_file_path = DYNAMIC_PLUGINS_CONFIG_YAML_FILE_PATH.replace(
-        RHDHPluginUpdaterConfig.GH_RUNNER_PREFIX, ""
+    trimmed_file_path = DYNAMIC_PLUGINS_CONFIG_YAML_FILE_PATH.removeprefix(
+        RHDHPluginUpdaterConfig.GH_RUNNER_PREFIX
     )
 
     logger.info(f"found {len(rhdh_plugins)} RHDH plugins to check for updates")
@@ -45,22 +49,42 @@ def main():
     plugin_updates: "list[RHDHPluginUpdate]" = []
     prs_created = 0
 
-    for plugin in rhdh_plugins:
+    # fetching packages is I/O bound, so run the lookups concurrently and keep
+    # the PR creation below serial. Plugins sharing a package and prefix are
+    # looked up once, as their concurrent fetches would all miss the cache
+    lookup_keys = list(
+        dict.fromkeys((p.package_name, p.current_tag_prefix) for p in rhdh_plugins)
+    )
+    with ThreadPoolExecutor(
+        max_workers=RHDHPluginUpdaterConfig.GH_PACKAGES_FETCH_MAX_WORKERS
+    ) as executor:
+        latest_by_key = dict(
+            zip(
+                lookup_keys,
+                executor.map(
+                    lambda key: gh_api_client.fetch_latest_version(
+                        key[0], tag_prefix_filter=key[1]
+                    ),
+                    lookup_keys,
+                ),
+            )
+        )
+    latest_package_versions = [
+        latest_by_key[(p.package_name, p.current_tag_prefix)] for p in rhdh_plugins
+    ]
+
+    # keep the fetched responses around for conditional requests next run
+    gh_api_client.save_etag_cache()
+
+    for plugin, latest_package_version in zip(rhdh_plugins, latest_package_versions):
         logger.info(f"Processing plugin: {plugin.plugin_name}")
 
-        package = gh_api_client.fetch_package(
-            plugin.package_name, tag_prefix_filter=plugin.current_tag_prefix
-        )
-        if not package.versions:
+        if latest_package_version is None:
             logger.warning(
                 f"no versions found for package {plugin.package_name}, skipping..."
             )
             continue
 
-        # sort by version, considering dual versions
-        latest_package_version = sorted(
-            package.versions, key=lambda v: (v.version, v.second_version or "")
-        )[-1]
         latest_version = latest_package_version.version
         latest_second_version = latest_package_version.second_version
 
@@ -140,26 +164,25 @@ def main():
         try:
             updated_yaml = rhdh_config_updater.bulk_update_rhdh_plugins(plugin_updates)
 
-            pr_body = RHDHPluginUpdaterConfig.GH_BULK_PR_BODY_BASE.format(
-                plugin_updates_count=len(plugin_updates)
-            )
-            for update in plugin_updates:
-                update_current = build_version_string(
-                    update.rhdh_plugin.current_version,
-                    update.rhdh_plugin.current_second_version,
+            pr_body_lines = [
+                RHDHPluginUpdaterConfig.GH_BULK_PR_BODY_LINE.format(
+                    plugin_name=update.rhdh_plugin.plugin_name,
+                    current_version=build_version_string(
+                        update.rhdh_plugin.current_version,
+                        update.rhdh_plugin.current_second_version,
+                    ),
+                    new_version=build_version_string(
+                        update.new_version, update.new_second_version
+                    ),
                 )
-                update_new = build_version_string(
-                    update.new_version, update.new_second_version
-                )
-                pr_body += (
-                    f"- **{update.rhdh_plugin.plugin_name}**: "
-                    f"`{update_current}` → "
-                    f"`{update_new}`\n"
+                for update in plugin_updates
+            ]
+            pr_body = (
+                RHDHPluginUpdaterConfig.GH_BULK_PR_BODY_BASE.format(
+                    plugin_updates_count=len(plugin_updates)
                 )
-
-            pr_body += (
-                "\n🤖 Generated with [RHDH Plugin GitOps Updater]"
-                "(https://github.com/thepetk/rhdh-plugin-gitops-updater)\n"
+                + "".join(pr_body_lines)
+                + RHDHPluginUpdaterConfig.GH_BULK_PR_BODY_FOOTER
             )
 
             pr_url = gh_api_client.create_pull_request(
@@ -1,5 +1,6 @@
 import logging
 import os
+import re
 
 # DYNAMIC_PLUGINS_CONFIG_YAML_FILE_PATH: is the path of the dynamic
 # plugins config yaml file
@@ -13,7 +14,9 @@ DYNAMIC_PLUGINS_CONFIG_YAML_LOCATION = os.getenv(
     "DYNAMIC_PLUGINS_CONFIG_YAML_LOCATION", "global.dynamic.plugins"
 )
 
-# GITHUB_TOKEN: is the GitHub token to use for authentication
+# GITHUB_TOKEN: is the GitHub token to use for authentication. A comma
+# separated list rotates the package reads across tokens, while PRs are
+# always created with the first one
 GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
 
 # UPDATE_PR_STRATEGY: is the strategy to use when creating
@@ -31,38 +34,48 @@ GITHUB_REPOSITORY = os.getenv("GITHUB_REPOSITORY", "")
 _base_branch = os.getenv("BASE_BRANCH", "")
 if not _base_branch:
     _github_ref = os.getenv("GITHUB_REF", "main")
-    _base_branch = (
-        _github_ref.replace("refs/heads/", "")
-        if _github_ref.startswith("refs/heads/")
-        else _github_ref
-    )
+    _base_branch = _github_ref.removeprefix("refs/heads/")
 GITHUB_REF = _base_branch
 
+# FETCH_MAX_WORKERS: is the number of packages fetched concurrently
+FETCH_MAX_WORKERS = max(1, int(os.getenv("FETCH_MAX_WORKERS") or "8"))
+
+# CACHE_DIR: is the directory where GitHub API responses and the parsed
+# plugins are cached between runs (empty disables the cache)
+CACHE_DIR = os.getenv("CACHE_DIR", "")
+
 # VERBOSE: is the verbosity level (0 = normal, 1 = verbose)
 VERBOSE = int(os.getenv("VERBOSE", 0))
 
+
+def parse_tag_prefixes(raw: "str") -> "list[str]":
+    """
+    parses a newline or comma separated list of tag prefixes, skipping
+    the empty values
+    """
+    return [prefix.strip() for prefix in re.split(r"[\n,]", raw) if prefix.strip()]
+
+
 # GH_PACKAGE_TAG_PREFIXES: newline-separated or comma-separated list
 # of tag prefixes to consider when checking for plugin updates (e.g.,
 # "next__\nprevious__" or "next__,previous__")
-_tag_prefixes_str = os.getenv("GH_PACKAGE_TAG_PREFIXES", "next__")
-
-# check if there are new lines in the string to determine the separator
-if "\n" in _tag_prefixes_str:
-    GH_PACKAGE_TAG_PREFIXES = [
-        prefix.strip() for prefix in _tag_prefixes_str.split("\n") if prefix.strip()
-    ]
-else:
-    GH_PACKAGE_TAG_PREFIXES = [
-        prefix.strip() for prefix in _tag_prefixes_str.split(",") if prefix.strip()
-    ]
+GH_PACKAGE_TAG_PREFIXES = parse_tag_prefixes(
+    os.getenv("GH_PACKAGE_TAG_PREFIXES", "next__")
+)
 
 # LOGGING_LEVEL: is the logging level based on verbosity
 LOGGING_LEVEL = "DEBUG" if VERBOSE > 0 else "INFO"
 
-# Configure logging
-logging.basicConfig(
-    level=getattr(logging, LOGGING_LEVEL),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-)
+
+def configure_logging() -> "None":
+    """
+    configures the root logger once from the entrypoint, so importing
+    the constants module has no logging side effects
+    """
+    logging.basicConfig(
+        level=getattr(logging, LOGGING_LEVEL),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    )
+
 
 logger = logging.getLogger(__name__)
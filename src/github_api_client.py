@@ -1,21 +1,46 @@
-from typing import Any
+import json
+import logging
+import os
+import threading
+import time
+from functools import cached_property, lru_cache
+from itertools import cycle
+from typing import TYPE_CHECKING, Any, Iterable, Iterator
 from urllib.parse import quote
 
 import requests
-from github import Auth, Github
-from github.ContentFile import ContentFile
-from github.Repository import Repository
 from requests import Response
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-from src.constants import GITHUB_REF, UPDATE_PR_STRATEGY, logger
+from src.constants import CACHE_DIR, GITHUB_REF, UPDATE_PR_STRATEGY, logger
 from src.exceptions import GithubPRFailedException
 from src.types import (
     GithubPullRequestStrategy,
-    RHDHPluginPackage,
     RHDHPluginPackageVersion,
     RHDHPluginUpdaterConfig,
 )
-from src.utils import match_tag_prefix, parse_dual_version
+from src.utils import parse_dual_version, tag_prefix_matcher, version_sort_key
+
+if TYPE_CHECKING:
+    from github import Github
+    from github.Repository import Repository
+
+
+@lru_cache(maxsize=512)
+def _quote_package_name(package_name: "str") -> "str":
+    """
+    URL-encodes the package name, slashes included, caching the result as
+    the same packages are fetched again for every update lookup
+    """
+    return quote(package_name, safe="")
+
+
+def _package_version_sort_key(package_version: "RHDHPluginPackageVersion") -> "Any":
+    """
+    builds the sort key of a package version, considering dual versions
+    """
+    return version_sort_key(package_version.version, package_version.second_version)
 
 
 class GithubAPIClient:
@@ -23,14 +48,64 @@ class GithubAPIClient:
     Handles all GitHub-related operations.
     """
 
-    def __init__(self, token: "str", per_page=100) -> "None":
-        self.token = token
+    def __init__(
+        self, token: "str | list[str]", per_page=100, cache_dir: "str" = CACHE_DIR
+    ) -> "None":
+        # several tokens (list or comma separated) share the read load
+        tokens = (
+            [t.strip() for t in token.split(",") if t.strip()]
+            if isinstance(token, str)
+            else list(token)
+        ) or [""]
+        self.token = tokens[0]
         self.per_page = per_page
 
-        self.client = Github(auth=Auth.Token(token))
+        # responses of previous runs, keyed by request URL, used to send
+        # conditional requests that GitHub answers with a bodiless 304
+        self._etag_cache_path = (
+            os.path.join(cache_dir, RHDHPluginUpdaterConfig.ETAG_CACHE_FILE_NAME)
+            if cache_dir
+            else ""
+        )
+        self._etag_cache: "dict[str, dict[str, Any]]" = self._load_etag_cache()
+        # keys served or stored during this run, the only ones persisted so
+        # the responses of packages no longer configured are dropped
+        self._etag_cache_used_keys: "set[str]" = set()
+
+        # latest versions fetched during this run, keyed by (org, name, prefix
+        # filter)
+        self._latest_version_cache: "dict[tuple, RHDHPluginPackageVersion | None]" = {}
+        # repositories and base branch SHAs used for the PRs of this run
+        self._repo_cache: "dict[str, Repository]" = {}
+        self._base_sha_cache: "dict[tuple[str, str], str]" = {}
+        self._base_file_cache: "dict[tuple[str, str, str], Any]" = {}
+        # update branches of each repository, listed on the first PR of the run
+        self._update_branches_cache: "dict[str, set[str] | None]" = {}
+
+        # one session per token, rotated round-robin for the API reads while
+        # skipping the ones cooling down until their rate limit resets
+        self._sessions = [self._build_session(t) for t in tokens]
+        self._session_cycle = cycle(self._sessions)
+        self._session_cooldowns: "dict[requests.Session, float]" = {}
+        self._sessions_lock = threading.Lock()
+
+    @cached_property
+    def client(self) -> "Github":
+        """
+        creates the PyGithub client used for the PR writes on first access,
+        so runs without any update never pay for importing PyGithub
+        """
+        from github import Auth, Github
+
+        # writes are cheap on the quota, so the PRs stay on the primary token
+        return Github(auth=Auth.Token(self.token))
 
-        self._session = requests.Session()
-        self._session.headers.update(
+    def _build_session(self, token: "str") -> "requests.Session":
+        """
+        builds an authenticated session for the GitHub REST API
+        """
+        session = requests.Session()
+        session.headers.update(
             {
                 "Authorization": f"token {token}",
                 "Accept": "application/vnd.github+json",
@@ -38,30 +113,228 @@ class GithubAPIClient:
             }
         )
 
-    def _fetch_next(
-        self, response: "Response", url: "str", params: "dict[str, int]"
-    ) -> "tuple[str, dict[str, int]]":
+        # size the pool to the concurrent fetches so every worker keeps
+        # reusing its keep-alive connection instead of a new TLS handshake.
+        # Blocking caps the connections at the pool size, so any caller beyond
+        # the fetch workers waits for a pooled connection rather than opening
+        # a throwaway one, and the adapter retries transient GitHub failures
+        # with backoff
+        session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_maxsize=RHDHPluginUpdaterConfig.GH_PACKAGES_FETCH_MAX_WORKERS,
+                pool_block=True,
+                max_retries=Retry(
+                    total=RHDHPluginUpdaterConfig.GH_API_MAX_RETRIES,
+                    backoff_factor=RHDHPluginUpdaterConfig.GH_API_RETRY_BACKOFF_FACTOR,
+                    status_forcelist=RHDHPluginUpdaterConfig.GH_API_RETRY_STATUS_CODES,
+                ),
+            ),
+        )
+
+        return session
+
+    def _next_session(self) -> "requests.Session":
+        """
+        picks the next session of the rotation that is not cooling down, or
+        just the next one if all of them are
+        """
+        with self._sessions_lock:
+            now = time.time()
+            for _ in range(len(self._sessions)):
+                session = next(self._session_cycle)
+                if self._session_cooldowns.get(session, 0) <= now:
+                    return session
+
+        return session
+
+    def _has_available_session(self) -> "bool":
+        """
+        checks if any session is not cooling down
+        """
+        now = time.time()
+        with self._sessions_lock:
+            return any(self._session_cooldowns.get(s, 0) <= now for s in self._sessions)
+
+    def _fetch_next(self, response: "Response") -> "str":
         """
         extracts the next URL from the response links if available
         """
-        if "next" not in response.links:
-            return "", params
+        # links re-parses the Link header on every access, so it is read once
+        next_link = response.links.get("next")
+        if next_link is None:
+            return ""
+
+        return next_link["url"]
+
+    def _load_etag_cache(self) -> "dict[str, dict[str, Any]]":
+        """
+        loads the cached responses of previous runs, if the cache is enabled
+        """
+        if not self._etag_cache_path or not os.path.exists(self._etag_cache_path):
+            return {}
+
+        try:
+            with open(self._etag_cache_path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"ignoring unreadable cache {self._etag_cache_path}: {e}")
+            return {}
+
+    def save_etag_cache(self) -> "None":
+        """
+        persists the cached responses for the next run, if the cache is enabled
+        """
+        if not self._etag_cache_path:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self._etag_cache_path), exist_ok=True)
+            with open(self._etag_cache_path, "w") as f:
+                json.dump(
+                    {k: self._etag_cache[k] for k in self._etag_cache_used_keys}, f
+                )
+        except OSError as e:
+            logger.warning(f"failed to write cache {self._etag_cache_path}: {e}")
+
+    def _cool_down(
+        self,
+        session: "requests.Session",
+        until: "float",
+        reason: "str",
+        rate_limited: "bool",
+    ) -> "None":
+        """
+        cools the session down until the given time and, unless another token
+        can take over, sleeps for it. A request that still went through only
+        waits for a reset within the cap, as a capped sleep gives no quota back
+        """
+        with self._sessions_lock:
+            self._session_cooldowns[session] = until
+
+        if self._has_available_session():
+            logger.debug(f"{reason}, rotating token")
+            return
+
+        wait = max(0.0, until - time.time())
+        if wait > RHDHPluginUpdaterConfig.GH_API_RATE_LIMIT_MAX_WAIT:
+            if not rate_limited:
+                logger.debug(f"{reason}, the reset is too far off to wait for")
+                return
+            wait = RHDHPluginUpdaterConfig.GH_API_RATE_LIMIT_MAX_WAIT
+
+        logger.warning(f"{reason}, waiting {wait:.0f}s")
+        time.sleep(wait)
+
+    def _wait_for_rate_limit(
+        self, session: "requests.Session", response: "Response"
+    ) -> "bool":
+        """
+        cools the session down when GitHub asks to retry later, when the
+        remaining quota is about to run out, or on a secondary rate limit.
+        Returns True if the response got rate limited
+        """
+        rate_limited = response.status_code in (403, 429)
+
+        # a Retry-After header takes precedence whatever the quota left, as
+        # secondary rate limits are hit with plenty of it
+        retry_after = response.headers.get("Retry-After", "")
+        if rate_limited and retry_after.isdigit():
+            self._cool_down(
+                session,
+                time.time() + int(retry_after),
+                f"GitHub API asked to retry after {retry_after}s",
+                rate_limited,
+            )
+            return True
+
+        remaining = response.headers.get("X-RateLimit-Remaining", "")
+        reset = response.headers.get("X-RateLimit-Reset", "")
+        if (
+            remaining.isdigit()
+            and reset.isdigit()
+            and int(remaining) < RHDHPluginUpdaterConfig.GH_API_RATE_LIMIT_MIN_REMAINING
+        ):
+            self._cool_down(
+                session,
+                int(reset),
+                f"GitHub API rate limit almost exhausted ({remaining} left)",
+                rate_limited,
+            )
+            return rate_limited
+
+        # a 429 without any hint still is a secondary rate limit, which GitHub
+        # asks to wait at least a minute for
+        if response.status_code == 429:
+            self._cool_down(
+                session,
+                time.time() + RHDHPluginUpdaterConfig.GH_API_SECONDARY_RATE_LIMIT_WAIT,
+                "GitHub API secondary rate limit hit",
+                rate_limited,
+            )
+            return True
+
+        return False
+
+    def _get(
+        self, url: "str", params: "dict[str, int]", headers: "dict[str, str]"
+    ) -> "Response":
+        """
+        sends a GET request with the next session of the rotation, retrying
+        once if the request got rate limited
+        """
+        session = self._next_session()
+        response = session.get(url, params=params, headers=headers)
+        if self._wait_for_rate_limit(session, response):
+            session = self._next_session()
+            response = session.get(url, params=params, headers=headers)
 
-        # params unset as the next URL already contains query params
-        params = {}
-        url = response.links["next"]["url"]
+        return response
 
-        return url, params
+    def _get_page(
+        self, url: "str", params: "dict[str, int]"
+    ) -> "tuple[list[dict[str, Any]], str]":
+        """
+        fetches a single page, answering from the cache when GitHub reports
+        it unchanged, and returns its items along with the next page URL
+
+        ::raises:: requests.HTTPError If the API request fails
+        """
+        cache_key = ""
+        if self._etag_cache_path:
+            cache_key = requests.Request("GET", url, params=params).prepare().url or url
+        cached = self._etag_cache.get(cache_key)
+        headers = {"If-None-Match": cached["etag"]} if cached else {}
+
+        response = self._get(url, params, headers=headers)
+        if cached and response.status_code == 304:
+            logger.debug("using cached response for %s", cache_key)
+            self._etag_cache_used_keys.add(cache_key)
+            return cached["items"], cached["next"]
+
+        response.raise_for_status()
+        items = response.json()
+        next_url = self._fetch_next(response)
+
+        etag = response.headers.get("ETag")
+        if cache_key and etag:
+            self._etag_cache[cache_key] = {
+                "etag": etag,
+                "items": items,
+                "next": next_url,
+            }
+            self._etag_cache_used_keys.add(cache_key)
+
+        return items, next_url
 
     def _paginate(
         self, url: "str", extra_params: "dict[str, str] | None" = None
-    ) -> "list[dict[str, Any]]":
+    ) -> "Iterator[dict[str, Any]]":
         """
-        handles pagination for GitHub API requests
+        handles pagination for GitHub API requests, lazily yielding every item
 
         ::raises:: requests.HTTPError If the API request fails
         """
-        items: "list[dict[str, Any]]" = []
         params = {
             "per_page": self.per_page,
         }
@@ -70,98 +343,109 @@ class GithubAPIClient:
             params.update(extra_params)
 
         while url:
-            logger.debug(f"fetching (GET) {url}")
-            response = self._session.get(url, params=params)
-            response.raise_for_status()
+            logger.debug("fetching (GET) %s", url)
+            resp_items, url = self._get_page(url, params)
 
-            resp_items = response.json()
-            items.extend(resp_items)
+            yield from resp_items
 
-            # handle pagination case
-            url, params = self._fetch_next(response, url, params)
-        return items
+            # params unset as the next URL already contains query params
+            params = {}
 
-    def _convert_to_rhdh_plugin_package(
+    def _iter_package_versions(
         self,
         package_name: "str",
-        raw_versions: "list[dict[str, Any]]",
+        raw_versions: "Iterable[dict[str, Any]]",
         tag_prefix_filter: "str | None" = None,
-    ) -> "RHDHPluginPackage":
+    ) -> "Iterator[RHDHPluginPackageVersion]":
         """
-        converts a list of package versions into an RHDHPluginPackage
+        yields the valid RHDHPluginPackageVersion items of the raw package versions
         """
-        versions = []
-        for v in raw_versions:
-            metadata = v.get("metadata")
-            if not isinstance(metadata, dict):
-                continue
+        # skip building the per-version debug messages unless they are emitted
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        match_tag_prefix = tag_prefix_matcher()
 
-            container = metadata.get("container")
-            if not isinstance(container, dict):
+        for v in raw_versions:
+            # the happy path dominates, so ask forgiveness for malformed versions
+            try:
+                tag = str(v["metadata"]["container"]["tags"][0])
+                created_at = v["created_at"]
+            except (KeyError, TypeError, IndexError):
                 continue
 
-            tags = container.get("tags")
-            if not isinstance(tags, list) or not tags:
+            if not isinstance(created_at, str):
                 continue
 
-            tag = str(tags[0])
             matched_prefix = match_tag_prefix(tag)
             if not matched_prefix:
                 continue
 
             if tag_prefix_filter and matched_prefix != tag_prefix_filter:
-                logger.debug(
-                    f"skipping version {tag} for package {package_name} "
-                    f"(prefix {matched_prefix} != {tag_prefix_filter})"
-                )
-                continue
-
-            created_at = v.get("created_at")
-            if not isinstance(created_at, str):
+                if debug_enabled:
+                    logger.debug(
+                        "skipping version %s for package %s (prefix %s != %s)",
+                        tag,
+                        package_name,
+                        matched_prefix,
+                        tag_prefix_filter,
+                    )
                 continue
 
             # remove prefix and parse potential dual version
-            version_string = tag.replace(matched_prefix, "")
+            version_string = tag.removeprefix(matched_prefix)
             version, second_version = parse_dual_version(version_string)
 
-            logger.debug(f"found version {tag} for package {package_name}")
-            versions.append(
-                RHDHPluginPackageVersion(
-                    name=str(v.get("name", "")),
-                    version=version,
-                    created_at=created_at,
-                    second_version=second_version,
-                )
+            if debug_enabled:
+                logger.debug("found version %s for package %s", tag, package_name)
+            yield RHDHPluginPackageVersion(
+                name=str(v.get("name", "")),
+                version=version,
+                created_at=created_at,
+                second_version=second_version,
             )
 
-        return RHDHPluginPackage(name=package_name, versions=versions)
+    def _package_versions_url(self, package_name: "str", org: "str") -> "str":
+        """
+        builds the versions API URL of the given container package. The
+        GraphQL packages API does not cover ghcr.io container packages, so
+        their versions can only be listed through this REST endpoint
+        """
+        # URL-encode the package name to handle slashes
+        encoded_package_name = _quote_package_name(package_name)
+        return RHDHPluginUpdaterConfig.GH_PACKAGES_VERSION_BASE_URL.format(
+            org=org, package_type="container", package_name=encoded_package_name
+        )
 
-    def fetch_package(
+    def fetch_latest_version(
         self,
         package_name: "str",
         org=RHDHPluginUpdaterConfig.GH_ORG_NAME,
         tag_prefix_filter: "str | None" = None,
-    ) -> "RHDHPluginPackage":
+    ) -> "RHDHPluginPackageVersion | None":
         """
-        fetch the RHDHPluginPackage for the given package name
+        fetch the latest version of the given package, tracking the maximum
+        while the pages stream in. Every page is read, as versions are listed
+        by creation date and a backport published after a newer release would
+        otherwise hide it
         """
-        # URL-encode the package name to handle slashes
-        logger.debug(f"fetching package {package_name}")
-        encoded_package_name = quote(package_name, safe="")
-        raw_versions = self._paginate(
-            url=RHDHPluginUpdaterConfig.GH_PACKAGES_VERSION_BASE_URL.format(
-                org=org, package_type="container", package_name=encoded_package_name
-            )
+        cache_key = (org, package_name, tag_prefix_filter)
+        if cache_key in self._latest_version_cache:
+            logger.debug("using cached latest version of package %s", package_name)
+            return self._latest_version_cache[cache_key]
+
+        logger.debug("fetching latest version of package %s", package_name)
+        raw_versions = self._paginate(url=self._package_versions_url(package_name, org))
+        latest_version = max(
+            self._iter_package_versions(package_name, raw_versions, tag_prefix_filter),
+            key=_package_version_sort_key,
+            default=None,
         )
 
-        # fallback to package without versions
-        if not raw_versions:
+        if latest_version is None:
             logger.warning(f"no versions found for package {package_name}")
-            return RHDHPluginPackage(name=package_name, versions=[])
 
-        return self._convert_to_rhdh_plugin_package(
-            package_name, raw_versions, tag_prefix_filter
-        )
+        self._latest_version_cache[cache_key] = latest_version
+
+        return latest_version
 
     def _branch_exists(self, repo: "Repository", branch_name: "str") -> "bool":
         """
@@ -169,24 +453,87 @@ class GithubAPIClient:
         """
         try:
             repo.get_git_ref(f"heads/{branch_name}")
-            logger.debug(f"branch {branch_name} already exists")
+            logger.debug("branch %s already exists", branch_name)
             return True
         except Exception:
-            logger.debug(f"branch {branch_name} does not exist, will create it")
+            logger.debug("branch %s does not exist, will create it", branch_name)
             return False
 
+    def _get_repo(self, repo_full_name: "str") -> "Repository":
+        """
+        fetches the given repository, reusing it across the PRs of this run
+        """
+        if repo_full_name not in self._repo_cache:
+            self._repo_cache[repo_full_name] = self.client.get_repo(repo_full_name)
+
+        return self._repo_cache[repo_full_name]
+
+    def _get_base_sha(self, repo_full_name: "str", base_branch: "str") -> "str":
+        """
+        fetches the head SHA of the base branch, which stays the same for all
+        the PRs of this run
+        """
+        cache_key = (repo_full_name, base_branch)
+        if cache_key not in self._base_sha_cache:
+            repo = self._get_repo(repo_full_name)
+            base_ref = repo.get_git_ref(f"heads/{base_branch}")
+            self._base_sha_cache[cache_key] = base_ref.object.sha
+
+        return self._base_sha_cache[cache_key]
+
+    def _get_base_file(
+        self, repo_full_name: "str", file_path: "str", base_branch: "str"
+    ) -> "Any":
+        """
+        fetches the file contents at the base branch head, shared by all the
+        newly created branches of this run as they start from it
+        """
+        cache_key = (repo_full_name, file_path, base_branch)
+        if cache_key not in self._base_file_cache:
+            repo = self._get_repo(repo_full_name)
+            self._base_file_cache[cache_key] = repo.get_contents(
+                file_path, ref=self._get_base_sha(repo_full_name, base_branch)
+            )
+
+        return self._base_file_cache[cache_key]
+
+    def list_update_branches(self, repo_full_name: "str") -> "set[str] | None":
+        """
+        lists the existing update branches of the given repository in one
+        paginated call on first use, or None if they cannot be listed. The
+        listing is reused and kept up to date by the PRs of this run
+        """
+        if repo_full_name in self._update_branches_cache:
+            return self._update_branches_cache[repo_full_name]
+
+        prefix = RHDHPluginUpdaterConfig.GH_PR_BRANCH_NAME_PREFIX
+        branches: "set[str] | None"
+        try:
+            repo = self._get_repo(repo_full_name)
+            refs = repo.get_git_matching_refs(f"heads/{prefix}")
+            branches = {ref.ref.removeprefix("refs/heads/") for ref in refs}
+            logger.debug("found %s existing update branches", len(branches))
+        except Exception as e:
+            logger.warning(f"failed to list branches of {repo_full_name}: {e}")
+            branches = None
+
+        self._update_branches_cache[repo_full_name] = branches
+        return branches
+
     def _handle_new_endline(self, original_content: "str", new_content: "str") -> "str":
         """
         handles the new_endline formating issue
         """
         original_ends_with_newline = original_content.endswith("\n")
 
-        if original_ends_with_newline and not new_content.endswith("\n"):
-            new_content += "\n"
-        elif not original_ends_with_newline and new_content.endswith("\n"):
-            new_content = new_content.rstrip("\n")
+        # the content is returned as is, without a copy, when both agree
+        if new_content.endswith("\n") == original_ends_with_newline:
+            return new_content
+
+        if original_ends_with_newline:
+            return new_content + "\n"
 
-        return new_content
+        return new_content.rstrip("\n")
 
     def create_pull_request(
         self,
@@ -199,46 +546,70 @@ class GithubAPIClient:
         base_branch=GITHUB_REF,
     ) -> str:
         """
-        creates a pull request with file changes.
+        creates a pull request with file changes. The update branches are
+        listed once on the first PR instead of being looked up one by one.
 
         ::raises:: GithubPRFailedException: If PR creation fails
         """
-        logger.debug(f"creating PR in {repo_full_name} on branch {branch_name}")
-        repo = self.client.get_repo(repo_full_name)
-        base_ref = repo.get_git_ref(f"heads/{base_branch}")
-        base_sha = base_ref.object.sha
+        logger.debug("creating PR in %s on branch %s", repo_full_name, branch_name)
+        repo = self._get_repo(repo_full_name)
+        base_sha = self._get_base_sha(repo_full_name, base_branch)
+        existing_branches = self.list_update_branches(repo_full_name)
+
+        if existing_branches is not None:
+            branch_exists = branch_name in existing_branches
+        else:
+            branch_exists = self._branch_exists(repo, branch_name)
 
-        if self._branch_exists(repo, branch_name):
+        if branch_exists:
             # skip for separate pr strategy
             if UPDATE_PR_STRATEGY == GithubPullRequestStrategy.SEPARATE:
-                logger.debug(f"checking for existing open PR for branch {branch_name}")
+                logger.debug("checking for existing open PR for branch %s", branch_name)
                 raise GithubPRFailedException(f"Branch {branch_name} already exists")
 
-            # if branch exists, check if there's an open PR for it
+            # if branch exists, check if there's an open PR for it. The list is
+            # lazy, so only its first page is requested and failures surface
+            # while iterating it
             try:
-                pulls = repo.get_pulls(
-                    state="open",
-                    head=f"{repo.owner.login}:{branch_name}",
-                    base=base_branch,
+                open_pr = next(
+                    iter(
+                        repo.get_pulls(
+                            state="open",
+                            head=f"{repo.owner.login}:{branch_name}",
+                            base=base_branch,
+                        )
+                    ),
+                    None,
                 )
             except Exception as e:
-                logger.debug(f"no open PR found for branch {branch_name}: {e}")
+                logger.debug("no open PR found for branch %s: %s", branch_name, e)
+                open_pr = None
 
-            for pr in pulls:
+            if open_pr is not None:
                 raise GithubPRFailedException(
-                    f"Open PR already exists for branch {branch_name}: {pr.html_url}"
+                    f"Open PR already exists for branch {branch_name}: "
+                    f"{open_pr.html_url}"
                 )
         else:
             try:
                 repo.create_git_ref(f"refs/heads/{branch_name}", base_sha)
-                logger.debug(f"created branch {branch_name}")
+                logger.debug("created branch %s", branch_name)
+                if existing_branches is not None:
+                    existing_branches.add(branch_name)
             except Exception as e:
                 raise GithubPRFailedException(
                     f"Failed to create branch {branch_name}: {e}"
                 ) from e
 
         try:
-            contents = repo.get_contents(file_path, ref=branch_name)
+            # a new branch still matches the base, so reuse its file contents
+            contents = (
+                repo.get_contents(file_path, ref=branch_name)
+                if branch_exists
+                else self._get_base_file(repo_full_name, file_path, base_branch)
+            )
+
+            from github.ContentFile import ContentFile
 
             # ensure we have a single ContentFile
             if not isinstance(contents, ContentFile):
@@ -247,7 +618,10 @@ class GithubAPIClient:
                     "but got a directory or invalid response"
                 )
 
-            logger.debug(f"updating file {file_path} in branch {branch_name}")
+            # update_file creates the blob, tree and commit and moves the
+            # branch ref in a single request, so it takes fewer round trips
+            # than doing the same steps through the Git Data API
+            logger.debug("updating file %s in branch %s", file_path, branch_name)
             repo.update_file(
                 path=file_path,
                 message=f"Update {file_path}",
@@ -264,7 +638,7 @@ class GithubAPIClient:
             ) from update_error
 
         try:
-            logger.debug(f"opening pull request {pr_title}")
+            logger.debug("opening pull request %s", pr_title)
             pr = repo.create_pull(
                 title=pr_title, body=pr_body, head=branch_name, base=base_branch
             )
@@ -276,7 +650,9 @@ class GithubAPIClient:
                 )
                 ref = repo.get_git_ref(f"heads/{branch_name}")
                 ref.delete()
-                logger.debug(f"deleted branch {branch_name} after PR creation failure")
+                logger.debug("deleted branch %s after PR creation failure", branch_name)
+                if existing_branches is not None:
+                    existing_branches.discard(branch_name)
             except Exception as cleanup_error:
                 logger.error(f"failed to cleanup branch {branch_name}: {cleanup_error}")
 
@@ -1,16 +1,83 @@
-from urllib.parse import urlparse
+import hashlib
+import json
+import os
+import re
+from typing import Any, Iterable
 
 import yaml
-from packaging.version import Version
 
 from src.constants import (
+    CACHE_DIR,
     DYNAMIC_PLUGINS_CONFIG_YAML_FILE_PATH,
     DYNAMIC_PLUGINS_CONFIG_YAML_LOCATION,
     logger,
 )
 from src.exceptions import InvalidRHDHPluginPackageDefinitionException
-from src.types import RHDHPlugin, RHDHPluginUpdaterConfig
-from src.utils import get_plugins_list_from_dict, match_tag_prefix, parse_dual_version
+from src.types import (
+    RHDHPlugin,
+    RHDHPluginPackageDefinition,
+    RHDHPluginUpdaterConfig,
+)
+from src.utils import (
+    get_plugins_list_from_dict,
+    match_tag_prefix,
+    parse_dual_version,
+    parse_version,
+)
+
+# prefer the libyaml backed loader and fall back to the pure python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+
+    _warn_missing_libyaml = False
+except ImportError:
+    from yaml import SafeLoader
+
+    # warned on the first parse, once the logging is configured
+    _warn_missing_libyaml = True
+
+# _PACKAGE_PATTERN: matches oci://<registry>/[<org>/[<repo>/]]<name>[:<tag>][!<plugin>]
+_PACKAGE_PATTERN = re.compile(
+    r"^oci://[^/!]+/(?:[^/!]+/){0,2}(?P<name>[^/!]+?)"
+    r"(?::(?P<tag>[^/:!]*))?(?:!(?P<plugin>.*))?$"
+)
+
+
+def _plugin_to_cache(plugin: "RHDHPlugin") -> "dict[str, Any]":
+    """
+    converts the plugin into the JSON primitives stored in the cache
+    """
+    return {
+        "package_name": plugin.package_name,
+        "current_version": str(plugin.current_version),
+        "plugin_name": plugin.plugin_name,
+        "disabled": plugin.disabled,
+        "current_second_version": (
+            str(plugin.current_second_version)
+            if plugin.current_second_version is not None
+            else None
+        ),
+        "current_tag_prefix": plugin.current_tag_prefix,
+    }
+
+
+def _plugin_from_cache(entry: "dict[str, Any]") -> "RHDHPlugin":
+    """
+    rebuilds the plugin from its cached JSON primitives
+
+    ::raises:: KeyError, TypeError or ValueError if the entry is malformed
+    """
+    second_version = entry["current_second_version"]
+    return RHDHPlugin(
+        package_name=str(entry["package_name"]),
+        current_version=parse_version(entry["current_version"]),
+        plugin_name=str(entry["plugin_name"]),
+        disabled=bool(entry["disabled"]),
+        current_second_version=(
+            parse_version(second_version) if second_version is not None else None
+        ),
+        current_tag_prefix=entry["current_tag_prefix"],
+    )
 
 
 class RHDHPluginsConfigLoader:
@@ -22,10 +89,18 @@ class RHDHPluginsConfigLoader:
         self,
         config_path=DYNAMIC_PLUGINS_CONFIG_YAML_FILE_PATH,
         config_location=DYNAMIC_PLUGINS_CONFIG_YAML_LOCATION,
+        cache_dir=CACHE_DIR,
     ) -> "None":
         self.config_path = config_path
         self.config_location = config_location
 
+        # plugins converted in a previous run, reused while the config is unchanged
+        self._cache_path = (
+            os.path.join(cache_dir, RHDHPluginUpdaterConfig.PLUGINS_CACHE_FILE_NAME)
+            if cache_dir
+            else ""
+        )
+
     def _fetch_plugins_by_location(
         self, data: "dict[str, str | int | bool]"
     ) -> "list[dict[str, str | int | bool]]":
@@ -37,9 +112,36 @@ class RHDHPluginsConfigLoader:
 
         return plugins_list if isinstance(plugins_list, list) else []
 
-    def _parse_package_string(
-        self, package: "str"
-    ) -> "dict[str, str | Version | None]":
+    def _load_plugins_subtree(self, content: "str | bytes") -> "Any":
+        """
+        composes the YAML node graph and constructs python objects only for
+        the subtree under the config location, returning None if not found
+        """
+        loader = SafeLoader(content)
+        try:
+            node = loader.get_single_node()
+            for key in self.config_location.split("."):
+                if not isinstance(node, yaml.MappingNode):
+                    return None
+
+                # the last duplicate key wins, as it does for yaml.load
+                node = next(
+                    (
+                        value_node
+                        for key_node, value_node in reversed(node.value)
+                        if isinstance(key_node, yaml.ScalarNode)
+                        and key_node.value == key
+                    ),
+                    None,
+                )
+                if node is None:
+                    return None
+
+            return loader.construct_document(node)
+        finally:
+            loader.dispose()
+
+    def _parse_package_string(self, package: "str") -> "RHDHPluginPackageDefinition":
         """
         parses the OCI package string to extract plugin info.
 
@@ -48,41 +150,20 @@ class RHDHPluginsConfigLoader:
 
         ::raises:: ImageTagNotFoundException if the image tag is not found
         """
-        if not package.startswith("oci://"):
+        matched = _PACKAGE_PATTERN.match(package)
+        if not matched:
             raise InvalidRHDHPluginPackageDefinitionException(
                 f"Invalid RHDH plugin package definition: {package}"
             )
 
-        # remove the oci:// prefix
-        package = package.replace("oci://", "", 1)
-
-        # split image ref and plugin name (! suffix is optional)
-        if "!" in package:
-            image_ref, plugin_name = package.split("!", 1)
-        else:
-            image_ref = package
-            plugin_name = None
-
-        # parse the image ref
-        parsed_url = urlparse(f"//{image_ref}")
-        image_ref_parts = parsed_url.path.lstrip("/").split("/")
-
-        # should have less than 4 parts (registry, org, repo, name:version)
-        if not len(image_ref_parts) < 4:
-            raise InvalidRHDHPluginPackageDefinitionException(
-                f"Too few image ref parts ({len(image_ref_parts)}) "
-                f"for package: {package}"
-            )
-
-        # get name and version
-        name_and_version = image_ref_parts[-1]
-
-        if ":" not in name_and_version:
+        name, raw_version = matched["name"], matched["tag"]
+        if raw_version is None:
             raise InvalidRHDHPluginPackageDefinitionException(
                 f"Tag not found for package {package}"
             )
 
-        name, raw_version = name_and_version.rsplit(":", 1)
+        # the plugin name (! suffix) is optional
+        plugin_name = matched["plugin"]
 
         matched_prefix = match_tag_prefix(raw_version)
         if not matched_prefix:
@@ -91,7 +172,7 @@ class RHDHPluginsConfigLoader:
             )
 
         # remove prefix and parse potential dual version
-        version_string = raw_version.replace(matched_prefix, "")
+        version_string = raw_version.removeprefix(matched_prefix)
         version, second_version = parse_dual_version(version_string)
 
         package_name = f"rhdh-plugin-export-overlays/{name}"
@@ -100,32 +181,32 @@ class RHDHPluginsConfigLoader:
         if plugin_name is None:
             plugin_name = name
 
-        return {
-            "package_name": package_name,
-            "version": version,
-            "second_version": second_version,
-            "plugin_name": plugin_name,
-            "tag_prefix": matched_prefix,
-        }
+        return RHDHPluginPackageDefinition(
+            package_name=package_name,
+            version=version,
+            plugin_name=plugin_name,
+            tag_prefix=matched_prefix,
+            second_version=second_version,
+        )
 
     def _convert_rhdhplugin_list(
-        self, plugins_list: "list[dict[str, str | int | bool]]"
+        self, plugins_list: "Iterable[dict[str, str | int | bool]]"
     ) -> "list[RHDHPlugin]":
         """
-        converts a list of plugin dicts into a list of RHDHPlugin objects
+        converts the plugin dicts into a list of RHDHPlugin objects in a
+        single pass, filtering out the entries that need no parsing first
         """
         rhdh_plugins = []
         for plugin_entry in plugins_list:
             package = str(plugin_entry.get("package", ""))
-            disabled = bool(plugin_entry.get("disabled", False))
 
-            # continue if is not an RHDH plugin or is disabled
-            if not package.startswith(RHDHPluginUpdaterConfig.GH_CR_REGISTRY_PREFIX):
-                logger.info(f"skipping plugin {package} as it's not RHDH Plugin")
+            # continue if is disabled or is not an RHDH plugin
+            if plugin_entry.get("disabled", False):
+                logger.info(f"skipping plugin {package} as it's disabled")
                 continue
 
-            if disabled is True:
-                logger.info(f"skipping plugin {package} as it's disabled")
+            if not package.startswith(RHDHPluginUpdaterConfig.GH_CR_REGISTRY_PREFIX):
+                logger.info(f"skipping plugin {package} as it's not RHDH Plugin")
                 continue
 
             try:
@@ -134,30 +215,103 @@ class RHDHPluginsConfigLoader:
                 logger.warning(f"failed to parse package:: {e}")
                 continue
 
-            if len(parsed.keys()) == 0:
-                continue
-
             rhdh_plugins.append(
                 RHDHPlugin(
-                    package_name=str(parsed["package_name"]),
-                    current_version=parsed["version"],  # type: ignore
-                    plugin_name=str(parsed["plugin_name"]),
-                    disabled=disabled,
-                    current_second_version=parsed.get("second_version"),  # type: ignore
-                    current_tag_prefix=str(parsed.get("tag_prefix", "")),
+                    package_name=parsed.package_name,
+                    current_version=parsed.version,
+                    plugin_name=parsed.plugin_name,
+                    disabled=False,
+                    current_second_version=parsed.second_version,
+                    current_tag_prefix=parsed.tag_prefix,
                 )
             )
         return rhdh_plugins
 
+    def _cache_digest(self, content: "bytes") -> "str":
+        """
+        hashes everything the converted plugins depend on, including the
+        cache format version so plugins cached by another release are not reused
+        """
+        digest = hashlib.blake2b(content)
+        digest.update(str(RHDHPluginUpdaterConfig.PLUGINS_CACHE_VERSION).encode())
+        digest.update(self.config_location.encode())
+        digest.update("\n".join(RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX).encode())
+        return digest.hexdigest()
+
+    def _load_cached_plugins(self, digest: "str") -> "list[RHDHPlugin] | None":
+        """
+        loads the plugins cached for the given digest, if the cache is enabled
+        """
+        if not self._cache_path or not os.path.exists(self._cache_path):
+            return None
+
+        try:
+            with open(self._cache_path, "r") as f:
+                cached = json.load(f)
+
+            if cached["digest"] != digest:
+                return None
+
+            return [_plugin_from_cache(entry) for entry in cached["plugins"]]
+        except (OSError, KeyError, TypeError, ValueError) as e:
+            logger.warning(f"ignoring unreadable cache {self._cache_path}: {e}")
+            return None
+
+    def _save_cached_plugins(
+        self, digest: "str", rhdh_plugins: "list[RHDHPlugin]"
+    ) -> "None":
+        """
+        caches the converted plugins for the given digest, if the cache is enabled
+        """
+        if not self._cache_path:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self._cache_path), exist_ok=True)
+            with open(self._cache_path, "w") as f:
+                json.dump(
+                    {
+                        "digest": digest,
+                        "plugins": [_plugin_to_cache(p) for p in rhdh_plugins],
+                    },
+                    f,
+                )
+        except OSError as e:
+            logger.warning(f"failed to write cache {self._cache_path}: {e}")
+
     def load_rhdh_plugins(self) -> "list[RHDHPlugin]":
         """
         parses the config file and extracts RHDH plugins list.
         """
         logger.debug("loading RHDH plugins from config...")
-        with open(self.config_path, "r") as f:
-            data = yaml.safe_load(f)
+        # read raw bytes and let the YAML reader handle the decoding
+        with open(self.config_path, "rb") as f:
+            content = f.read()
+
+        digest = self._cache_digest(content)
+        cached_plugins = self._load_cached_plugins(digest)
+        if cached_plugins is not None:
+            logger.debug("using cached RHDH plugins, config is unchanged")
+            return cached_plugins
 
-        plugins_list = self._fetch_plugins_by_location(data)
+        global _warn_missing_libyaml
+        if _warn_missing_libyaml:
+            _warn_missing_libyaml = False
+            logger.warning(
+                "libyaml is not available, "
+                "falling back to the slower pure python YAML loader"
+            )
+
+        # only build the configured plugins list, unrelated sections of large
+        # configs are composed but never turned into python objects
+        plugins_subtree = self._load_plugins_subtree(content)
+        if plugins_subtree is not None:
+            plugins_list = plugins_subtree if isinstance(plugins_subtree, list) else []
+        else:
+            # fallback to the full document (e.g. merge keys along the path)
+            data = yaml.load(content, Loader=SafeLoader)
+            plugins_list = self._fetch_plugins_by_location(data)
         rhdh_plugins = self._convert_rhdhplugin_list(plugins_list)
+        self._save_cached_plugins(digest, rhdh_plugins)
 
         return rhdh_plugins
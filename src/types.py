@@ -2,7 +2,7 @@ from dataclasses import dataclass
 
 from packaging.version import Version
 
-from src.constants import GH_PACKAGE_TAG_PREFIXES
+from src.constants import FETCH_MAX_WORKERS, GH_PACKAGE_TAG_PREFIXES
 
 
 class GithubPullRequestStrategy:
@@ -10,7 +10,7 @@ class GithubPullRequestStrategy:
     JOINT = "joint"
 
 
-@dataclass
+@dataclass(slots=True)
 class RHDHPluginPackageVersion:
     name: "str"
     version: "Version"
@@ -18,17 +18,20 @@ class RHDHPluginPackageVersion:
     second_version: "Version | None" = None
 
 
-@dataclass
-class RHDHPluginPackage:
+@dataclass(slots=True)
+class RHDHPluginPackageDefinition:
     """
-    Represents the RHDH plugin github package with its versions.
+    Represents the parsed OCI package string of a dynamic plugin.
     """
 
-    name: "str"
-    versions: "list[RHDHPluginPackageVersion]"
+    package_name: "str"
+    version: "Version"
+    plugin_name: "str"
+    tag_prefix: "str"
+    second_version: "Version | None" = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RHDHPlugin:
     """
     Represents an RHDH plugin from the dynamic plugins configuration.
@@ -42,7 +45,7 @@ class RHDHPlugin:
     current_tag_prefix: "str | None" = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RHDHPluginUpdate:
     """
     Represents an update for an RHDH plugin.
@@ -59,6 +62,16 @@ class RHDHPluginUpdaterConfig:
     GH_PACKAGE_TAG_PREFIX = GH_PACKAGE_TAG_PREFIXES
     GH_PACKAGES_BASE_URL = "https://api.github.com/orgs/{org}/packages"
     GH_PACKAGES_VERSION_BASE_URL = "https://api.github.com/orgs/{org}/packages/{package_type}/{package_name}/versions"
+    GH_PACKAGES_FETCH_MAX_WORKERS = FETCH_MAX_WORKERS
+    GH_API_MAX_RETRIES = 3
+    GH_API_RETRY_BACKOFF_FACTOR = 0.3
+    GH_API_RETRY_STATUS_CODES = (502, 503, 504)
+    GH_API_RATE_LIMIT_MIN_REMAINING = 10
+    GH_API_RATE_LIMIT_MAX_WAIT = 300
+    GH_API_SECONDARY_RATE_LIMIT_WAIT = 60
+    ETAG_CACHE_FILE_NAME = "etags.json"
+    PLUGINS_CACHE_FILE_NAME = "plugins.json"
+    PLUGINS_CACHE_VERSION = 1
     GH_RUNNER_PREFIX = "/github/workspace/"
     GH_CR_REGISTRY_PREFIX = (
         "oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/"
@@ -79,6 +92,7 @@ This PR updates the RHDH plugin to the latest version.
 🤖 Generated with [RHDH Plugin GitOps Updater](https://github.com/thepetk/rhdh-plugin-gitops-updater)
 """
     GH_BULK_PR_BRANCH_NAME_BASE = "update-rhdh-plugins-batch"
+    GH_PR_BRANCH_NAME_PREFIX = "update-"
     GH_BULK_PR_TITLE_BASE = (
         "chore(`rhdh-plugin-gitops-updater`) Update {plugin_updates_count} RHDH plugins"
     )
@@ -86,4 +100,10 @@ This PR updates the RHDH plugin to the latest version.
 
 This PR updates {plugin_updates_count} RHDH plugins to their latest versions:
 
+"""
+    GH_BULK_PR_BODY_LINE = (
+        "- **{plugin_name}**: `{current_version}` → `{new_version}`\n"
+    )
+    GH_BULK_PR_BODY_FOOTER = """
+🤖 Generated with [RHDH Plugin GitOps Updater](https://github.com/thepetk/rhdh-plugin-gitops-updater)
 """
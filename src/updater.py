@@ -1,4 +1,6 @@
+import os
 import re
+from functools import lru_cache
 
 from packaging.version import Version
 
@@ -10,6 +12,40 @@ from src.constants import (
 from src.types import RHDHPlugin, RHDHPluginUpdate, RHDHPluginUpdaterConfig
 from src.utils import build_version_string
 
+# matches any package line, splitting the image ref from its tag. The tag ends
+# at whitespace, quotes, an integrity suffix or a flow collection delimiter
+PACKAGE_LINE_PATTERN = re.compile(
+    r"(package:\s+(?:oci://)?(?P<ref>[^\s!]*):)(?P<tag>[^\s:!\"',\]}]*)",
+    re.MULTILINE,
+)
+
+
+@lru_cache(maxsize=16)
+def _prefix_alternation(prefixes: "tuple[str, ...]") -> "str":
+    """
+    builds the escaped alternation of the tag prefixes, shared by the
+    patterns of all plugins
+    """
+    return "|".join(re.escape(prefix) for prefix in prefixes)
+
+
+@lru_cache(maxsize=512)
+def _plugin_prefixes_pattern(
+    plugin_name: "str", version_string: "str", prefixes: "tuple[str, ...]"
+) -> "re.Pattern[str]":
+    """
+    compiles the pattern matching the package line of the given plugin and
+    version under any of the given tag prefixes, capturing the prefix used.
+    The version must end the tag, so 0.1.2 does not match a 0.1.25 tag,
+    while a flow collection delimiter may follow it
+    """
+    return re.compile(
+        rf"(package:\s+(?:oci://)?[^\s]*{re.escape(plugin_name)}:)"
+        rf"(?P<prefix>{_prefix_alternation(prefixes)})"
+        rf"{re.escape(version_string)}(?![^\s:!\"',\]}}])((?:![^\s]*)?)",
+        re.MULTILINE,
+    )
+
 
 class RHDHPluginConfigUpdater:
     """
@@ -24,6 +60,27 @@ class RHDHPluginConfigUpdater:
         self.config_path = config_path
         self.config_location = config_location
 
+        # original config content, read once as every update starts from it,
+        # and the (modification time, size) of the file it was read at
+        self._content: "str | None" = None
+        self._content_stat: "tuple[int, int] | None" = None
+
+    def _read_config(self) -> "str":
+        """
+        reads the config file content, caching it for subsequent updates
+        until the file is modified
+        """
+        # the size catches rewrites within the mtime granularity of the
+        # filesystem, which would otherwise serve stale content
+        stat = os.stat(self.config_path)
+        content_stat = (stat.st_mtime_ns, stat.st_size)
+        if self._content is None or self._content_stat != content_stat:
+            with open(self.config_path, "r") as f:
+                self._content = f.read()
+            self._content_stat = content_stat
+
+        return self._content
+
     def _build_version_string(
         self, version: "Version", second_version: "Version | None" = None
     ) -> "str":
@@ -32,26 +89,6 @@ class RHDHPluginConfigUpdater:
         """
         return build_version_string(version, second_version)
 
-    def _find_current_tag_prefix(self, content: "str", plugin: "RHDHPlugin") -> "str":
-        """
-        finds which tag prefix is currently being used for the plugin
-        by searching the content for the plugin with any of the configured prefixes
-        """
-        version_string = self._build_version_string(
-            plugin.current_version, plugin.current_second_version
-        )
-
-        for prefix in RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX:
-            test_tag = f"{prefix}{version_string}"
-            pattern = re.compile(
-                rf"package:\s+(?:oci://)?[^\s]*{re.escape(plugin.plugin_name)}:{re.escape(test_tag)}(?:![^\s]*)?",
-                re.MULTILINE,
-            )
-            if pattern.search(content):
-                return prefix
-
-        return RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX[0]
-
     def _update_plugin_version_in_content(
         self,
         content: "str",
@@ -69,25 +106,35 @@ class RHDHPluginConfigUpdater:
             f"to version {new_version_string}"
         )
 
-        # Find which tag prefix is currently used for this plugin
-        current_prefix = self._find_current_tag_prefix(content, plugin)
-
         old_version_string = self._build_version_string(
             plugin.current_version, plugin.current_second_version
         )
-        old_tag = f"{current_prefix}{old_version_string}"
-        new_tag = f"{current_prefix}{new_version_string}"
 
-        # Pattern to find the specific plugin's package line with the old version
-        pattern = re.compile(
-            rf"(package:\s+(?:oci://)?[^\s]*{re.escape(plugin.plugin_name)}:){re.escape(old_tag)}((?:![^\s]*)?)",
-            re.MULTILINE,
+        # replace the version under the tag prefix the plugin was loaded with,
+        # so its lines on other prefixes are left alone. If the prefix is
+        # unknown, every configured one is tried in the same pass, keeping the
+        # prefix each matching line already uses. A plain str.replace could
+        # not tell the plugin from one whose name extends it
+        prefixes = (
+            (plugin.current_tag_prefix,)
+            if plugin.current_tag_prefix is not None
+            else tuple(RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX)
         )
+        if plugin.plugin_name in content and old_version_string in content:
+            pattern = _plugin_prefixes_pattern(
+                plugin.plugin_name, old_version_string, prefixes
+            )
+            updated_content, replaced = pattern.subn(
+                lambda m: (
+                    m.group(1) + m.group("prefix") + new_version_string + m.group(3)
+                ),
+                content,
+            )
+        else:
+            # substring searches rule out a match without compiling the pattern
+            updated_content, replaced = content, 0
 
-        # Replace the old tag with the new tag
-        updated_content = pattern.sub(rf"\g<1>{new_tag}\g<2>", content)
-
-        if updated_content != content:
+        if replaced:
             logger.debug(
                 f"updated config for {plugin.plugin_name} from "
                 f"{old_version_string} to {new_version_string}"
@@ -105,12 +152,14 @@ class RHDHPluginConfigUpdater:
         rhdh_plugin: "RHDHPlugin",
         new_version: "Version",
         new_second_version: "Version | None" = None,
+        content: "str | None" = None,
     ) -> "str":
         """
-        updates a single plugin and return the updated YAML content.
+        updates a single plugin and return the updated YAML content. The
+        given content, if any, is updated instead of the config file.
         """
-        with open(self.config_path, "r") as f:
-            content = f.read()
+        if content is None:
+            content = self._read_config()
 
         updated_content = self._update_plugin_version_in_content(
             content, rhdh_plugin, new_version, new_second_version
@@ -125,15 +174,86 @@ class RHDHPluginConfigUpdater:
         """
         updates multiple plugins and returns the updated YAML content.
         """
-        with open(self.config_path, "r") as f:
-            content = f.read()
+        content = self._read_config()
 
+        return self._bulk_update_plugin_versions_in_content(content, updates)
+
+    def _bulk_update_plugin_versions_in_content(
+        self, content: "str", updates: "list[RHDHPluginUpdate]"
+    ) -> "str":
+        """
+        updates multiple plugin versions in the YAML content in a single pass,
+        mapping each (plugin name, old tag) pair to its new version.
+        """
+        # full old tag -> list of (plugin name, prefix, new version), longest
+        # names first so a plugin whose name is a suffix of another one does
+        # not shadow it. A plugin only claims its old tag under the prefix it
+        # was loaded with, or under every configured prefix if that is unknown,
+        # so the same plugin on several prefixes keeps each line's own update.
+        # The content is then dispatched with one dict lookup per package line
+        prefixes = tuple(RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX)
+        tag_lookup: "dict[str, list[tuple[str, str, str]]]" = {}
+        pending: "list[tuple[str, str, str, tuple[str, ...]]]" = []
         for update in updates:
-            content = self._update_plugin_version_in_content(
-                content,
-                update.rhdh_plugin,
-                update.new_version,
-                update.new_second_version,
+            plugin = update.rhdh_plugin
+            old_version = self._build_version_string(
+                plugin.current_version, plugin.current_second_version
+            )
+            new_version = self._build_version_string(
+                update.new_version, update.new_second_version
             )
+            # an update to the same tag leaves the content as is
+            if new_version == old_version:
+                continue
 
-        return content
+            plugin_prefixes = (
+                (plugin.current_tag_prefix,)
+                if plugin.current_tag_prefix is not None
+                else prefixes
+            )
+            for prefix in plugin_prefixes:
+                tag_lookup.setdefault(prefix + old_version, []).append(
+                    (plugin.plugin_name, prefix, new_version)
+                )
+            pending.append(
+                (plugin.plugin_name, old_version, new_version, plugin_prefixes)
+            )
+
+        # nothing to substitute, so the content is not scanned at all
+        if not tag_lookup:
+            return content
+
+        for candidates in tag_lookup.values():
+            candidates.sort(key=lambda c: len(c[0]), reverse=True)
+
+        # (plugin name, full old tag) of every replaced package line
+        updated: "set[tuple[str, str]]" = set()
+
+        def _replace(match: "re.Match[str]") -> "str":
+            tag = match.group("tag")
+            candidates = tag_lookup.get(tag)
+            if candidates is None:
+                return match.group(0)
+
+            ref = match.group("ref")
+            for plugin_name, prefix, new_version in candidates:
+                if ref.endswith(plugin_name):
+                    updated.add((plugin_name, tag))
+                    return match.group(1) + prefix + new_version
+            return match.group(0)
+
+        updated_content = PACKAGE_LINE_PATTERN.sub(_replace, content)
+
+        for plugin_name, old_version, new_version, plugin_prefixes in pending:
+            if any((plugin_name, p + old_version) in updated for p in plugin_prefixes):
+                logger.debug(
+                    f"updated config for {plugin_name} from {old_version} "
+                    f"to {new_version}"
+                )
+            else:
+                logger.warning(
+                    f"no match found for plugin {plugin_name} with version "
+                    f"{old_version}"
+                )
+
+        return updated_content
@@ -1,11 +1,16 @@
+import re
 import sys
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable
 
 from packaging.version import Version
 
 from src.constants import logger
 from src.types import RHDHPluginUpdaterConfig
 
+# _MISSING: is the sentinel of a config location key that is not found
+_MISSING = object()
+
 
 def get_plugins_list_from_dict(
     keys: "list[str]", data: "dict[str, Any]"
@@ -13,28 +18,42 @@ def get_plugins_list_from_dict(
     """
     navigates through a nested dictionary using a list of keys.
     """
-    current: "dict[str, Any]" = data
+    current: "Any" = data
     for key in keys:
-        if not isinstance(current, dict) or key not in current:
+        # one lookup per hop, non mappings have no get and are invalid too
+        try:
+            current = current.get(key, _MISSING)
+        except AttributeError:
+            current = _MISSING
+
+        if current is _MISSING:
             logger.error("invalid config location, cannot find plugins list")
             sys.exit(1)
 
-        current = current[key]
-
     return [] if not isinstance(current, list) else current
 
 
+@lru_cache(maxsize=4096)
+def parse_version(version_string: "str") -> "Version":
+    """
+    parses a version string, caching the result since the same tags are seen
+    across packages and Version objects are immutable
+    """
+    return Version(version_string)
+
+
+@lru_cache(maxsize=4096)
 def parse_dual_version(version_string: "str") -> "tuple[Version, Version | None]":
     """
-    parses a version string that may contain dual versions separated by '__'.
+    parses a version string that may contain dual versions separated by '__',
+    caching the result as tags recur across the packages of a run.
     """
-    if "__" in version_string:
-        parts = version_string.split("__", 1)
-        if len(parts) == 2 and parts[1]:
-            return (Version(parts[0]), Version(parts[1]))
+    primary, separator, secondary = version_string.partition("__")
+    if separator and secondary:
+        return (parse_version(primary), parse_version(secondary))
 
     # single version or invalid dual version
-    return (Version(version_string.split("__")[0]), None)
+    return (parse_version(primary), None)
 
 
 def compare_versions(
@@ -44,31 +63,47 @@ def compare_versions(
     secondary2: "Version | None" = None,
 ) -> "int":
     """
-    compares two versions with optional secondary versions
+    compares two versions with optional secondary versions, where a missing
+    secondary version sorts below any present one
     """
-    # compare primary versions
-    if version1 < version2:
-        return -1
-    if version1 > version2:
-        return 1
+    # the sort keys settle the comparison in one native tuple comparison
+    key1 = version_sort_key(version1, secondary1)
+    key2 = version_sort_key(version2, secondary2)
+
+    return (key1 > key2) - (key1 < key2)
+
 
-    # primary versions are equal, compare secondary versions
-    if secondary1 is None and secondary2 is None:
-        return 0
+def _release_key(version: "Version") -> "tuple[int, tuple[int, ...]]":
+    """
+    builds the (epoch, release) prefix of the version ordering, stripping
+    trailing zeros as they don't change it (1.0 == 1.0.0)
+    """
+    release = version.release
+    end = len(release)
+    while end > 1 and release[end - 1] == 0:
+        end -= 1
 
-    if secondary1 is None:
-        return -1  # version2 has secondary, so it's greater
+    return (version.epoch, release[:end])
 
-    if secondary2 is None:
-        return 1  # version1 has secondary, so it's greater
 
-    # both have secondary versions
-    if secondary1 < secondary2:
-        return -1
-    if secondary1 > secondary2:
-        return 1
+def version_sort_key(
+    version: "Version", second_version: "Version | None" = None
+) -> "tuple[Any, ...]":
+    """
+    builds a sort key ordering versions like compare_versions. The leading
+    int tuples settle most comparisons natively, so Version comparisons are
+    only reached for versions sharing the same release.
+    """
+    if second_version is None:
+        return (_release_key(version), version, False)
 
-    return 0
+    return (
+        _release_key(version),
+        version,
+        True,
+        _release_key(second_version),
+        second_version,
+    )
 
 
 def rhdh_plugin_needs_update(
@@ -81,12 +116,18 @@ def rhdh_plugin_needs_update(
     checks if the latest version is greater than the current version.
     supports dual versions with optional secondary version components.
     """
-    return (
-        compare_versions(
-            latest_version, current_version, latest_secondary, current_secondary
-        )
-        > 0
-    )
+    # most plugins differ on the primary version, which settles it alone
+    if latest_version != current_version:
+        return latest_version > current_version
+
+    # primary versions are equal, a missing secondary version is the lowest
+    if latest_secondary is None:
+        return False
+
+    if current_secondary is None:
+        return True
+
+    return latest_secondary > current_secondary
 
 
 def build_version_string(
@@ -100,12 +141,46 @@ def build_version_string(
     return str(version)
 
 
+@lru_cache(maxsize=16)
+def _tag_prefix_pattern(prefixes: "tuple[str, ...]") -> "re.Pattern[str] | None":
+    """
+    compiles the alternation of the given prefixes, longest first so that
+    overlapping prefixes resolve to the most specific one
+    """
+    if not prefixes:
+        return None
+
+    return re.compile(
+        "|".join(re.escape(p) for p in sorted(prefixes, key=len, reverse=True))
+    )
+
+
 def match_tag_prefix(tag: "str") -> "str | None":
     """
     checks if a tag starts with any of the configured prefixes
     and returns the matched prefix, or None if no match
     """
-    for prefix in RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX:
-        if tag.startswith(prefix):
-            return prefix
-    return None
+    pattern = _tag_prefix_pattern(tuple(RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX))
+    if pattern is None:
+        return None
+
+    match = pattern.match(tag)
+    return match.group(0) if match else None
+
+
+def tag_prefix_matcher() -> "Callable[[str], str | None]":
+    """
+    builds a match_tag_prefix equivalent bound to the configured prefixes,
+    so loops over many tags resolve the compiled pattern only once
+    """
+    pattern = _tag_prefix_pattern(tuple(RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX))
+    if pattern is None:
+        return lambda tag: None
+
+    match = pattern.match
+
+    def _match_tag_prefix(tag: "str") -> "str | None":
+        matched = match(tag)
+        return matched.group(0) if matched else None
+
+    return _match_tag_prefix
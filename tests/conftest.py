@@ -1,5 +1,8 @@
+import shutil
 import tempfile
+from dataclasses import replace
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 from unittest.mock import Mock
 
@@ -7,15 +10,11 @@ import pytest
 import requests
 from packaging.version import Version
 
-from src.types import RHDHPlugin
+from src.types import RHDHPlugin, RHDHPluginPackageVersion
 
-
-@pytest.fixture
-def temp_yaml_file() -> "Any":
-    """
-    creates a temporary YAML file with sample plugin configuration.
-    """
-    content = """global:
+# the sample configs are module constants, shared by the content fixtures
+# and the temporary files written from them
+SAMPLE_YAML_CONTENT = """global:
   dynamic:
     plugins:
       - disabled: false
@@ -23,14 +22,70 @@ def temp_yaml_file() -> "Any":
       - disabled: false
         package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool:next__0.2.0!red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool
 """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        f.write(content)
-        temp_path = f.name
 
-    yield temp_path
+SAMPLE_YAML_CONTENT_WITH_MULTIPLE_PREFIXES = """global:
+  dynamic:
+    plugins:
+      - disabled: false
+        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/backstage-plugin-mcp-actions-backend:next__0.1.2!backstage-plugin-mcp-actions-backend
+      - disabled: false
+        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool:stable__0.2.0!red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool
+      - disabled: false
+        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/another-plugin:previous__1.0.0!another-plugin
+"""
 
-    # clean temp files
-    Path(temp_path).unlink()
+SAMPLE_YAML_CONTENT_WITHOUT_EXCLAMATION = """global:
+  dynamic:
+    plugins:
+      - disabled: false
+        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/backstage-plugin-mcp-actions-backend:next__0.1.2
+      - disabled: false
+        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool:next__0.2.0
+"""
+
+SAMPLE_YAML_CONTENT_WITH_DUAL_VERSIONS = """global:
+  dynamic:
+    plugins:
+      - disabled: false
+        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/dual-version-plugin:next__1.42.5__0.1.0!dual-version-plugin
+      - disabled: false
+        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/backstage-plugin-mcp-actions-backend:next__0.1.2!backstage-plugin-mcp-actions-backend
+"""
+
+
+@pytest.fixture(scope="session")
+def yaml_templates(tmp_path_factory: "pytest.TempPathFactory") -> "dict[str, Path]":
+    """
+    writes each sample config once per session, for the tests to copy from.
+    """
+    directory = tmp_path_factory.mktemp("templates")
+    templates = {}
+    for name, content in (
+        ("default", SAMPLE_YAML_CONTENT),
+        ("without_exclamation", SAMPLE_YAML_CONTENT_WITHOUT_EXCLAMATION),
+        ("dual_versions", SAMPLE_YAML_CONTENT_WITH_DUAL_VERSIONS),
+    ):
+        templates[name] = directory / f"{name}.yaml"
+        templates[name].write_text(content)
+
+    return templates
+
+
+def _copy_yaml_template(template: "Path", tmp_path: "Path") -> "str":
+    """
+    copies the template into the test's own directory, so tests may modify it.
+    """
+    temp_path = tmp_path / "dynamic-plugins.yaml"
+    shutil.copyfile(template, temp_path)
+    return str(temp_path)
+
+
+@pytest.fixture
+def temp_yaml_file(yaml_templates: "dict[str, Path]", tmp_path: "Path") -> "str":
+    """
+    creates a temporary YAML file with sample plugin configuration.
+    """
+    return _copy_yaml_template(yaml_templates["default"], tmp_path)
 
 
 @pytest.fixture
@@ -46,6 +101,114 @@ def sample_plugin() -> "RHDHPlugin":
     )
 
 
+@pytest.fixture(scope="session")
+def base_plugin() -> "RHDHPlugin":
+    """
+    creates the plugin the main tests start from, shared across the session
+    as tests derive their variants with dataclasses.replace.
+    """
+    return RHDHPlugin(
+        package_name="test-package",
+        current_version=Version("1.0.0"),
+        plugin_name="test-plugin",
+        disabled=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def plugin_pair(base_plugin: "RHDHPlugin") -> "tuple[RHDHPlugin, RHDHPlugin]":
+    """
+    creates the two plugins of the multi-plugin main tests.
+    """
+    return (
+        replace(
+            base_plugin, package_name="test-package-1", plugin_name="test-plugin-1"
+        ),
+        replace(
+            base_plugin,
+            package_name="test-package-2",
+            current_version=Version("2.0.0"),
+            plugin_name="test-plugin-2",
+        ),
+    )
+
+
+@pytest.fixture
+def non_existent_plugin() -> "RHDHPlugin":
+    """
+    creates an RHDHPlugin missing from the sample configuration.
+    """
+    return RHDHPlugin(
+        package_name="rhdh-plugin-export-overlays/non-existent",
+        current_version=Version("1.0.0"),
+        plugin_name="non-existent-plugin",
+        disabled=False,
+    )
+
+
+@pytest.fixture
+def catalog_mcp_tool_plugin() -> "RHDHPlugin":
+    """
+    creates the RHDHPlugin of the second sample configuration entry.
+    """
+    return RHDHPlugin(
+        package_name="rhdh-plugin-export-overlays/red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool",
+        current_version=Version("0.2.0"),
+        plugin_name="red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool",
+        disabled=False,
+    )
+
+
+@pytest.fixture(scope="session")
+def updater() -> "Any":
+    """
+    creates an RHDHPluginConfigUpdater with the default config settings,
+    shared across the session as the content methods keep no state. Tests
+    reading the config file construct their own.
+    """
+    from src.updater import RHDHPluginConfigUpdater
+
+    return RHDHPluginConfigUpdater()
+
+
+@pytest.fixture
+def plugin_set(
+    base_plugin: "RHDHPlugin", request: "pytest.FixtureRequest"
+) -> "list[RHDHPlugin]":
+    """
+    creates the number of plugins given by the indirect parameter, plugin i
+    being test-plugin-i at version i.0.0.
+    """
+    return [
+        replace(
+            base_plugin,
+            package_name=f"test-package-{i}",
+            current_version=Version(f"{i}.0.0"),
+            plugin_name=f"test-plugin-{i}",
+        )
+        for i in range(1, request.param + 1)
+    ]
+
+
+@pytest.fixture(scope="session")
+def newer_versions_by_name() -> "dict[str, RHDHPluginPackageVersion]":
+    """
+    maps the packages of plugin_pair to a newer latest version.
+    """
+    return {
+        "test-package-1": RHDHPluginPackageVersion(
+            name="12346",
+            version=Version("1.1.0"),
+            created_at="2024-01-20T10:00:00Z",
+        ),
+        "test-package-2": RHDHPluginPackageVersion(
+            name="22346",
+            version=Version("2.1.0"),
+            created_at="2024-01-20T10:00:00Z",
+        ),
+    }
+
+
 @pytest.fixture
 def sample_plugin_list() -> "list[RHDHPlugin]":
     """
@@ -103,14 +266,7 @@ def sample_yaml_content() -> "str":
     """
     creates a sample YAML content as a string.
     """
-    return """global:
-  dynamic:
-    plugins:
-      - disabled: false
-        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/backstage-plugin-mcp-actions-backend:next__0.1.2!backstage-plugin-mcp-actions-backend
-      - disabled: false
-        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool:next__0.2.0!red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool
-"""
+    return SAMPLE_YAML_CONTENT
 
 
 @pytest.fixture
@@ -171,20 +327,42 @@ def github_client(mock_github_token) -> "Any":
 
     from src.github_api_client import GithubAPIClient
 
-    with patch("src.github_api_client.Github"):
+    with patch("github.Github"):
         client = GithubAPIClient(token=mock_github_token)
         return client
 
 
+def _make_response(
+    json_data: "Any" = None,
+    links: "dict[str, dict[str, str]] | None" = None,
+    headers: "dict[str, str] | None" = None,
+    status_code: "int" = 200,
+) -> "Mock":
+    """
+    builds a mock GitHub API response with the given body, links and headers.
+    """
+    response = Mock(spec=requests.Response)
+    response.status_code = status_code
+    response.headers = headers or {}
+    response.links = links or {}
+    response.json.return_value = [] if json_data is None else json_data
+    return response
+
+
+@pytest.fixture(scope="module")
+def response_factory() -> "Any":
+    """
+    provides the mock GitHub API response builder.
+    """
+    return _make_response
+
+
 @pytest.fixture
 def mock_response() -> "Mock":
     """
     creates a mock response object.
     """
-    response = Mock(spec=requests.Response)
-    response.links = {}
-    response.json.return_value = []
-    return response
+    return _make_response()
 
 
 @pytest.fixture
@@ -216,16 +394,7 @@ def sample_yaml_content_with_multiple_prefixes() -> "str":
     """
     creates a sample YAML content with plugins using different tag prefixes.
     """
-    return """global:
-  dynamic:
-    plugins:
-      - disabled: false
-        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/backstage-plugin-mcp-actions-backend:next__0.1.2!backstage-plugin-mcp-actions-backend
-      - disabled: false
-        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool:stable__0.2.0!red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool
-      - disabled: false
-        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/another-plugin:previous__1.0.0!another-plugin
-"""
+    return SAMPLE_YAML_CONTENT_WITH_MULTIPLE_PREFIXES
 
 
 @pytest.fixture
@@ -259,37 +428,17 @@ def sample_yaml_content_without_exclamation() -> "str":
     """
     creates a sample YAML content with plugins using the new format (no ! suffix).
     """
-    return """global:
-  dynamic:
-    plugins:
-      - disabled: false
-        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/backstage-plugin-mcp-actions-backend:next__0.1.2
-      - disabled: false
-        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool:next__0.2.0
-"""
+    return SAMPLE_YAML_CONTENT_WITHOUT_EXCLAMATION
 
 
 @pytest.fixture
-def temp_yaml_file_without_exclamation() -> "Any":
+def temp_yaml_file_without_exclamation(
+    yaml_templates: "dict[str, Path]", tmp_path: "Path"
+) -> "str":
     """
     creates a temporary YAML file with plugins using the new format (no ! suffix).
     """
-    content = """global:
-  dynamic:
-    plugins:
-      - disabled: false
-        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/backstage-plugin-mcp-actions-backend:next__0.1.2
-      - disabled: false
-        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool:next__0.2.0
-"""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        f.write(content)
-        temp_path = f.name
-
-    yield temp_path
-
-    # clean temp files
-    Path(temp_path).unlink()
+    return _copy_yaml_template(yaml_templates["without_exclamation"], tmp_path)
 
 
 @pytest.fixture
@@ -297,34 +446,45 @@ def sample_yaml_content_with_dual_versions() -> "str":
     """
     creates a sample YAML content with plugins using dual versions.
     """
-    return """global:
-  dynamic:
-    plugins:
-      - disabled: false
-        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/dual-version-plugin:next__1.42.5__0.1.0!dual-version-plugin
-      - disabled: false
-        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/backstage-plugin-mcp-actions-backend:next__0.1.2!backstage-plugin-mcp-actions-backend
-"""
+    return SAMPLE_YAML_CONTENT_WITH_DUAL_VERSIONS
 
 
 @pytest.fixture
-def temp_yaml_file_with_dual_versions() -> "Any":
+def temp_yaml_file_with_dual_versions(
+    yaml_templates: "dict[str, Path]", tmp_path: "Path"
+) -> "str":
     """
     creates a temporary YAML file with dual version plugins for testing.
     """
-    content = """global:
-  dynamic:
-    plugins:
-      - disabled: false
-        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/dual-version-plugin:next__1.42.5__0.1.0!dual-version-plugin
-      - disabled: false
-        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/backstage-plugin-mcp-actions-backend:next__0.1.2!backstage-plugin-mcp-actions-backend
-"""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        f.write(content)
-        temp_path = f.name
+    return _copy_yaml_template(yaml_templates["dual_versions"], tmp_path)
 
-    yield temp_path
 
-    # clean temp files
-    Path(temp_path).unlink()
+@pytest.fixture
+def main_env(monkeypatch: "pytest.MonkeyPatch") -> "None":
+    """
+    sets the repository settings main reads, so tests only patch what
+    they exercise.
+    """
+    monkeypatch.setattr("main.GITHUB_REPOSITORY", "owner/repo")
+    monkeypatch.setattr("main.GITHUB_TOKEN", "test_token")
+    monkeypatch.setattr("main.GITHUB_REF", "main")
+    monkeypatch.setattr(
+        "main.DYNAMIC_PLUGINS_CONFIG_YAML_FILE_PATH", "dynamic-plugins.yaml"
+    )
+
+
+@pytest.fixture
+def main_mocks(monkeypatch: "pytest.MonkeyPatch") -> "Any":
+    """
+    replaces the classes main builds its collaborators from with mocks,
+    returned by name so tests do not depend on a decorator order.
+    """
+    mocks = SimpleNamespace(loader_class=Mock(), api_class=Mock(), updater_class=Mock())
+    mocks.loader = mocks.loader_class.return_value
+    mocks.api = mocks.api_class.return_value
+    mocks.updater = mocks.updater_class.return_value
+    monkeypatch.setattr("main.RHDHPluginsConfigLoader", mocks.loader_class)
+    monkeypatch.setattr("main.GithubAPIClient", mocks.api_class)
+    monkeypatch.setattr("main.RHDHPluginConfigUpdater", mocks.updater_class)
+
+    return mocks
@@ -1,6 +1,8 @@
 import os
 from unittest.mock import patch
 
+from src.constants import parse_tag_prefixes
+
 
 class TestConstantsTagPrefixParsing:
     """
@@ -9,7 +11,7 @@ class TestConstantsTagPrefixParsing:
 
     def test_parse_single_prefix_default(self) -> "None":
         """
-        test that default single prefix is parsed correctly
+        test that default single prefix is read from the environment
         """
         with patch.dict(os.environ, {}, clear=True):
             import importlib
@@ -22,7 +24,7 @@ class TestConstantsTagPrefixParsing:
 
     def test_parse_single_prefix_custom(self) -> "None":
         """
-        test that custom single prefix is parsed correctly
+        test that custom single prefix is read from the environment
         """
         with patch.dict(os.environ, {"GH_PACKAGE_TAG_PREFIXES": "stable__"}):
             import importlib
@@ -37,106 +39,79 @@ class TestConstantsTagPrefixParsing:
         """
         test that comma-separated prefixes are parsed correctly
         """
-        with patch.dict(
-            os.environ, {"GH_PACKAGE_TAG_PREFIXES": "next__,stable__,previous__"}
-        ):
-            import importlib
-
-            import src.constants
-
-            importlib.reload(src.constants)
-
-            assert src.constants.GH_PACKAGE_TAG_PREFIXES == [
-                "next__",
-                "stable__",
-                "previous__",
-            ]
+        assert parse_tag_prefixes("next__,stable__,previous__") == [
+            "next__",
+            "stable__",
+            "previous__",
+        ]
 
     def test_parse_comma_separated_with_spaces(self) -> "None":
-        with patch.dict(
-            os.environ, {"GH_PACKAGE_TAG_PREFIXES": "next__ , stable__ , previous__"}
-        ):
-            import importlib
-
-            import src.constants
-
-            importlib.reload(src.constants)
-
-            assert src.constants.GH_PACKAGE_TAG_PREFIXES == [
-                "next__",
-                "stable__",
-                "previous__",
-            ]
+        assert parse_tag_prefixes("next__ , stable__ , previous__") == [
+            "next__",
+            "stable__",
+            "previous__",
+        ]
 
     def test_parse_newline_separated_prefixes(self) -> "None":
         """
         test that newline-separated prefixes are parsed correctly
         """
-        with patch.dict(
-            os.environ, {"GH_PACKAGE_TAG_PREFIXES": "next__\nstable__\nprevious__"}
-        ):
-            import importlib
-
-            import src.constants
-
-            importlib.reload(src.constants)
-
-            assert src.constants.GH_PACKAGE_TAG_PREFIXES == [
-                "next__",
-                "stable__",
-                "previous__",
-            ]
+        assert parse_tag_prefixes("next__\nstable__\nprevious__") == [
+            "next__",
+            "stable__",
+            "previous__",
+        ]
 
     def test_parse_newline_separated_with_spaces(self) -> "None":
-        with patch.dict(
-            os.environ,
-            {"GH_PACKAGE_TAG_PREFIXES": "  next__  \n  stable__  \n  previous__  "},
-        ):
-            import importlib
-
-            import src.constants
-
-            importlib.reload(src.constants)
-
-            assert src.constants.GH_PACKAGE_TAG_PREFIXES == [
-                "next__",
-                "stable__",
-                "previous__",
-            ]
+        assert parse_tag_prefixes("  next__  \n  stable__  \n  previous__  ") == [
+            "next__",
+            "stable__",
+            "previous__",
+        ]
 
     def test_parse_ignores_empty_values_comma(self) -> "None":
-        with patch.dict(os.environ, {"GH_PACKAGE_TAG_PREFIXES": "next__,,stable__,"}):
-            import importlib
+        assert parse_tag_prefixes("next__,,stable__,") == ["next__", "stable__"]
 
-            import src.constants
+    def test_parse_ignores_empty_values_newline(self) -> "None":
+        assert parse_tag_prefixes("next__\n\nstable__\n") == ["next__", "stable__"]
 
-            importlib.reload(src.constants)
+    def test_parse_mixed_newline_and_comma_separators(self) -> "None":
+        assert parse_tag_prefixes("next__,other__\nstable__") == [
+            "next__",
+            "other__",
+            "stable__",
+        ]
 
-            assert src.constants.GH_PACKAGE_TAG_PREFIXES == ["next__", "stable__"]
 
-    def test_parse_ignores_empty_values_newline(self) -> "None":
-        with patch.dict(
-            os.environ, {"GH_PACKAGE_TAG_PREFIXES": "next__\n\nstable__\n"}
-        ):
-            import importlib
+class TestConstantsConfigureLogging:
+    """
+    handles all tests for configure_logging in constants.py
+    """
 
-            import src.constants
+    def test_import_does_not_configure_logging(self) -> "None":
+        import importlib
 
+        import src.constants
+
+        with patch("logging.basicConfig") as mock_basic_config:
             importlib.reload(src.constants)
 
-            assert src.constants.GH_PACKAGE_TAG_PREFIXES == ["next__", "stable__"]
+        mock_basic_config.assert_not_called()
 
-    def test_parse_prefers_newline_over_comma(self) -> "None":
-        with patch.dict(
-            os.environ, {"GH_PACKAGE_TAG_PREFIXES": "next__,other__\nstable__"}
-        ):
-            import importlib
+    def test_configure_logging_uses_verbosity_level(self) -> "None":
+        import importlib
+        import logging
 
-            import src.constants
+        import src.constants
+
+        try:
+            with patch.dict(os.environ, {"VERBOSE": "1"}):
+                importlib.reload(src.constants)
 
+            with patch("logging.basicConfig") as mock_basic_config:
+                src.constants.configure_logging()
+        finally:
+            # reload without VERBOSE so the DEBUG level does not leak
             importlib.reload(src.constants)
 
-            assert src.constants.GH_PACKAGE_TAG_PREFIXES == [
-                "next__,other__",
-                "stable__",
-            ]
+        assert mock_basic_config.call_args.kwargs["level"] == logging.DEBUG
@@ -1,3 +1,4 @@
+import time
 from typing import Any
 from unittest.mock import Mock, patch
 
@@ -7,8 +8,8 @@ from github.ContentFile import ContentFile
 from packaging.version import Version
 
 from src.exceptions import GithubPRFailedException
-from src.github_api_client import GithubAPIClient
-from src.types import GithubPullRequestStrategy
+from src.github_api_client import GithubAPIClient, _quote_package_name
+from src.types import GithubPullRequestStrategy, RHDHPluginUpdaterConfig
 
 
 class TestGithubAPIClientInit:
@@ -17,32 +18,58 @@ class TestGithubAPIClientInit:
     """
 
     def test_init_with_default_per_page(self, mock_github_token: "str") -> "None":
-        with patch("src.github_api_client.Github"):
+        with patch("github.Github"):
             client = GithubAPIClient(token=mock_github_token)
             assert client.token == mock_github_token
             assert client.per_page == 100
 
     def test_init_with_custom_per_page(self, mock_github_token: "str") -> "None":
-        with patch("src.github_api_client.Github"):
+        with patch("github.Github"):
             client = GithubAPIClient(token=mock_github_token, per_page=50)
             assert client.per_page == 50
 
-    def test_init_creates_github_client(self, mock_github_token: "str") -> "None":
-        with patch("src.github_api_client.Github") as mock_github:
-            with patch("src.github_api_client.Auth") as mock_auth:
-                GithubAPIClient(token=mock_github_token)
+    def test_init_creates_github_client_lazily(
+        self, mock_github_token: "str"
+    ) -> "None":
+        with patch("github.Github") as mock_github:
+            with patch("github.Auth") as mock_auth:
+                client = GithubAPIClient(token=mock_github_token)
+                mock_github.assert_not_called()
+
+                assert client.client is client.client
                 mock_auth.Token.assert_called_once_with(mock_github_token)
                 mock_github.assert_called_once()
 
     def test_init_creates_requests_session(self, mock_github_token: "str") -> "None":
-        with patch("src.github_api_client.Github"):
+        with patch("github.Github"):
+            client = GithubAPIClient(token=mock_github_token)
+            headers = client._sessions[0].headers
+            assert "Authorization" in headers
+            assert headers["Authorization"] == f"token {mock_github_token}"
+            assert headers["Accept"] == "application/vnd.github+json"
+            assert headers["X-GitHub-Api-Version"] == "2022-11-28"
+
+    def test_init_sizes_connection_pool_to_workers(
+        self, mock_github_token: "str"
+    ) -> "None":
+        with patch("github.Github"):
             client = GithubAPIClient(token=mock_github_token)
-            assert "Authorization" in client._session.headers
+            adapter = client._sessions[0].get_adapter("https://api.github.com")
             assert (
-                client._session.headers["Authorization"] == f"token {mock_github_token}"
+                adapter._pool_maxsize
+                == RHDHPluginUpdaterConfig.GH_PACKAGES_FETCH_MAX_WORKERS
             )
-            assert client._session.headers["Accept"] == "application/vnd.github+json"
-            assert client._session.headers["X-GitHub-Api-Version"] == "2022-11-28"
+            assert adapter._pool_block is True
+
+    def test_init_retries_transient_failures(self, mock_github_token: "str") -> "None":
+        with patch("github.Github"):
+            client = GithubAPIClient(token=mock_github_token)
+            adapter = client._sessions[0].get_adapter("https://api.github.com")
+            retries = adapter.max_retries
+            assert retries.total == RHDHPluginUpdaterConfig.GH_API_MAX_RETRIES
+            assert 503 in retries.status_forcelist
+            # rate limits are handled by the client, not retried blindly
+            assert 429 not in retries.status_forcelist
 
 
 class TestFetchNext:
@@ -53,26 +80,18 @@ class TestFetchNext:
     def test_fetch_next_no_next_link(self, github_client: "GithubAPIClient") -> "None":
         response = Mock()
         response.links = {}
-        url = "https://api.github.com/test"
-        params = {"per_page": 100}
 
-        next_url, next_params = github_client._fetch_next(response, url, params)
-
-        assert next_url == ""
-        assert next_params == params
+        assert github_client._fetch_next(response) == ""
 
     def test_fetch_next_with_next_link(
         self, github_client: "GithubAPIClient"
     ) -> "None":
         response = Mock()
         response.links = {"next": {"url": "https://api.github.com/test?page=2"}}
-        url = "https://api.github.com/test"
-        params = {"per_page": 100}
-
-        next_url, next_params = github_client._fetch_next(response, url, params)
 
-        assert next_url == "https://api.github.com/test?page=2"
-        assert next_params == {}
+        assert (
+            github_client._fetch_next(response) == "https://api.github.com/test?page=2"
+        )
 
 
 class TestPaginate:
@@ -84,30 +103,27 @@ class TestPaginate:
         self, github_client: "GithubAPIClient", mock_response: "Mock"
     ) -> "None":
         mock_response.json.return_value = [{"id": 1}, {"id": 2}]
-        github_client._session.get = Mock(return_value=mock_response)
+        github_client._sessions[0].get = Mock(return_value=mock_response)
 
         url = "https://api.github.com/test"
-        result = github_client._paginate(url)
+        result = list(github_client._paginate(url))
 
         assert len(result) == 2
         assert result[0]["id"] == 1
         assert result[1]["id"] == 2
 
-    def test_paginate_multiple_pages(self, github_client: "GithubAPIClient") -> "None":
-        # First page response
-        response1 = Mock(spec=requests.Response)
-        response1.json.return_value = [{"id": 1}]
-        response1.links = {"next": {"url": "https://api.github.com/test?page=2"}}
-
-        # Second page response
-        response2 = Mock(spec=requests.Response)
-        response2.json.return_value = [{"id": 2}]
-        response2.links = {}
+    def test_paginate_multiple_pages(
+        self, github_client: "GithubAPIClient", response_factory: "Any"
+    ) -> "None":
+        response1 = response_factory(
+            [{"id": 1}], links={"next": {"url": "https://api.github.com/test?page=2"}}
+        )
+        response2 = response_factory([{"id": 2}])
 
-        github_client._session.get = Mock(side_effect=[response1, response2])
+        github_client._sessions[0].get = Mock(side_effect=[response1, response2])
 
         url = "https://api.github.com/test"
-        result = github_client._paginate(url)
+        result = list(github_client._paginate(url))
 
         assert len(result) == 2
         assert result[0]["id"] == 1
@@ -117,31 +133,352 @@ class TestPaginate:
         self, github_client: "GithubAPIClient", mock_response: "Mock"
     ) -> "None":
         mock_response.json.return_value = []
-        github_client._session.get = Mock(return_value=mock_response)
+        github_client._sessions[0].get = Mock(return_value=mock_response)
 
         url = "https://api.github.com/test"
         extra_params = {"state": "open"}
-        github_client._paginate(url, extra_params=extra_params)
+        list(github_client._paginate(url, extra_params=extra_params))
 
         # check that extra params were passed
-        call_args = github_client._session.get.call_args
+        call_args = github_client._sessions[0].get.call_args
         assert call_args[1]["params"]["state"] == "open"
         assert call_args[1]["params"]["per_page"] == 100
 
+    def test_paginate_is_lazy(
+        self, github_client: "GithubAPIClient", response_factory: "Any"
+    ) -> "None":
+        response1 = response_factory(
+            [{"id": 1}], links={"next": {"url": "https://api.github.com/test?page=2"}}
+        )
+
+        github_client._sessions[0].get = Mock(return_value=response1)
+
+        items = github_client._paginate("https://api.github.com/test")
+
+        # no request until the first item is consumed
+        github_client._sessions[0].get.assert_not_called()
+        assert next(items)["id"] == 1
+        github_client._sessions[0].get.assert_called_once()
+
     def test_paginate_http_error(self, github_client: "GithubAPIClient") -> "None":
         response = Mock(spec=requests.Response)
+        response.status_code = 404
+        response.headers = {}
         response.raise_for_status.side_effect = requests.HTTPError("404 Not Found")
-        github_client._session.get = Mock(return_value=response)
+        github_client._sessions[0].get = Mock(return_value=response)
 
         url = "https://api.github.com/test"
 
         with pytest.raises(requests.HTTPError):
-            github_client._paginate(url)
+            list(github_client._paginate(url))
+
+
+class TestEtagCache:
+    """
+    handles all tests for the conditional request cache.
+    """
+
+    def test_cache_disabled_by_default(
+        self, github_client: "GithubAPIClient"
+    ) -> "None":
+        assert github_client._etag_cache_path == ""
+        assert github_client._etag_cache == {}
+
+    def test_cache_disabled_sends_no_conditional_request(
+        self, github_client: "GithubAPIClient", response_factory: "Any"
+    ) -> "None":
+        github_client._sessions[0].get = Mock(
+            return_value=response_factory([{"id": 1}], headers={"ETag": '"abc"'})
+        )
+
+        list(github_client._paginate("https://api.github.com/test"))
+
+        assert github_client._sessions[0].get.call_args[1]["headers"] == {}
+        assert github_client._etag_cache == {}
+
+    def test_cache_stores_response_with_etag(
+        self, mock_github_token: "str", tmp_path: "Any", response_factory: "Any"
+    ) -> "None":
+        with patch("github.Github"):
+            client = GithubAPIClient(token=mock_github_token, cache_dir=str(tmp_path))
+
+        response = response_factory([{"id": 1}], headers={"ETag": '"abc"'})
+        client._sessions[0].get = Mock(return_value=response)
+
+        list(client._paginate("https://api.github.com/test"))
+        client.save_etag_cache()
+
+        with patch("github.Github"):
+            reloaded = GithubAPIClient(token=mock_github_token, cache_dir=str(tmp_path))
+
+        assert list(reloaded._etag_cache.values()) == [
+            {"etag": '"abc"', "items": [{"id": 1}], "next": ""}
+        ]
+
+    def test_cache_serves_not_modified_response(
+        self, mock_github_token: "str", tmp_path: "Any", response_factory: "Any"
+    ) -> "None":
+        with patch("github.Github"):
+            client = GithubAPIClient(token=mock_github_token, cache_dir=str(tmp_path))
+
+        cache_key = "https://api.github.com/test?per_page=100"
+        client._etag_cache[cache_key] = {
+            "etag": '"abc"',
+            "items": [{"id": 1}],
+            "next": "",
+        }
+
+        response = response_factory(status_code=304)
+        client._sessions[0].get = Mock(return_value=response)
+
+        result = list(client._paginate("https://api.github.com/test"))
+
+        assert result == [{"id": 1}]
+        call_args = client._sessions[0].get.call_args
+        assert call_args[1]["headers"] == {"If-None-Match": '"abc"'}
+        response.json.assert_not_called()
+
+    def test_cache_persists_only_keys_used_this_run(
+        self, mock_github_token: "str", tmp_path: "Any", response_factory: "Any"
+    ) -> "None":
+        with patch("github.Github"):
+            client = GithubAPIClient(token=mock_github_token, cache_dir=str(tmp_path))
+
+        used_key = "https://api.github.com/test?per_page=100"
+        stale_key = "https://api.github.com/removed?per_page=100"
+        for key in (used_key, stale_key):
+            client._etag_cache[key] = {"etag": '"abc"', "items": [], "next": ""}
+
+        client._sessions[0].get = Mock(return_value=response_factory(status_code=304))
+
+        list(client._paginate("https://api.github.com/test"))
+        client.save_etag_cache()
+
+        with patch("github.Github"):
+            reloaded = GithubAPIClient(token=mock_github_token, cache_dir=str(tmp_path))
+
+        assert list(reloaded._etag_cache) == [used_key]
+
+    def test_cache_ignores_unreadable_file(
+        self, mock_github_token: "str", tmp_path: "Any"
+    ) -> "None":
+        (tmp_path / RHDHPluginUpdaterConfig.ETAG_CACHE_FILE_NAME).write_text("{")
+
+        with patch("github.Github"):
+            client = GithubAPIClient(token=mock_github_token, cache_dir=str(tmp_path))
+
+        assert client._etag_cache == {}
+
+
+class TestRateLimit:
+    """
+    handles all tests for the rate limit handling.
+    """
+
+    def test_no_wait_with_remaining_quota(
+        self, github_client: "GithubAPIClient", mock_response: "Mock"
+    ) -> "None":
+        mock_response.headers = {
+            "X-RateLimit-Remaining": "4000",
+            "X-RateLimit-Reset": "1700000000",
+        }
+
+        with patch("src.github_api_client.time.sleep") as mock_sleep:
+            assert (
+                github_client._wait_for_rate_limit(
+                    github_client._sessions[0], mock_response
+                )
+                is False
+            )
+
+        mock_sleep.assert_not_called()
+
+    def test_waits_for_reset_when_almost_exhausted(
+        self, github_client: "GithubAPIClient", mock_response: "Mock"
+    ) -> "None":
+        mock_response.status_code = 200
+        mock_response.headers = {
+            "X-RateLimit-Remaining": "3",
+            "X-RateLimit-Reset": "1030",
+        }
+
+        with (
+            patch("src.github_api_client.time.time", return_value=1000),
+            patch("src.github_api_client.time.sleep") as mock_sleep,
+        ):
+            assert (
+                github_client._wait_for_rate_limit(
+                    github_client._sessions[0], mock_response
+                )
+                is False
+            )
+
+        mock_sleep.assert_called_once_with(30)
+
+    def test_wait_is_capped(
+        self, github_client: "GithubAPIClient", mock_response: "Mock"
+    ) -> "None":
+        mock_response.status_code = 403
+        mock_response.headers = {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": "999999",
+        }
+
+        with (
+            patch("src.github_api_client.time.time", return_value=0),
+            patch("src.github_api_client.time.sleep") as mock_sleep,
+        ):
+            github_client._wait_for_rate_limit(
+                github_client._sessions[0], mock_response
+            )
+
+        mock_sleep.assert_called_once_with(
+            RHDHPluginUpdaterConfig.GH_API_RATE_LIMIT_MAX_WAIT
+        )
+
+    def test_no_wait_for_far_off_reset_while_quota_left(
+        self, github_client: "GithubAPIClient", mock_response: "Mock"
+    ) -> "None":
+        mock_response.status_code = 200
+        mock_response.headers = {
+            "X-RateLimit-Remaining": "3",
+            "X-RateLimit-Reset": "999999",
+        }
+
+        with (
+            patch("src.github_api_client.time.time", return_value=0),
+            patch("src.github_api_client.time.sleep") as mock_sleep,
+        ):
+            assert (
+                github_client._wait_for_rate_limit(
+                    github_client._sessions[0], mock_response
+                )
+                is False
+            )
+
+        # a capped sleep would not give any quota back
+        mock_sleep.assert_not_called()
+
+    @pytest.mark.parametrize("status_code", [403, 429])
+    def test_honors_retry_after_with_remaining_quota(
+        self,
+        github_client: "GithubAPIClient",
+        mock_response: "Mock",
+        status_code: "int",
+    ) -> "None":
+        mock_response.status_code = status_code
+        mock_response.headers = {
+            "Retry-After": "20",
+            "X-RateLimit-Remaining": "4000",
+            "X-RateLimit-Reset": "999999",
+        }
+
+        with (
+            patch("src.github_api_client.time.time", return_value=1000),
+            patch("src.github_api_client.time.sleep") as mock_sleep,
+        ):
+            assert (
+                github_client._wait_for_rate_limit(
+                    github_client._sessions[0], mock_response
+                )
+                is True
+            )
+
+        mock_sleep.assert_called_once_with(20)
+
+    def test_waits_on_secondary_rate_limit_without_hints(
+        self, github_client: "GithubAPIClient", mock_response: "Mock"
+    ) -> "None":
+        mock_response.status_code = 429
+        mock_response.headers = {}
+
+        with (
+            patch("src.github_api_client.time.time", return_value=1000),
+            patch("src.github_api_client.time.sleep") as mock_sleep,
+        ):
+            assert (
+                github_client._wait_for_rate_limit(
+                    github_client._sessions[0], mock_response
+                )
+                is True
+            )
+
+        mock_sleep.assert_called_once_with(
+            RHDHPluginUpdaterConfig.GH_API_SECONDARY_RATE_LIMIT_WAIT
+        )
+
+    def test_retries_rate_limited_request(
+        self, github_client: "GithubAPIClient", mock_response: "Mock"
+    ) -> "None":
+        limited = Mock(spec=requests.Response)
+        limited.status_code = 403
+        limited.headers = {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "0"}
+        github_client._sessions[0].get = Mock(side_effect=[limited, mock_response])
+
+        with patch("src.github_api_client.time.sleep"):
+            result = list(github_client._paginate("https://api.github.com/test"))
+
+        assert result == []
+        assert github_client._sessions[0].get.call_count == 2
 
 
-class TestConvertToRHDHPluginPackage:
+class TestTokenRotation:
     """
-    handles all tests for _convert_to_rhdh_plugin_package method.
+    handles all tests for the rotation across several tokens.
+    """
+
+    def test_init_with_comma_separated_tokens(self) -> "None":
+        with (
+            patch("github.Github"),
+            patch("github.Auth.Token") as mock_token,
+        ):
+            client = GithubAPIClient(token="token_a, token_b")
+            client.client
+
+        assert client.token == "token_a"
+        mock_token.assert_called_once_with("token_a")
+        assert [s.headers["Authorization"] for s in client._sessions] == [
+            "token token_a",
+            "token token_b",
+        ]
+
+    def test_next_session_rotates(self) -> "None":
+        with patch("github.Github"):
+            client = GithubAPIClient(token=["token_a", "token_b"])
+
+        first, second, third = (client._next_session() for _ in range(3))
+
+        assert first is client._sessions[0]
+        assert second is client._sessions[1]
+        assert third is client._sessions[0]
+
+    def test_rate_limited_token_is_skipped_without_waiting(
+        self, mock_response: "Mock"
+    ) -> "None":
+        with patch("github.Github"):
+            client = GithubAPIClient(token=["token_a", "token_b"])
+
+        limited = Mock(spec=requests.Response)
+        limited.status_code = 403
+        limited.headers = {
+            "X-RateLimit-Remaining": "0",
+            "X-RateLimit-Reset": str(int(time.time()) + 3600),
+        }
+        client._sessions[0].get = Mock(return_value=limited)
+        client._sessions[1].get = Mock(return_value=mock_response)
+
+        with patch("src.github_api_client.time.sleep") as mock_sleep:
+            list(client._paginate("https://api.github.com/test"))
+            list(client._paginate("https://api.github.com/test"))
+
+        mock_sleep.assert_not_called()
+        client._sessions[0].get.assert_called_once()
+        assert client._sessions[1].get.call_count == 2
+
+
+class TestIterPackageVersions:
+    """
+    handles all tests for _iter_package_versions method.
     """
 
     def test_convert_valid_versions(
@@ -150,16 +487,14 @@ class TestConvertToRHDHPluginPackage:
         sample_package_versions: "list[dict[str, Any]]",
     ) -> "None":
         package_name = "test-package"
-        result = github_client._convert_to_rhdh_plugin_package(
-            package_name, sample_package_versions
+        result = list(
+            github_client._iter_package_versions(package_name, sample_package_versions)
         )
 
-        assert result.name == package_name
-
         # should only include versions with correct prefix (2 out of 3)
-        assert len(result.versions) == 2
-        assert result.versions[0].version == Version("0.1.2")
-        assert result.versions[1].version == Version("0.1.3")
+        assert len(result) == 2
+        assert result[0].version == Version("0.1.2")
+        assert result[1].version == Version("0.1.3")
 
     def test_convert_filters_invalid_tag_prefix(
         self, github_client: "GithubAPIClient"
@@ -174,11 +509,9 @@ class TestConvertToRHDHPluginPackage:
             }
         ]
 
-        result = github_client._convert_to_rhdh_plugin_package(
-            package_name, raw_versions
-        )
+        result = list(github_client._iter_package_versions(package_name, raw_versions))
 
-        assert len(result.versions) == 0
+        assert len(result) == 0
 
     def test_convert_handles_missing_metadata(
         self, github_client: "GithubAPIClient"
@@ -192,11 +525,30 @@ class TestConvertToRHDHPluginPackage:
             }
         ]
 
-        result = github_client._convert_to_rhdh_plugin_package(
-            package_name, raw_versions
-        )
+        result = list(github_client._iter_package_versions(package_name, raw_versions))
 
-        assert len(result.versions) == 0
+        assert len(result) == 0
+
+    def test_convert_handles_null_metadata(
+        self, github_client: "GithubAPIClient"
+    ) -> "None":
+        package_name = "test-package"
+        raw_versions = [
+            {
+                "name": "12345",
+                "metadata": None,
+                "created_at": "2024-01-15T10:00:00Z",
+            },
+            {
+                "name": "12346",
+                "metadata": {"container": {"tags": ["next__0.1.3"]}},
+                "created_at": None,
+            },
+        ]
+
+        result = list(github_client._iter_package_versions(package_name, raw_versions))
+
+        assert len(result) == 0
 
     def test_convert_handles_missing_container(
         self, github_client: "GithubAPIClient"
@@ -211,11 +563,9 @@ class TestConvertToRHDHPluginPackage:
             }
         ]
 
-        result = github_client._convert_to_rhdh_plugin_package(
-            package_name, raw_versions
-        )
+        result = list(github_client._iter_package_versions(package_name, raw_versions))
 
-        assert len(result.versions) == 0
+        assert len(result) == 0
 
     def test_convert_handles_missing_tags(
         self, github_client: "GithubAPIClient"
@@ -230,11 +580,9 @@ class TestConvertToRHDHPluginPackage:
             }
         ]
 
-        result = github_client._convert_to_rhdh_plugin_package(
-            package_name, raw_versions
-        )
+        result = list(github_client._iter_package_versions(package_name, raw_versions))
 
-        assert len(result.versions) == 0
+        assert len(result) == 0
 
     def test_convert_handles_empty_tags_list(
         self, github_client: "GithubAPIClient"
@@ -249,11 +597,9 @@ class TestConvertToRHDHPluginPackage:
             }
         ]
 
-        result = github_client._convert_to_rhdh_plugin_package(
-            package_name, raw_versions
-        )
+        result = list(github_client._iter_package_versions(package_name, raw_versions))
 
-        assert len(result.versions) == 0
+        assert len(result) == 0
 
     def test_convert_handles_missing_created_at(
         self, github_client: "GithubAPIClient"
@@ -267,11 +613,9 @@ class TestConvertToRHDHPluginPackage:
             }
         ]
 
-        result = github_client._convert_to_rhdh_plugin_package(
-            package_name, raw_versions
-        )
+        result = list(github_client._iter_package_versions(package_name, raw_versions))
 
-        assert len(result.versions) == 0
+        assert len(result) == 0
 
     def test_convert_with_tag_prefix_filter(
         self, github_client: "GithubAPIClient"
@@ -295,13 +639,15 @@ class TestConvertToRHDHPluginPackage:
             },
         ]
 
-        result = github_client._convert_to_rhdh_plugin_package(
-            package_name, raw_versions, tag_prefix_filter="next__"
+        result = list(
+            github_client._iter_package_versions(
+                package_name, raw_versions, tag_prefix_filter="next__"
+            )
         )
 
-        assert len(result.versions) == 2
-        assert result.versions[0].version == Version("1.0.0")
-        assert result.versions[1].version == Version("1.1.0")
+        assert len(result) == 2
+        assert result[0].version == Version("1.0.0")
+        assert result[1].version == Version("1.1.0")
 
     @patch(
         "src.github_api_client.RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX",
@@ -329,12 +675,14 @@ class TestConvertToRHDHPluginPackage:
             },
         ]
 
-        result = github_client._convert_to_rhdh_plugin_package(
-            package_name, raw_versions, tag_prefix_filter="stable__"
+        result = list(
+            github_client._iter_package_versions(
+                package_name, raw_versions, tag_prefix_filter="stable__"
+            )
         )
 
-        assert len(result.versions) == 1
-        assert result.versions[0].version == Version("1.0.0")
+        assert len(result) == 1
+        assert result[0].version == Version("1.0.0")
 
     @patch(
         "src.github_api_client.RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX",
@@ -357,56 +705,104 @@ class TestConvertToRHDHPluginPackage:
             },
         ]
 
-        result = github_client._convert_to_rhdh_plugin_package(
-            package_name, raw_versions, tag_prefix_filter=None
+        result = list(
+            github_client._iter_package_versions(
+                package_name, raw_versions, tag_prefix_filter=None
+            )
         )
 
-        assert len(result.versions) == 2
+        assert len(result) == 2
 
 
-class TestFetchPackage:
+class TestFetchLatestVersion:
     """
-    handles all tests for fetch_package method.
+    handles all tests for fetch_latest_version method.
     """
 
-    def test_fetch_package_success(
+    def test_fetch_latest_version_success(
         self,
         github_client: "GithubAPIClient",
         sample_package_versions: "list[dict[str, Any]]",
     ) -> "None":
-        github_client._paginate = Mock(return_value=sample_package_versions)
+        github_client._paginate = Mock(return_value=iter(sample_package_versions))
 
-        package_name = "test-package"
-        result = github_client.fetch_package(package_name)
+        result = github_client.fetch_latest_version("test-package")
 
-        assert result.name == package_name
-        assert len(result.versions) == 2
+        assert result is not None
+        assert result.name == "12346"
+        assert result.version == Version("0.1.3")
 
-    def test_fetch_package_no_versions(
+    def test_fetch_latest_version_with_mixed_dual_versions(
         self, github_client: "GithubAPIClient"
     ) -> "None":
-        github_client._paginate = Mock(return_value=[])
+        raw_versions = [
+            {
+                "name": f"{i}",
+                "metadata": {"container": {"tags": [tag]}},
+                "created_at": "2024-01-15T10:00:00Z",
+            }
+            for i, tag in enumerate(
+                ["next__1.0.0", "next__1.0.0__0.2.0", "next__1.0.0__0.10.0"]
+            )
+        ]
+        github_client._paginate = Mock(return_value=iter(raw_versions))
 
-        package_name = "test-package"
-        result = github_client.fetch_package(package_name)
+        result = github_client.fetch_latest_version("test-package")
 
-        assert result.name == package_name
-        assert len(result.versions) == 0
+        assert result is not None
+        assert result.version == Version("1.0.0")
+        assert result.second_version == Version("0.10.0")
 
-    def test_fetch_package_url_encoding(
+    def test_fetch_latest_version_no_versions(
         self, github_client: "GithubAPIClient"
     ) -> "None":
-        github_client._paginate = Mock(return_value=[])
+        github_client._paginate = Mock(return_value=iter([]))
+
+        result = github_client.fetch_latest_version("test-package")
 
-        package_name = "org/package-name"
-        github_client.fetch_package(package_name)
+        assert result is None
+
+    def test_fetch_latest_version_caches_result(
+        self,
+        github_client: "GithubAPIClient",
+        sample_package_versions: "list[dict[str, Any]]",
+    ) -> "None":
+        github_client._paginate = Mock(
+            side_effect=lambda url: iter(sample_package_versions)
+        )
+
+        first = github_client.fetch_latest_version("test-package")
+        second = github_client.fetch_latest_version("test-package")
+
+        assert first is second
+        github_client._paginate.assert_called_once()
+
+    def test_fetch_latest_version_url_encoding(
+        self, github_client: "GithubAPIClient"
+    ) -> "None":
+        github_client._paginate = Mock(return_value=iter([]))
+
+        github_client.fetch_latest_version("org/package-name")
 
         # check that _paginate was called with encoded URL
-        call_args = github_client._paginate.call_args
-        url = call_args[1]["url"]
+        url = github_client._paginate.call_args[1]["url"]
         assert "org%2Fpackage-name" in url
 
-    def test_fetch_package_with_tag_prefix_filter(
+    def test_fetch_latest_version_reuses_quoted_package_name(
+        self, github_client: "GithubAPIClient"
+    ) -> "None":
+        github_client._paginate = Mock(side_effect=lambda url: iter([]))
+        _quote_package_name.cache_clear()
+
+        github_client.fetch_latest_version("org/package-name")
+        github_client.fetch_latest_version(
+            "org/package-name", tag_prefix_filter="next__"
+        )
+
+        assert _quote_package_name("org/package-name") == "org%2Fpackage-name"
+        assert _quote_package_name.cache_info().misses == 1
+
+    def test_fetch_latest_version_with_tag_prefix_filter(
         self, github_client: "GithubAPIClient"
     ) -> "None":
         raw_versions = [
@@ -421,14 +817,57 @@ class TestFetchPackage:
                 "created_at": "2024-01-16T10:00:00Z",
             },
         ]
-        github_client._paginate = Mock(return_value=raw_versions)
+        github_client._paginate = Mock(return_value=iter(raw_versions))
 
-        package_name = "test-package"
-        result = github_client.fetch_package(package_name, tag_prefix_filter="next__")
+        result = github_client.fetch_latest_version(
+            "test-package", tag_prefix_filter="next__"
+        )
+
+        assert result is not None
+        assert result.version == Version("1.0.0")
+
+    def test_fetch_latest_version_cache_respects_tag_prefix_filter(
+        self,
+        github_client: "GithubAPIClient",
+        sample_package_versions: "list[dict[str, Any]]",
+    ) -> "None":
+        github_client._paginate = Mock(
+            side_effect=lambda url: iter(sample_package_versions)
+        )
+
+        github_client.fetch_latest_version("test-package", tag_prefix_filter="next__")
+        github_client.fetch_latest_version("test-package", tag_prefix_filter="stable__")
 
-        assert result.name == package_name
-        assert len(result.versions) == 1
-        assert result.versions[0].version == Version("1.0.0")
+        assert github_client._paginate.call_count == 2
+
+    def test_fetch_latest_version_reads_pages_past_backport(
+        self, github_client: "GithubAPIClient", response_factory: "Any"
+    ) -> "None":
+        def page(tag: "str") -> "list[dict[str, Any]]":
+            return [
+                {
+                    "name": tag,
+                    "metadata": {"container": {"tags": [tag]}},
+                    "created_at": "2024-01-15T10:00:00Z",
+                }
+            ]
+
+        # 1.2.5 is a backport published after 1.3.0, so it is listed first
+        github_client._sessions[0].get = Mock(
+            side_effect=[
+                response_factory(
+                    page("next__1.2.5"),
+                    links={"next": {"url": "https://api.github.com/test?page=2"}},
+                ),
+                response_factory(page("next__1.3.0")),
+            ]
+        )
+
+        result = github_client.fetch_latest_version("test-package")
+
+        assert result is not None
+        assert result.version == Version("1.3.0")
+        assert github_client._sessions[0].get.call_count == 2
 
 
 class TestBranchExists:
@@ -454,6 +893,73 @@ class TestBranchExists:
         assert result is False
 
 
+class TestRepoCache:
+    """
+    handles all tests for the repository and base SHA caches.
+    """
+
+    def test_get_repo_is_cached(self, github_client: "GithubAPIClient") -> "None":
+        github_client.client.get_repo = Mock(return_value=Mock())
+
+        first = github_client._get_repo("owner/repo")
+        second = github_client._get_repo("owner/repo")
+
+        assert first is second
+        github_client.client.get_repo.assert_called_once_with("owner/repo")
+
+    def test_get_base_sha_is_cached_per_branch(
+        self, github_client: "GithubAPIClient"
+    ) -> "None":
+        mock_repo = Mock()
+        mock_repo.get_git_ref.return_value = Mock(object=Mock(sha="base_sha_123"))
+        github_client.client.get_repo = Mock(return_value=mock_repo)
+
+        assert github_client._get_base_sha("owner/repo", "main") == "base_sha_123"
+        assert github_client._get_base_sha("owner/repo", "main") == "base_sha_123"
+        github_client._get_base_sha("owner/repo", "release")
+
+        assert mock_repo.get_git_ref.call_count == 2
+
+
+class TestListUpdateBranches:
+    """
+    handles all tests for list_update_branches method.
+    """
+
+    def test_list_update_branches(self, github_client: "GithubAPIClient") -> "None":
+        mock_repo = Mock()
+        mock_repo.get_git_matching_refs.return_value = [
+            Mock(ref="refs/heads/update-plugin-a-1.0.0"),
+            Mock(ref="refs/heads/update-rhdh-plugins-batch"),
+        ]
+        github_client.client.get_repo = Mock(return_value=mock_repo)
+
+        result = github_client.list_update_branches("owner/repo")
+
+        assert result == {"update-plugin-a-1.0.0", "update-rhdh-plugins-batch"}
+        mock_repo.get_git_matching_refs.assert_called_once_with("heads/update-")
+
+    def test_list_update_branches_is_cached(
+        self, github_client: "GithubAPIClient"
+    ) -> "None":
+        mock_repo = Mock()
+        mock_repo.get_git_matching_refs.return_value = []
+        github_client.client.get_repo = Mock(return_value=mock_repo)
+
+        first = github_client.list_update_branches("owner/repo")
+        second = github_client.list_update_branches("owner/repo")
+
+        assert first is second
+        mock_repo.get_git_matching_refs.assert_called_once()
+
+    def test_list_update_branches_failure(
+        self, github_client: "GithubAPIClient"
+    ) -> "None":
+        github_client.client.get_repo = Mock(side_effect=Exception("API error"))
+
+        assert github_client.list_update_branches("owner/repo") is None
+
+
 class TestHandleNewEndline:
     """
     handles all tests for _handle_new_endline method.
@@ -499,6 +1005,15 @@ class TestHandleNewEndline:
 
         assert result == "line1\nline3"
 
+    def test_returns_same_object_when_unchanged(
+        self, github_client: "GithubAPIClient"
+    ) -> "None":
+        new = "line1\nline3\n"
+
+        result = github_client._handle_new_endline("line1\nline2\n", new)
+
+        assert result is new
+
 
 class TestCreatePullRequest:
     """
@@ -515,10 +1030,8 @@ class TestCreatePullRequest:
         mock_repo = Mock()
         mock_base_ref = Mock()
         mock_base_ref.object.sha = "base_sha_123"
-        mock_repo.get_git_ref.side_effect = [
-            mock_base_ref,
-            Exception("Branch not found"),
-        ]
+        mock_repo.get_git_ref.return_value = mock_base_ref
+        mock_repo.get_git_matching_refs.return_value = []
         mock_repo.create_git_ref.return_value = Mock()
 
         mock_contents = Mock(spec=ContentFile)
@@ -545,9 +1058,135 @@ class TestCreatePullRequest:
 
         assert result == "https://github.com/owner/repo/pull/1"
         mock_repo.create_git_ref.assert_called_once()
+        # the new branch is looked up from the listing, not one by one
+        mock_repo.get_git_ref.assert_called_once_with("heads/main")
+        assert "update-plugin" in github_client.list_update_branches("owner/repo")
         mock_repo.update_file.assert_called_once()
         mock_repo.create_pull.assert_called_once()
 
+    @patch(
+        "src.github_api_client.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.SEPARATE
+    )
+    def test_create_pr_reuses_repo_and_base_ref_across_prs(
+        self, github_client: "GithubAPIClient"
+    ) -> "None":
+        mock_repo = Mock()
+        mock_base_ref = Mock()
+        mock_base_ref.object.sha = "base_sha_123"
+        mock_repo.get_git_ref.return_value = mock_base_ref
+
+        mock_contents = Mock(spec=ContentFile)
+        mock_contents.decoded_content = b"old content\n"
+        mock_contents.sha = "file_sha_123"
+        mock_repo.get_contents.return_value = mock_contents
+        mock_repo.create_pull.return_value = Mock(html_url="https://pr/1")
+
+        mock_repo.get_git_matching_refs.return_value = []
+        github_client.client.get_repo = Mock(return_value=mock_repo)
+
+        for plugin in ("plugin-a", "plugin-b", "plugin-c"):
+            github_client.create_pull_request(
+                repo_full_name="owner/repo",
+                file_path="config.yaml",
+                new_content="new content",
+                branch_name=f"update-{plugin}",
+                pr_title=f"Update {plugin}",
+                pr_body=f"Update {plugin} to version 1.0.0",
+                base_branch="main",
+            )
+
+        # the repo, base ref, base file and branches are fetched once for all
+        # the PRs
+        github_client.client.get_repo.assert_called_once_with("owner/repo")
+        mock_repo.get_git_matching_refs.assert_called_once()
+        mock_repo.get_git_ref.assert_called_once_with("heads/main")
+        mock_repo.get_contents.assert_called_once()
+        assert mock_repo.create_git_ref.call_count == 3
+        assert mock_repo.create_pull.call_count == 3
+
+    @patch(
+        "src.github_api_client.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.SEPARATE
+    )
+    def test_create_pr_uses_existing_branches(
+        self, github_client: "GithubAPIClient"
+    ) -> "None":
+        mock_repo = Mock()
+        mock_base_ref = Mock()
+        mock_base_ref.object.sha = "base_sha_123"
+        mock_repo.get_git_ref.return_value = mock_base_ref
+
+        mock_contents = Mock(spec=ContentFile)
+        mock_contents.decoded_content = b"old content\n"
+        mock_contents.sha = "file_sha_123"
+        mock_repo.get_contents.return_value = mock_contents
+        mock_repo.create_pull.return_value = Mock(html_url="https://pr/1")
+
+        mock_repo.get_git_matching_refs.return_value = [
+            Mock(ref="refs/heads/update-other-plugin")
+        ]
+        github_client.client.get_repo = Mock(return_value=mock_repo)
+
+        github_client.create_pull_request(
+            repo_full_name="owner/repo",
+            file_path="config.yaml",
+            new_content="new content",
+            branch_name="update-plugin",
+            pr_title="Update plugin",
+            pr_body="Update plugin to version 1.0.0",
+            base_branch="main",
+        )
+
+        # only the base branch is looked up
+        mock_repo.get_git_ref.assert_called_once_with("heads/main")
+        assert "update-plugin" in github_client.list_update_branches("owner/repo")
+
+        with pytest.raises(GithubPRFailedException, match="already exists"):
+            github_client.create_pull_request(
+                repo_full_name="owner/repo",
+                file_path="config.yaml",
+                new_content="new content",
+                branch_name="update-plugin",
+                pr_title="Update plugin",
+                pr_body="Update plugin to version 1.0.0",
+                base_branch="main",
+            )
+
+    @patch(
+        "src.github_api_client.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.SEPARATE
+    )
+    def test_create_pr_reuses_base_file_for_new_branches(
+        self, github_client: "GithubAPIClient"
+    ) -> "None":
+        mock_repo = Mock()
+        mock_base_ref = Mock()
+        mock_base_ref.object.sha = "base_sha_123"
+        mock_repo.get_git_ref.return_value = mock_base_ref
+
+        mock_contents = Mock(spec=ContentFile)
+        mock_contents.decoded_content = b"old content\n"
+        mock_contents.sha = "file_sha_123"
+        mock_repo.get_contents.return_value = mock_contents
+        mock_repo.create_pull.return_value = Mock(html_url="https://pr/1")
+
+        mock_repo.get_git_matching_refs.return_value = []
+        github_client.client.get_repo = Mock(return_value=mock_repo)
+
+        for branch_name in ("update-plugin-a", "update-plugin-b"):
+            github_client.create_pull_request(
+                repo_full_name="owner/repo",
+                file_path="config.yaml",
+                new_content="new content",
+                branch_name=branch_name,
+                pr_title="Update plugin",
+                pr_body="Update plugin to version 1.0.0",
+                base_branch="main",
+            )
+
+        mock_repo.get_contents.assert_called_once_with(
+            "config.yaml", ref="base_sha_123"
+        )
+        assert mock_repo.update_file.call_count == 2
+
     @patch(
         "src.github_api_client.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.SEPARATE
     )
@@ -560,7 +1199,9 @@ class TestCreatePullRequest:
         mock_repo.get_git_ref.return_value = mock_base_ref
 
         github_client.client.get_repo = Mock(return_value=mock_repo)
-        github_client._branch_exists = Mock(return_value=True)
+        mock_repo.get_git_matching_refs.return_value = [
+            Mock(ref="refs/heads/update-plugin")
+        ]
 
         with pytest.raises(GithubPRFailedException) as exc_info:
             github_client.create_pull_request(
@@ -574,6 +1215,7 @@ class TestCreatePullRequest:
             )
 
         assert "already exists" in str(exc_info.value)
+        mock_repo.create_git_ref.assert_not_called()
 
     @patch("src.github_api_client.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.JOINT)
     def test_create_pr_branch_exists_with_open_pr(
@@ -591,7 +1233,9 @@ class TestCreatePullRequest:
         mock_repo.get_pulls.return_value = [mock_existing_pr]
 
         github_client.client.get_repo = Mock(return_value=mock_repo)
-        github_client._branch_exists = Mock(return_value=True)
+        mock_repo.get_git_matching_refs.return_value = [
+            Mock(ref="refs/heads/update-plugin")
+        ]
 
         with pytest.raises(GithubPRFailedException) as exc_info:
             github_client.create_pull_request(
@@ -606,16 +1250,58 @@ class TestCreatePullRequest:
 
         assert "Open PR already exists" in str(exc_info.value)
 
-    def test_create_pr_file_update_failure(
+    @patch("src.github_api_client.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.JOINT)
+    def test_create_pr_branch_exists_pulls_listing_fails(
         self, github_client: "GithubAPIClient"
     ) -> "None":
         mock_repo = Mock()
         mock_base_ref = Mock()
         mock_base_ref.object.sha = "base_sha_123"
-        mock_repo.get_git_ref.side_effect = [
-            mock_base_ref,
-            Exception("Branch not found"),
+        mock_repo.get_git_ref.return_value = mock_base_ref
+        mock_repo.owner.login = "owner"
+
+        # the lazy pulls list only fails once it is iterated
+        mock_pulls = Mock()
+        mock_pulls.__iter__ = Mock(side_effect=Exception("API error"))
+        mock_repo.get_pulls.return_value = mock_pulls
+
+        mock_contents = Mock(spec=ContentFile)
+        mock_contents.decoded_content = b"old content\n"
+        mock_contents.sha = "file_sha_123"
+        mock_repo.get_contents.return_value = mock_contents
+        mock_repo.create_pull.return_value = Mock(html_url="https://pr/1")
+
+        github_client.client.get_repo = Mock(return_value=mock_repo)
+        mock_repo.get_git_matching_refs.return_value = [
+            Mock(ref="refs/heads/update-plugin")
         ]
+
+        result = github_client.create_pull_request(
+            repo_full_name="owner/repo",
+            file_path="config.yaml",
+            new_content="new content",
+            branch_name="update-plugin",
+            pr_title="Update plugin",
+            pr_body="Update plugin to version 1.0.0",
+            base_branch="main",
+        )
+
+        assert result == "https://pr/1"
+        mock_repo.update_file.assert_called_once()
+        mock_repo.create_git_ref.assert_not_called()
+        # the existing branch holds its own version of the file
+        mock_repo.get_contents.assert_called_once_with(
+            "config.yaml", ref="update-plugin"
+        )
+
+    def test_create_pr_file_update_failure(
+        self, github_client: "GithubAPIClient"
+    ) -> "None":
+        mock_repo = Mock()
+        mock_base_ref = Mock()
+        mock_base_ref.object.sha = "base_sha_123"
+        mock_repo.get_git_ref.return_value = mock_base_ref
+        mock_repo.get_git_matching_refs.return_value = []
         mock_repo.create_git_ref.return_value = Mock()
         mock_repo.get_contents.side_effect = Exception("File not found")
 
@@ -640,10 +1326,8 @@ class TestCreatePullRequest:
         mock_repo = Mock()
         mock_base_ref = Mock()
         mock_base_ref.object.sha = "base_sha_123"
-        mock_repo.get_git_ref.side_effect = [
-            mock_base_ref,
-            Exception("Branch not found"),
-        ]
+        mock_repo.get_git_ref.return_value = mock_base_ref
+        mock_repo.get_git_matching_refs.return_value = []
         mock_repo.create_git_ref.return_value = Mock()
 
         mock_contents = Mock(spec=ContentFile)
@@ -674,10 +1358,8 @@ class TestCreatePullRequest:
         mock_repo = Mock()
         mock_base_ref = Mock()
         mock_base_ref.object.sha = "base_sha_123"
-        mock_repo.get_git_ref.side_effect = [
-            mock_base_ref,
-            Exception("Branch not found"),
-        ]
+        mock_repo.get_git_ref.return_value = mock_base_ref
+        mock_repo.get_git_matching_refs.return_value = []
         mock_repo.create_git_ref.return_value = Mock()
 
         mock_contents = Mock(spec=ContentFile)
@@ -713,20 +1395,10 @@ class TestCreatePullRequest:
         mock_base_ref.object.sha = "base_sha_123"
 
         mock_branch_ref = Mock()
-
-        def get_git_ref_side_effect(ref_name):
-            if ref_name == "heads/main":
-                return mock_base_ref
-            elif ref_name == "heads/update-plugin":
-                if get_git_ref_side_effect.call_count == 0:
-                    get_git_ref_side_effect.call_count += 1
-                    raise Exception("Branch not found")
-                else:
-                    return mock_branch_ref
-            return Mock()
-
-        get_git_ref_side_effect.call_count = 0
-        mock_repo.get_git_ref.side_effect = get_git_ref_side_effect
+        mock_repo.get_git_ref.side_effect = lambda ref_name: (
+            mock_base_ref if ref_name == "heads/main" else mock_branch_ref
+        )
+        mock_repo.get_git_matching_refs.return_value = []
         mock_repo.create_git_ref.return_value = Mock()
 
         mock_contents = Mock(spec=ContentFile)
@@ -751,6 +1423,8 @@ class TestCreatePullRequest:
 
         assert "Failed to create PR" in str(exc_info.value)
         mock_branch_ref.delete.assert_called_once()
+        # the deleted branch is dropped from the listing again
+        assert "update-plugin" not in github_client.list_update_branches("owner/repo")
 
     def test_create_pr_handles_branch_deletion_failure(
         self, github_client: "GithubAPIClient"
@@ -759,19 +1433,13 @@ class TestCreatePullRequest:
         mock_base_ref = Mock()
         mock_base_ref.object.sha = "base_sha_123"
 
-        def get_git_ref_side_effect(ref_name):
+        def get_git_ref_side_effect(ref_name: "str") -> "Mock":
             if ref_name == "heads/main":
                 return mock_base_ref
-            elif ref_name == "heads/update-plugin":
-                if get_git_ref_side_effect.call_count == 0:
-                    get_git_ref_side_effect.call_count += 1
-                    raise Exception("Branch not found")
-                else:
-                    raise Exception("Cannot get branch for deletion")
-            return Mock()
-
-        get_git_ref_side_effect.call_count = 0
+            raise Exception("Cannot get branch for deletion")
+
         mock_repo.get_git_ref.side_effect = get_git_ref_side_effect
+        mock_repo.get_git_matching_refs.return_value = []
         mock_repo.create_git_ref.return_value = Mock()
 
         mock_contents = Mock(spec=ContentFile)
@@ -795,3 +1463,33 @@ class TestCreatePullRequest:
             )
 
         assert "Failed to create PR" in str(exc_info.value)
+        # the branch could not be deleted, so it is still listed
+        assert "update-plugin" in github_client.list_update_branches("owner/repo")
+
+    @patch(
+        "src.github_api_client.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.SEPARATE
+    )
+    def test_create_pr_falls_back_to_branch_lookup(
+        self, github_client: "GithubAPIClient"
+    ) -> "None":
+        mock_repo = Mock()
+        mock_base_ref = Mock()
+        mock_base_ref.object.sha = "base_sha_123"
+        mock_repo.get_git_ref.return_value = mock_base_ref
+        mock_repo.get_git_matching_refs.side_effect = Exception("API error")
+
+        github_client.client.get_repo = Mock(return_value=mock_repo)
+
+        # the listing failed, so the branch is looked up on its own
+        with pytest.raises(GithubPRFailedException, match="already exists"):
+            github_client.create_pull_request(
+                repo_full_name="owner/repo",
+                file_path="config.yaml",
+                new_content="new content",
+                branch_name="update-plugin",
+                pr_title="Update plugin",
+                pr_body="Update plugin to version 1.0.0",
+                base_branch="main",
+            )
+
+        mock_repo.get_git_ref.assert_any_call("heads/update-plugin")
@@ -1,13 +1,17 @@
+import json
 import tempfile
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 import yaml
 from packaging.version import Version
 
+import src.loader as loader_module
 from src.exceptions import InvalidRHDHPluginPackageDefinitionException
 from src.loader import RHDHPluginsConfigLoader
+from src.types import RHDHPluginUpdaterConfig
 
 
 class TestRHDHPluginsConfigLoader:
@@ -20,6 +24,25 @@ class TestRHDHPluginsConfigLoader:
         assert loader.config_path == "dynamic-plugins.yaml"
         assert loader.config_location == "global.dynamic.plugins"
 
+    @pytest.mark.skipif(not yaml.__with_libyaml__, reason="libyaml not available")
+    def test_uses_libyaml_loader_when_available(self) -> "None":
+        assert loader_module.SafeLoader is yaml.CSafeLoader
+
+    def test_warns_once_about_missing_libyaml_on_load(
+        self,
+        temp_yaml_file: "str",
+        monkeypatch: "pytest.MonkeyPatch",
+        caplog: "Any",
+    ) -> "None":
+        monkeypatch.setattr(loader_module, "_warn_missing_libyaml", True)
+        loader = RHDHPluginsConfigLoader(config_path=temp_yaml_file)
+
+        with caplog.at_level("WARNING"):
+            loader.load_rhdh_plugins()
+            loader.load_rhdh_plugins()
+
+        assert caplog.text.count("libyaml is not available") == 1
+
     def test_init_with_custom_values(self) -> "None":
         loader = RHDHPluginsConfigLoader(
             config_path="/custom/path.yaml", config_location="custom.location"
@@ -50,11 +73,11 @@ class TestRHDHPluginsConfigLoader:
         result = loader._parse_package_string(package)
 
         assert (
-            result["package_name"]
+            result.package_name
             == "rhdh-plugin-export-overlays/backstage-plugin-mcp-actions-backend"
         )
-        assert result["version"] == Version("0.1.2")
-        assert result["plugin_name"] == "backstage-plugin-mcp-actions-backend"
+        assert result.version == Version("0.1.2")
+        assert result.plugin_name == "backstage-plugin-mcp-actions-backend"
 
     def test_parse_package_string_invalid_no_oci_prefix(self) -> "None":
         loader = RHDHPluginsConfigLoader()
@@ -72,11 +95,11 @@ class TestRHDHPluginsConfigLoader:
         result = loader._parse_package_string(package)
 
         assert (
-            result["package_name"]
+            result.package_name
             == "rhdh-plugin-export-overlays/backstage-plugin-mcp-actions-backend"
         )
-        assert result["version"] == Version("1.0.0")
-        assert result["plugin_name"] == "backstage-plugin-mcp-actions-backend"
+        assert result.version == Version("1.0.0")
+        assert result.plugin_name == "backstage-plugin-mcp-actions-backend"
 
     def test_parse_package_string_invalid_no_colon(self) -> "None":
         loader = RHDHPluginsConfigLoader()
@@ -105,6 +128,15 @@ class TestRHDHPluginsConfigLoader:
 
         assert "not valid for package" in str(exc_info.value)
 
+    def test_parse_package_string_invalid_too_many_image_ref_parts(self) -> "None":
+        loader = RHDHPluginsConfigLoader()
+        package = "oci://ghcr.io/redhat-developer/extra/rhdh-plugin-export-overlays/plugin:next__1.0.0!plugin"
+
+        with pytest.raises(InvalidRHDHPluginPackageDefinitionException) as exc_info:
+            loader._parse_package_string(package)
+
+        assert "Invalid RHDH plugin package definition" in str(exc_info.value)
+
     def test_parse_package_string_handles_complex_plugin_names(self) -> "None":
         loader = RHDHPluginsConfigLoader()
         package = "oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool:next__0.2.0!red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool"
@@ -112,10 +144,10 @@ class TestRHDHPluginsConfigLoader:
         result = loader._parse_package_string(package)
 
         assert (
-            result["plugin_name"]
+            result.plugin_name
             == "red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool"
         )
-        assert result["version"] == Version("0.2.0")
+        assert result.version == Version("0.2.0")
 
     def test_convert_rhdhplugin_list_filters_non_rhdh_plugins(
         self, sample_config_data: "dict[str, Any]"
@@ -167,6 +199,150 @@ class TestRHDHPluginsConfigLoader:
         assert all(hasattr(plugin, "plugin_name") for plugin in plugins)
         assert all(hasattr(plugin, "current_version") for plugin in plugins)
 
+    def test_load_plugins_subtree(self) -> "None":
+        loader = RHDHPluginsConfigLoader(config_location="global.dynamic.plugins")
+        content = """other:
+  huge: [1, 2, 3]
+global:
+  dynamic:
+    plugins:
+      - package: oci://example/plugin:next__1.0.0
+        disabled: false
+"""
+
+        result = loader._load_plugins_subtree(content)
+
+        assert result == [
+            {"package": "oci://example/plugin:next__1.0.0", "disabled": False}
+        ]
+
+    def test_load_plugins_subtree_takes_last_duplicate_key(self) -> "None":
+        loader = RHDHPluginsConfigLoader(config_location="global.dynamic.plugins")
+        content = """global:
+  dynamic:
+    plugins:
+      - package: oci://example/old:next__1.0.0
+    plugins:
+      - package: oci://example/new:next__1.0.0
+"""
+
+        result = loader._load_plugins_subtree(content)
+
+        assert result == [{"package": "oci://example/new:next__1.0.0"}]
+        assert result == yaml.safe_load(content)["global"]["dynamic"]["plugins"]
+
+    def test_load_plugins_subtree_missing_location(self) -> "None":
+        loader = RHDHPluginsConfigLoader(config_location="global.dynamic.plugins")
+
+        assert loader._load_plugins_subtree("global:\n  other: true\n") is None
+        assert loader._load_plugins_subtree("global: [1, 2]\n") is None
+
+    def test_load_rhdh_plugins_falls_back_to_full_load(self, tmp_path: "Any") -> "None":
+        # the merge key hides the location from the node lookup
+        config_file = tmp_path / "dynamic-plugins.yaml"
+        config_file.write_text(
+            """base: &base
+  dynamic:
+    plugins:
+      - disabled: false
+        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/test-plugin:next__1.0.0
+global:
+  <<: *base
+"""
+        )
+        loader = RHDHPluginsConfigLoader(
+            config_path=str(config_file), config_location="global.dynamic.plugins"
+        )
+
+        plugins = loader.load_rhdh_plugins()
+
+        assert len(plugins) == 1
+        assert plugins[0].plugin_name == "test-plugin"
+
+    def test_load_rhdh_plugins_uses_cache_when_unchanged(
+        self, temp_config_file: "str", tmp_path: "Any"
+    ) -> "None":
+        loader = RHDHPluginsConfigLoader(
+            config_path=temp_config_file, cache_dir=str(tmp_path)
+        )
+        plugins = loader.load_rhdh_plugins()
+
+        with patch.object(loader, "_convert_rhdhplugin_list") as mock_convert:
+            cached_plugins = loader.load_rhdh_plugins()
+
+        mock_convert.assert_not_called()
+        assert cached_plugins == plugins
+
+    def test_load_rhdh_plugins_invalidates_cache_on_change(
+        self, temp_config_file: "str", tmp_path: "Any"
+    ) -> "None":
+        loader = RHDHPluginsConfigLoader(
+            config_path=temp_config_file, cache_dir=str(tmp_path)
+        )
+        loader.load_rhdh_plugins()
+
+        with open(temp_config_file, "a") as f:
+            f.write("\n# changed\n")
+
+        with patch.object(
+            loader, "_convert_rhdhplugin_list", return_value=[]
+        ) as mock_convert:
+            assert loader.load_rhdh_plugins() == []
+
+        mock_convert.assert_called_once()
+
+    def test_load_rhdh_plugins_caches_json_primitives(
+        self, temp_config_file: "str", tmp_path: "Any"
+    ) -> "None":
+        loader = RHDHPluginsConfigLoader(
+            config_path=temp_config_file, cache_dir=str(tmp_path)
+        )
+        plugins = loader.load_rhdh_plugins()
+
+        cache_file = tmp_path / RHDHPluginUpdaterConfig.PLUGINS_CACHE_FILE_NAME
+        cached = json.loads(cache_file.read_text())
+
+        assert [entry["current_version"] for entry in cached["plugins"]] == [
+            str(plugin.current_version) for plugin in plugins
+        ]
+
+    def test_load_rhdh_plugins_invalidates_cache_on_format_version(
+        self, temp_config_file: "str", tmp_path: "Any"
+    ) -> "None":
+        loader = RHDHPluginsConfigLoader(
+            config_path=temp_config_file, cache_dir=str(tmp_path)
+        )
+        loader.load_rhdh_plugins()
+
+        with (
+            patch.object(
+                RHDHPluginUpdaterConfig,
+                "PLUGINS_CACHE_VERSION",
+                RHDHPluginUpdaterConfig.PLUGINS_CACHE_VERSION + 1,
+            ),
+            patch.object(
+                loader, "_convert_rhdhplugin_list", return_value=[]
+            ) as mock_convert,
+        ):
+            assert loader.load_rhdh_plugins() == []
+
+        mock_convert.assert_called_once()
+
+    def test_load_rhdh_plugins_ignores_malformed_cache(
+        self, temp_config_file: "str", tmp_path: "Any"
+    ) -> "None":
+        loader = RHDHPluginsConfigLoader(
+            config_path=temp_config_file, cache_dir=str(tmp_path)
+        )
+        plugins = loader.load_rhdh_plugins()
+
+        cache_file = tmp_path / RHDHPluginUpdaterConfig.PLUGINS_CACHE_FILE_NAME
+        cached = json.loads(cache_file.read_text())
+        cached["plugins"][0]["current_version"] = "not a version"
+        cache_file.write_text(json.dumps(cached))
+
+        assert loader.load_rhdh_plugins() == plugins
+
     def test_load_rhdh_plugins_file_not_found(self) -> "None":
         loader = RHDHPluginsConfigLoader(config_path="/non/existent/file.yaml")
 
@@ -237,6 +413,18 @@ class TestRHDHPluginsConfigLoader:
         # should not match since prefix must be at the start
         assert result is None
 
+    def test_match_tag_prefix_prefers_longest_overlapping_prefix(self) -> "None":
+        from unittest.mock import patch
+
+        from src.utils import match_tag_prefix
+
+        with patch(
+            "src.types.RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX",
+            ["next__", "next__rc__"],
+        ):
+            assert match_tag_prefix("next__rc__1.0.0") == "next__rc__"
+            assert match_tag_prefix("next__1.0.0") == "next__"
+
     def test_parse_package_string_with_different_prefix(self) -> "None":
         from unittest.mock import patch
 
@@ -250,11 +438,11 @@ class TestRHDHPluginsConfigLoader:
             result = loader._parse_package_string(package)
 
         assert (
-            result["package_name"]
+            result.package_name
             == "rhdh-plugin-export-overlays/backstage-plugin-mcp-actions-backend"
         )
-        assert result["version"] == Version("0.1.2")
-        assert result["plugin_name"] == "backstage-plugin-mcp-actions-backend"
+        assert result.version == Version("0.1.2")
+        assert result.plugin_name == "backstage-plugin-mcp-actions-backend"
 
     def test_parse_package_string_with_multiple_prefixes_configured(self) -> "None":
         from unittest.mock import patch
@@ -268,8 +456,8 @@ class TestRHDHPluginsConfigLoader:
         ):
             result = loader._parse_package_string(package)
 
-        assert result["version"] == Version("2.0.0")
-        assert result["plugin_name"] == "test-plugin"
+        assert result.version == Version("2.0.0")
+        assert result.plugin_name == "test-plugin"
 
     def test_parse_package_string_with_dual_version(self) -> "None":
         loader = RHDHPluginsConfigLoader()
@@ -277,10 +465,10 @@ class TestRHDHPluginsConfigLoader:
 
         result = loader._parse_package_string(package)
 
-        assert result["package_name"] == "rhdh-plugin-export-overlays/backstage-plugin"
-        assert result["version"] == Version("1.42.5")
-        assert result["second_version"] == Version("0.1.0")
-        assert result["plugin_name"] == "backstage-plugin"
+        assert result.package_name == "rhdh-plugin-export-overlays/backstage-plugin"
+        assert result.version == Version("1.42.5")
+        assert result.second_version == Version("0.1.0")
+        assert result.plugin_name == "backstage-plugin"
 
     def test_parse_package_string_with_dual_version_complex(self) -> "None":
         loader = RHDHPluginsConfigLoader()
@@ -288,8 +476,8 @@ class TestRHDHPluginsConfigLoader:
 
         result = loader._parse_package_string(package)
 
-        assert result["version"] == Version("2.10.15")
-        assert result["second_version"] == Version("1.5.3")
+        assert result.version == Version("2.10.15")
+        assert result.second_version == Version("1.5.3")
 
     def test_parse_package_string_single_version_has_no_second_version(
         self,
@@ -299,8 +487,8 @@ class TestRHDHPluginsConfigLoader:
 
         result = loader._parse_package_string(package)
 
-        assert result["version"] == Version("1.0.0")
-        assert result["second_version"] is None
+        assert result.version == Version("1.0.0")
+        assert result.second_version is None
 
     def test_convert_rhdhplugin_list_with_dual_version_plugins(self) -> "None":
         loader = RHDHPluginsConfigLoader()
@@ -331,10 +519,10 @@ class TestRHDHPluginsConfigLoader:
 
         result = loader._parse_package_string(package)
 
-        assert result["package_name"] == "rhdh-plugin-export-overlays/backstage-plugin"
-        assert result["version"] == Version("1.42.5")
-        assert result["second_version"] == Version("0.1.0")
-        assert result["plugin_name"] == "backstage-plugin"
+        assert result.package_name == "rhdh-plugin-export-overlays/backstage-plugin"
+        assert result.version == Version("1.42.5")
+        assert result.second_version == Version("0.1.0")
+        assert result.plugin_name == "backstage-plugin"
 
     def test_convert_rhdhplugin_list_without_exclamation(self) -> "None":
         loader = RHDHPluginsConfigLoader()
@@ -371,6 +559,6 @@ class TestRHDHPluginsConfigLoader:
         ):
             result = loader._parse_package_string(package)
 
-        assert result["version"] == Version("1.43.0")
-        assert result["second_version"] == Version("0.2.0")
-        assert result["plugin_name"] == "test-plugin"
+        assert result.version == Version("1.43.0")
+        assert result.second_version == Version("0.2.0")
+        assert result.plugin_name == "test-plugin"
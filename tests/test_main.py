@@ -1,4 +1,8 @@
-from typing import Any
+import sys
+import threading
+from contextlib import nullcontext
+from dataclasses import replace
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 
 import pytest
@@ -9,591 +13,464 @@ from src.exceptions import GithubPRFailedException
 from src.types import (
     GithubPullRequestStrategy,
     RHDHPlugin,
-    RHDHPluginPackage,
     RHDHPluginPackageVersion,
 )
 
 
+@pytest.mark.usefixtures("main_env")
 class TestMain:
     """
     handles all tests for main.
     """
 
     @patch("main.GITHUB_REPOSITORY", None)
-    @patch("main.GITHUB_TOKEN", "test_token")
-    def test_main_no_GITHUB_REPOSITORY(self, capsys: "Any") -> "None":
+    def test_main_no_GITHUB_REPOSITORY(self) -> "None":
         # should log error and return without raising exception
         main()
 
-    @patch("main.GITHUB_REPOSITORY", "owner/repo")
     @patch("main.GITHUB_TOKEN", None)
-    def test_main_no_github_token(self, capsys: "Any") -> "None":
+    def test_main_no_github_token(self) -> "None":
         # should log error and return without raising exception
         main()
 
-    @patch("main.GITHUB_REPOSITORY", "owner/repo")
-    @patch("main.GITHUB_TOKEN", "test_token")
-    @patch("main.GithubAPIClient")
-    @patch("main.RHDHPluginsConfigLoader")
-    @patch("main.RHDHPluginConfigUpdater")
-    def test_main_no_plugins_found(
-        self, mock_updater_class: "Any", mock_loader_class: "Any", mock_api_class: "Any"
-    ) -> "None":
-        mock_loader = Mock()
+    def test_main_no_plugins_found(self, main_mocks: "SimpleNamespace") -> "None":
+
+        mock_loader = main_mocks.loader
         mock_loader.load_rhdh_plugins.return_value = []
-        mock_loader_class.return_value = mock_loader
 
         main()
 
         mock_loader.load_rhdh_plugins.assert_called_once()
+        main_mocks.api.fetch_latest_version.assert_not_called()
 
-    @patch("main.GITHUB_REPOSITORY", "owner/repo")
-    @patch("main.GITHUB_TOKEN", "test_token")
     @patch("main.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.SEPARATE)
-    @patch("main.PR_CREATION_LIMIT", 0)
-    @patch("main.GithubAPIClient")
-    @patch("main.RHDHPluginsConfigLoader")
-    @patch("main.RHDHPluginConfigUpdater")
-    def test_main_with_plugins_up_to_date(
-        self, mock_updater_class: "Any", mock_loader_class: "Any", mock_api_class: "Any"
+    def test_main_without_updates_does_not_import_pygithub(
+        self, monkeypatch: "pytest.MonkeyPatch", base_plugin: "RHDHPlugin"
     ) -> "None":
-        mock_plugin = RHDHPlugin(
-            package_name="test-package",
-            current_version=Version("1.0.0"),
-            plugin_name="test-plugin",
-            disabled=False,
+        # the real client is used, so only the version lookup is faked
+        loader_class = Mock()
+        loader_class.return_value.load_rhdh_plugins.return_value = [base_plugin]
+        monkeypatch.setattr("main.RHDHPluginsConfigLoader", loader_class)
+        monkeypatch.setattr("main.RHDHPluginConfigUpdater", Mock())
+        monkeypatch.setattr(
+            "src.github_api_client.GithubAPIClient.fetch_latest_version",
+            lambda self, package_name, tag_prefix_filter=None: RHDHPluginPackageVersion(
+                name="12345",
+                version=base_plugin.current_version,
+                created_at="2024-01-15T10:00:00Z",
+            ),
         )
+        for name in list(sys.modules):
+            if name == "github" or name.startswith("github."):
+                monkeypatch.delitem(sys.modules, name)
 
-        mock_loader = Mock()
-        mock_loader.load_rhdh_plugins.return_value = [mock_plugin]
-        mock_loader_class.return_value = mock_loader
+        main()
+
+        assert "github" not in sys.modules
 
-        mock_api = Mock()
-        mock_package = RHDHPluginPackage(
-            name="test-package",
-            versions=[
+    @pytest.mark.parametrize(
+        "latest_version",
+        [
+            pytest.param(
                 RHDHPluginPackageVersion(
                     name="12345",
                     version=Version("1.0.0"),
                     created_at="2024-01-15T10:00:00Z",
-                )
-            ],
-        )
-        mock_api.fetch_package.return_value = mock_package
-        mock_api_class.return_value = mock_api
+                ),
+                id="plugins_up_to_date",
+            ),
+            pytest.param(None, id="skips_packages_without_versions"),
+        ],
+    )
+    @patch("main.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.SEPARATE)
+    @patch("main.PR_CREATION_LIMIT", 0)
+    def test_main_without_newer_version(
+        self,
+        main_mocks: "SimpleNamespace",
+        base_plugin: "RHDHPlugin",
+        latest_version: "RHDHPluginPackageVersion | None",
+    ) -> "None":
+        mock_plugin = base_plugin
+
+        mock_loader = main_mocks.loader
+        mock_loader.load_rhdh_plugins.return_value = [mock_plugin]
+
+        mock_api = main_mocks.api
+        mock_api.fetch_latest_version.return_value = latest_version
+
+        mock_updater = main_mocks.updater
 
         main()
 
         mock_loader.load_rhdh_plugins.assert_called_once()
-        mock_api.fetch_package.assert_called_once_with(
-            "test-package", tag_prefix_filter=None
+
+        mock_api.fetch_latest_version.assert_called_once_with(
+            "test-package",
+            tag_prefix_filter=None,
         )
-        # no pr should be created
+
+        # no updates should be attempted, nor pr created
+        mock_updater.update_rhdh_plugin.assert_not_called()
         mock_api.create_pull_request.assert_not_called()
 
-    @patch("main.GITHUB_REPOSITORY", "owner/repo")
-    @patch("main.GITHUB_TOKEN", "test_token")
-    @patch("main.GITHUB_REF", "main")
-    @patch(
-        "main.DYNAMIC_PLUGINS_CONFIG_YAML_FILE_PATH",
-        "dynamic-plugins.yaml",
-    )
     @patch("main.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.SEPARATE)
     @patch("main.PR_CREATION_LIMIT", 0)
-    @patch("main.GithubAPIClient")
-    @patch("main.RHDHPluginsConfigLoader")
-    @patch("main.RHDHPluginConfigUpdater")
     def test_main_with_plugin_update_separate_strategy(
-        self, mock_updater_class: "Any", mock_loader_class: "Any", mock_api_class: "Any"
+        self,
+        main_mocks: "SimpleNamespace",
+        base_plugin: "RHDHPlugin",
     ) -> "None":
-        mock_plugin = RHDHPlugin(
-            package_name="test-package",
-            current_version=Version("1.0.0"),
-            plugin_name="test-plugin",
-            disabled=False,
-        )
+        mock_plugin = base_plugin
 
-        mock_loader = Mock()
+        mock_loader = main_mocks.loader
         mock_loader.load_rhdh_plugins.return_value = [mock_plugin]
-        mock_loader_class.return_value = mock_loader
 
-        mock_api = Mock()
-        mock_package = RHDHPluginPackage(
-            name="test-package",
-            versions=[
-                RHDHPluginPackageVersion(
-                    name="12345",
-                    version=Version("1.0.0"),
-                    created_at="2024-01-15T10:00:00Z",
-                ),
-                RHDHPluginPackageVersion(
-                    name="12346",
-                    version=Version("1.1.0"),
-                    created_at="2024-01-20T10:00:00Z",
-                ),
-            ],
+        mock_api = main_mocks.api
+        mock_package_version = RHDHPluginPackageVersion(
+            name="12346",
+            version=Version("1.1.0"),
+            created_at="2024-01-20T10:00:00Z",
         )
-        mock_api.fetch_package.return_value = mock_package
+        mock_api.fetch_latest_version.return_value = mock_package_version
         mock_api.create_pull_request.return_value = (
             "https://github.com/owner/repo/pull/1"
         )
-        mock_api_class.return_value = mock_api
 
-        mock_updater = Mock()
+        mock_updater = main_mocks.updater
         mock_updater.update_rhdh_plugin.return_value = "updated yaml content"
-        mock_updater_class.return_value = mock_updater
 
         main()
 
         mock_loader.load_rhdh_plugins.assert_called_once()
-        mock_api.fetch_package.assert_called_once_with(
-            "test-package", tag_prefix_filter=None
+
+        mock_api.fetch_latest_version.assert_called_once_with(
+            "test-package",
+            tag_prefix_filter=None,
         )
         mock_updater.update_rhdh_plugin.assert_called_once_with(
             mock_plugin, Version("1.1.0"), None
         )
         mock_api.create_pull_request.assert_called_once()
 
-    @patch("main.GITHUB_REPOSITORY", "owner/repo")
-    @patch("main.GITHUB_TOKEN", "test_token")
-    @patch("main.GITHUB_REF", "main")
+    @pytest.mark.parametrize("plugin_set", [1, 2, 5], indirect=True)
     @patch("main.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.JOINT)
     @patch("main.PR_CREATION_LIMIT", 0)
-    @patch("main.GithubAPIClient")
-    @patch("main.RHDHPluginsConfigLoader")
-    @patch("main.RHDHPluginConfigUpdater")
     def test_main_with_plugin_update_joint_strategy(
-        self, mock_updater_class: "Any", mock_loader_class: "Any", mock_api_class: "Any"
+        self, main_mocks: "SimpleNamespace", plugin_set: "list[RHDHPlugin]"
     ) -> "None":
-        mock_plugin1 = RHDHPlugin(
-            package_name="test-package-1",
-            current_version=Version("1.0.0"),
-            plugin_name="test-plugin-1",
-            disabled=False,
-        )
-        mock_plugin2 = RHDHPlugin(
-            package_name="test-package-2",
-            current_version=Version("2.0.0"),
-            plugin_name="test-plugin-2",
-            disabled=False,
-        )
-
-        mock_loader = Mock()
-        mock_loader.load_rhdh_plugins.return_value = [mock_plugin1, mock_plugin2]
-        mock_loader_class.return_value = mock_loader
-
-        mock_api = Mock()
-
-        def fetch_package_side_effect(
-            package_name: "str", tag_prefix_filter: "str | None" = None
-        ) -> "RHDHPluginPackage":
-            if package_name == "test-package-1":
-                return RHDHPluginPackage(
-                    name="test-package-1",
-                    versions=[
-                        RHDHPluginPackageVersion(
-                            name="12345",
-                            version=Version("1.0.0"),
-                            created_at="2024-01-15T10:00:00Z",
-                        ),
-                        RHDHPluginPackageVersion(
-                            name="12346",
-                            version=Version("1.1.0"),
-                            created_at="2024-01-20T10:00:00Z",
-                        ),
-                    ],
-                )
-            return RHDHPluginPackage(
-                name="test-package-2",
-                versions=[
-                    RHDHPluginPackageVersion(
-                        name="22345",
-                        version=Version("2.0.0"),
-                        created_at="2024-01-15T10:00:00Z",
-                    ),
-                    RHDHPluginPackageVersion(
-                        name="22346",
-                        version=Version("2.1.0"),
-                        created_at="2024-01-20T10:00:00Z",
-                    ),
-                ],
+        mock_loader = main_mocks.loader
+        mock_loader.load_rhdh_plugins.return_value = plugin_set
+
+        # every plugin i.0.0 has a newer i.1.0 version
+        newer_versions = {
+            plugin.package_name: RHDHPluginPackageVersion(
+                name=f"{i}2346",
+                version=Version(f"{i}.1.0"),
+                created_at="2024-01-20T10:00:00Z",
             )
-
-        mock_api.fetch_package.side_effect = fetch_package_side_effect
+            for i, plugin in enumerate(plugin_set, start=1)
+        }
+        mock_api = main_mocks.api
+        mock_api.fetch_latest_version.side_effect = lambda package_name, **_: (
+            newer_versions[package_name]
+        )
         mock_api.create_pull_request.return_value = (
             "https://github.com/owner/repo/pull/1"
         )
-        mock_api_class.return_value = mock_api
+        main_mocks.api = mock_api
 
-        mock_updater = Mock()
+        mock_updater = main_mocks.updater
         mock_updater.bulk_update_rhdh_plugins.return_value = "updated yaml content"
-        mock_updater_class.return_value = mock_updater
 
         main()
 
         mock_loader.load_rhdh_plugins.assert_called_once()
-        assert mock_api.fetch_package.call_count == 2
+
+        assert mock_api.fetch_latest_version.call_count == len(plugin_set)
         # Should create a single joint PR
         mock_updater.bulk_update_rhdh_plugins.assert_called_once()
+        assert len(mock_updater.bulk_update_rhdh_plugins.call_args[0][0]) == len(
+            plugin_set
+        )
         mock_api.create_pull_request.assert_called_once()
 
-    @patch("main.GITHUB_REPOSITORY", "owner/repo")
-    @patch("main.GITHUB_TOKEN", "test_token")
+        # the PR body lists every plugin, in config order
+        pr_body = mock_api.create_pull_request.call_args[1]["pr_body"]
+        lines = [
+            f"- **test-plugin-{i}**: `{i}.0.0` → `{i}.1.0`\n"
+            for i in range(1, len(plugin_set) + 1)
+        ]
+        positions = [pr_body.index(line) for line in lines]
+        assert positions == sorted(positions)
+
     @patch("main.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.SEPARATE)
     @patch("main.PR_CREATION_LIMIT", 1)
-    @patch("main.GithubAPIClient")
-    @patch("main.RHDHPluginsConfigLoader")
-    @patch("main.RHDHPluginConfigUpdater")
     def test_main_respects_pr_creation_limit(
-        self, mock_updater_class: "Any", mock_loader_class: "Any", mock_api_class: "Any"
+        self,
+        main_mocks: "SimpleNamespace",
+        plugin_pair: "tuple[RHDHPlugin, RHDHPlugin]",
+        newer_versions_by_name: "dict[str, RHDHPluginPackageVersion]",
     ) -> "None":
-        mock_plugin1 = RHDHPlugin(
-            package_name="test-package-1",
-            current_version=Version("1.0.0"),
-            plugin_name="test-plugin-1",
-            disabled=False,
-        )
-        mock_plugin2 = RHDHPlugin(
-            package_name="test-package-2",
-            current_version=Version("2.0.0"),
-            plugin_name="test-plugin-2",
-            disabled=False,
-        )
+        mock_plugin1, mock_plugin2 = plugin_pair
 
-        mock_loader = Mock()
+        mock_loader = main_mocks.loader
         mock_loader.load_rhdh_plugins.return_value = [mock_plugin1, mock_plugin2]
-        mock_loader_class.return_value = mock_loader
-
-        mock_api = Mock()
 
-        def fetch_package_side_effect(
-            package_name: "str", tag_prefix_filter: "str | None" = None
-        ) -> "RHDHPluginPackage":
-            if package_name == "test-package-1":
-                return RHDHPluginPackage(
-                    name="test-package-1",
-                    versions=[
-                        RHDHPluginPackageVersion(
-                            name="12346",
-                            version=Version("1.1.0"),
-                            created_at="2024-01-20T10:00:00Z",
-                        ),
-                    ],
-                )
-            return RHDHPluginPackage(
-                name="test-package-2",
-                versions=[
-                    RHDHPluginPackageVersion(
-                        name="22346",
-                        version=Version("2.1.0"),
-                        created_at="2024-01-20T10:00:00Z",
-                    ),
-                ],
-            )
+        mock_api = main_mocks.api
 
-        mock_api.fetch_package.side_effect = fetch_package_side_effect
+        mock_api.fetch_latest_version.side_effect = lambda package_name, **_: (
+            newer_versions_by_name[package_name]
+        )
         mock_api.create_pull_request.return_value = (
             "https://github.com/owner/repo/pull/1"
         )
-        mock_api_class.return_value = mock_api
 
-        mock_updater = Mock()
+        mock_updater = main_mocks.updater
         mock_updater.update_rhdh_plugin.return_value = "updated yaml content"
-        mock_updater_class.return_value = mock_updater
 
         main()
 
+        mock_loader.load_rhdh_plugins.assert_called_once()
+
         # should only create 1 PR due to limit
         assert mock_api.create_pull_request.call_count == 1
 
-    @patch("main.GITHUB_REPOSITORY", "owner/repo")
-    @patch("main.GITHUB_TOKEN", "test_token")
-    @patch("main.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.SEPARATE)
+    @pytest.mark.parametrize(
+        "strategy, expect_exit",
+        [
+            pytest.param(
+                GithubPullRequestStrategy.SEPARATE,
+                False,
+                id="handles_pr_creation_failure",
+            ),
+            pytest.param(
+                GithubPullRequestStrategy.JOINT, True, id="exits_on_joint_pr_failure"
+            ),
+        ],
+    )
     @patch("main.PR_CREATION_LIMIT", 0)
-    @patch("main.GithubAPIClient")
-    @patch("main.RHDHPluginsConfigLoader")
-    @patch("main.RHDHPluginConfigUpdater")
-    def test_main_handles_pr_creation_failure(
-        self, mock_updater_class: "Any", mock_loader_class: "Any", mock_api_class: "Any"
+    def test_main_pr_creation_failure(
+        self,
+        monkeypatch: "pytest.MonkeyPatch",
+        main_mocks: "SimpleNamespace",
+        base_plugin: "RHDHPlugin",
+        strategy: "str",
+        expect_exit: "bool",
     ) -> "None":
-        mock_plugin = RHDHPlugin(
-            package_name="test-package",
-            current_version=Version("1.0.0"),
-            plugin_name="test-plugin",
-            disabled=False,
-        )
+        monkeypatch.setattr("main.UPDATE_PR_STRATEGY", strategy)
 
-        mock_loader = Mock()
-        mock_loader.load_rhdh_plugins.return_value = [mock_plugin]
-        mock_loader_class.return_value = mock_loader
+        mock_loader = main_mocks.loader
+        mock_loader.load_rhdh_plugins.return_value = [base_plugin]
 
-        mock_api = Mock()
-        mock_package = RHDHPluginPackage(
-            name="test-package",
-            versions=[
-                RHDHPluginPackageVersion(
-                    name="12346",
-                    version=Version("1.1.0"),
-                    created_at="2024-01-20T10:00:00Z",
-                ),
-            ],
+        mock_api = main_mocks.api
+        mock_api.fetch_latest_version.return_value = RHDHPluginPackageVersion(
+            name="12346",
+            version=Version("1.1.0"),
+            created_at="2024-01-20T10:00:00Z",
         )
-        mock_api.fetch_package.return_value = mock_package
         mock_api.create_pull_request.side_effect = GithubPRFailedException(
-            "Branch already exists"
+            "Failed to create PR"
         )
-        mock_api_class.return_value = mock_api
+        main_mocks.api = mock_api
 
-        mock_updater = Mock()
+        mock_updater = main_mocks.updater
         mock_updater.update_rhdh_plugin.return_value = "updated yaml content"
-        mock_updater_class.return_value = mock_updater
+        mock_updater.bulk_update_rhdh_plugins.return_value = "updated yaml content"
 
-        # should not raise exception
-        main()
+        # a failed separate PR is skipped, a failed joint PR exits with code 1
+        with pytest.raises(SystemExit) if expect_exit else nullcontext() as exc_info:
+            main()
 
+        mock_loader.load_rhdh_plugins.assert_called_once()
+
+        if expect_exit:
+            assert exc_info.value.code == 1
         mock_api.create_pull_request.assert_called_once()
 
-    @patch("main.GITHUB_REPOSITORY", "owner/repo")
-    @patch("main.GITHUB_TOKEN", "test_token")
-    @patch("main.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.JOINT)
+    @patch("main.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.SEPARATE)
     @patch("main.PR_CREATION_LIMIT", 0)
-    @patch("main.GithubAPIClient")
-    @patch("main.RHDHPluginsConfigLoader")
-    @patch("main.RHDHPluginConfigUpdater")
-    def test_main_exits_on_joint_pr_failure(
-        self, mock_updater_class: "Any", mock_loader_class: "Any", mock_api_class: "Any"
+    def test_main_filters_by_current_tag_prefix(
+        self,
+        main_mocks: "SimpleNamespace",
+        base_plugin: "RHDHPlugin",
     ) -> "None":
-        mock_plugin = RHDHPlugin(
-            package_name="test-package",
-            current_version=Version("1.0.0"),
-            plugin_name="test-plugin",
-            disabled=False,
-        )
+        mock_plugin = replace(base_plugin, current_tag_prefix="next__")
 
-        mock_loader = Mock()
+        mock_loader = main_mocks.loader
         mock_loader.load_rhdh_plugins.return_value = [mock_plugin]
-        mock_loader_class.return_value = mock_loader
 
-        mock_api = Mock()
-        mock_package = RHDHPluginPackage(
-            name="test-package",
-            versions=[
-                RHDHPluginPackageVersion(
-                    name="12346",
-                    version=Version("1.1.0"),
-                    created_at="2024-01-20T10:00:00Z",
-                ),
-            ],
-        )
-        mock_api.fetch_package.return_value = mock_package
-        mock_api.create_pull_request.side_effect = GithubPRFailedException(
-            "Failed to create PR"
+        mock_api = main_mocks.api
+        # Package has both next__ and stable__ versions, but should only return next__
+        mock_package_version = RHDHPluginPackageVersion(
+            name="12345",
+            version=Version("1.0.0"),
+            created_at="2024-01-15T10:00:00Z",
         )
-        mock_api_class.return_value = mock_api
+        mock_api.fetch_latest_version.return_value = mock_package_version
 
-        mock_updater = Mock()
-        mock_updater.bulk_update_rhdh_plugins.return_value = "updated yaml content"
-        mock_updater_class.return_value = mock_updater
+        main()
 
-        # should exit with code 1
-        with pytest.raises(SystemExit) as exc_info:
-            main()
+        mock_loader.load_rhdh_plugins.assert_called_once()
 
-        assert exc_info.value.code == 1
+        # Verify fetch_latest_version was called with the tag_prefix_filter
+        mock_api.fetch_latest_version.assert_called_once_with(
+            "test-package",
+            tag_prefix_filter="next__",
+        )
 
-    @patch("main.GITHUB_REPOSITORY", "owner/repo")
-    @patch("main.GITHUB_TOKEN", "test_token")
     @patch("main.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.SEPARATE)
     @patch("main.PR_CREATION_LIMIT", 0)
-    @patch("main.GithubAPIClient")
-    @patch("main.RHDHPluginsConfigLoader")
-    @patch("main.RHDHPluginConfigUpdater")
-    def test_main_skips_packages_without_versions(
-        self, mock_updater_class: "Any", mock_loader_class: "Any", mock_api_class: "Any"
+    def test_main_prevents_cross_prefix_comparison(
+        self,
+        main_mocks: "SimpleNamespace",
+        base_plugin: "RHDHPlugin",
     ) -> "None":
-        mock_plugin = RHDHPlugin(
-            package_name="test-package",
-            current_version=Version("1.0.0"),
-            plugin_name="test-plugin",
-            disabled=False,
-        )
+        mock_plugin = replace(base_plugin, current_tag_prefix="next__")
 
-        mock_loader = Mock()
+        mock_loader = main_mocks.loader
         mock_loader.load_rhdh_plugins.return_value = [mock_plugin]
-        mock_loader_class.return_value = mock_loader
 
-        mock_api = Mock()
-        mock_package = RHDHPluginPackage(
-            # no versions
-            name="test-package",
-            versions=[],
+        mock_api = main_mocks.api
+        mock_package_version = RHDHPluginPackageVersion(
+            name="12345",
+            version=Version("1.0.0"),  # current version
+            created_at="2024-01-15T10:00:00Z",
         )
-        mock_api.fetch_package.return_value = mock_package
-        mock_api_class.return_value = mock_api
-
-        mock_updater = Mock()
-        mock_updater_class.return_value = mock_updater
+        mock_api.fetch_latest_version.return_value = mock_package_version
 
         main()
 
         mock_loader.load_rhdh_plugins.assert_called_once()
-        mock_api.fetch_package.assert_called_once()
 
-        # no updates should be attempted
-        mock_updater.update_rhdh_plugin.assert_not_called()
         mock_api.create_pull_request.assert_not_called()
 
-    @patch("main.GITHUB_REPOSITORY", "owner/repo")
-    @patch("main.GITHUB_TOKEN", "test_token")
     @patch("main.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.SEPARATE)
     @patch("main.PR_CREATION_LIMIT", 0)
-    @patch("main.GithubAPIClient")
-    @patch("main.RHDHPluginsConfigLoader")
-    @patch("main.RHDHPluginConfigUpdater")
-    def test_main_filters_by_current_tag_prefix(
-        self, mock_updater_class: "Any", mock_loader_class: "Any", mock_api_class: "Any"
+    def test_main_uses_different_prefixes_for_different_plugins(
+        self,
+        main_mocks: "SimpleNamespace",
+        plugin_pair: "tuple[RHDHPlugin, RHDHPlugin]",
     ) -> "None":
-        """Test that plugins are fetched with their specific tag prefix filter"""
-        mock_plugin = RHDHPlugin(
-            package_name="test-package",
-            current_version=Version("1.0.0"),
-            plugin_name="test-plugin",
-            disabled=False,
-            current_tag_prefix="next__",
-        )
+        mock_plugin1 = replace(plugin_pair[0], current_tag_prefix="next__")
+        mock_plugin2 = replace(plugin_pair[1], current_tag_prefix="stable__")
 
-        mock_loader = Mock()
-        mock_loader.load_rhdh_plugins.return_value = [mock_plugin]
-        mock_loader_class.return_value = mock_loader
+        mock_loader = main_mocks.loader
+        mock_loader.load_rhdh_plugins.return_value = [mock_plugin1, mock_plugin2]
 
-        mock_api = Mock()
-        # Package has both next__ and stable__ versions, but should only return next__
-        mock_package = RHDHPluginPackage(
-            name="test-package",
-            versions=[
-                RHDHPluginPackageVersion(
+        mock_api = main_mocks.api
+
+        def fetch_latest_version_side_effect(
+            package_name: "str",
+            tag_prefix_filter: "str | None" = None,
+        ) -> "RHDHPluginPackageVersion":
+            if package_name == "test-package-1":
+                return RHDHPluginPackageVersion(
                     name="12345",
                     version=Version("1.0.0"),
                     created_at="2024-01-15T10:00:00Z",
                 )
-            ],
-        )
-        mock_api.fetch_package.return_value = mock_package
-        mock_api_class.return_value = mock_api
+            return RHDHPluginPackageVersion(
+                name="22345",
+                version=Version("2.0.0"),
+                created_at="2024-01-15T10:00:00Z",
+            )
+
+        mock_api.fetch_latest_version.side_effect = fetch_latest_version_side_effect
 
         main()
 
         mock_loader.load_rhdh_plugins.assert_called_once()
-        # Verify fetch_package was called with the tag_prefix_filter
-        mock_api.fetch_package.assert_called_once_with(
-            "test-package", tag_prefix_filter="next__"
+
+        assert mock_api.fetch_latest_version.call_count == 2
+        mock_api.fetch_latest_version.assert_any_call(
+            "test-package-1",
+            tag_prefix_filter="next__",
+        )
+        mock_api.fetch_latest_version.assert_any_call(
+            "test-package-2",
+            tag_prefix_filter="stable__",
         )
 
-    @patch("main.GITHUB_REPOSITORY", "owner/repo")
-    @patch("main.GITHUB_TOKEN", "test_token")
     @patch("main.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.SEPARATE)
     @patch("main.PR_CREATION_LIMIT", 0)
-    @patch("main.GithubAPIClient")
-    @patch("main.RHDHPluginsConfigLoader")
-    @patch("main.RHDHPluginConfigUpdater")
-    def test_main_prevents_cross_prefix_comparison(
-        self, mock_updater_class: "Any", mock_loader_class: "Any", mock_api_class: "Any"
+    def test_main_fetches_shared_packages_once(
+        self, main_mocks: "SimpleNamespace", base_plugin: "RHDHPlugin"
     ) -> "None":
-        mock_plugin = RHDHPlugin(
-            package_name="test-package",
-            current_version=Version("1.0.0"),
-            plugin_name="test-plugin",
-            disabled=False,
-            current_tag_prefix="next__",
+        plugins = [
+            replace(base_plugin, plugin_name=f"test-plugin-{i}") for i in range(3)
+        ]
+        mock_loader = main_mocks.loader
+        mock_loader.load_rhdh_plugins.return_value = plugins
+
+        mock_api = main_mocks.api
+        mock_api.fetch_latest_version.return_value = RHDHPluginPackageVersion(
+            name="12346",
+            version=Version("1.1.0"),
+            created_at="2024-01-20T10:00:00Z",
         )
-
-        mock_loader = Mock()
-        mock_loader.load_rhdh_plugins.return_value = [mock_plugin]
-        mock_loader_class.return_value = mock_loader
-
-        mock_api = Mock()
-        mock_package = RHDHPluginPackage(
-            name="test-package",
-            versions=[
-                RHDHPluginPackageVersion(
-                    name="12345",
-                    version=Version("1.0.0"),  # current version
-                    created_at="2024-01-15T10:00:00Z",
-                )
-            ],
+        mock_api.create_pull_request.return_value = (
+            "https://github.com/owner/repo/pull/1"
         )
-        mock_api.fetch_package.return_value = mock_package
-        mock_api_class.return_value = mock_api
 
         main()
 
-        mock_api.create_pull_request.assert_not_called()
+        mock_loader.load_rhdh_plugins.assert_called_once()
+
+        # the three plugins share a package, which is looked up once
+        mock_api.fetch_latest_version.assert_called_once_with(
+            "test-package", tag_prefix_filter=None
+        )
+        assert mock_api.create_pull_request.call_count == 3
 
-    @patch("main.GITHUB_REPOSITORY", "owner/repo")
-    @patch("main.GITHUB_TOKEN", "test_token")
     @patch("main.UPDATE_PR_STRATEGY", GithubPullRequestStrategy.SEPARATE)
     @patch("main.PR_CREATION_LIMIT", 0)
-    @patch("main.GithubAPIClient")
-    @patch("main.RHDHPluginsConfigLoader")
-    @patch("main.RHDHPluginConfigUpdater")
-    def test_main_uses_different_prefixes_for_different_plugins(
-        self, mock_updater_class: "Any", mock_loader_class: "Any", mock_api_class: "Any"
+    def test_main_keeps_config_order_with_concurrent_fetches(
+        self,
+        main_mocks: "SimpleNamespace",
+        plugin_pair: "tuple[RHDHPlugin, RHDHPlugin]",
     ) -> "None":
-        mock_plugin1 = RHDHPlugin(
-            package_name="test-package-1",
-            current_version=Version("1.0.0"),
-            plugin_name="test-plugin-1",
-            disabled=False,
-            current_tag_prefix="next__",
-        )
-        mock_plugin2 = RHDHPlugin(
-            package_name="test-package-2",
-            current_version=Version("2.0.0"),
-            plugin_name="test-plugin-2",
-            disabled=False,
-            current_tag_prefix="stable__",
-        )
+        mock_plugin1, mock_plugin2 = plugin_pair
 
-        mock_loader = Mock()
+        mock_loader = main_mocks.loader
         mock_loader.load_rhdh_plugins.return_value = [mock_plugin1, mock_plugin2]
-        mock_loader_class.return_value = mock_loader
-
-        mock_api = Mock()
 
-        def fetch_package_side_effect(
-            package_name: "str", tag_prefix_filter: "str | None" = None
-        ) -> "RHDHPluginPackage":
+        mock_api = main_mocks.api
+        # both fetches must be in flight together to get past the barrier
+        both_in_flight = threading.Barrier(2, timeout=5)
+        second_done = threading.Event()
+
+        def fetch_latest_version_side_effect(
+            package_name: "str",
+            tag_prefix_filter: "str | None" = None,
+        ) -> "RHDHPluginPackageVersion":
+            both_in_flight.wait()
+            # first package resolves last to simulate out of order completion
             if package_name == "test-package-1":
-                return RHDHPluginPackage(
-                    name="test-package-1",
-                    versions=[
-                        RHDHPluginPackageVersion(
-                            name="12345",
-                            version=Version("1.0.0"),
-                            created_at="2024-01-15T10:00:00Z",
-                        )
-                    ],
-                )
-            return RHDHPluginPackage(
-                name="test-package-2",
-                versions=[
-                    RHDHPluginPackageVersion(
-                        name="22345",
-                        version=Version("2.0.0"),
-                        created_at="2024-01-15T10:00:00Z",
-                    )
-                ],
+                assert second_done.wait(timeout=5)
+                version = Version("1.1.0")
+            else:
+                second_done.set()
+                version = Version("2.1.0")
+
+            return RHDHPluginPackageVersion(
+                name="12346",
+                version=version,
+                created_at="2024-01-20T10:00:00Z",
             )
 
-        mock_api.fetch_package.side_effect = fetch_package_side_effect
-        mock_api_class.return_value = mock_api
+        mock_api.fetch_latest_version.side_effect = fetch_latest_version_side_effect
+        mock_api.create_pull_request.return_value = (
+            "https://github.com/owner/repo/pull/1"
+        )
+
+        mock_updater = main_mocks.updater
+        mock_updater.update_rhdh_plugin.return_value = "updated yaml content"
 
         main()
 
-        assert mock_api.fetch_package.call_count == 2
-        mock_api.fetch_package.assert_any_call(
-            "test-package-1", tag_prefix_filter="next__"
-        )
-        mock_api.fetch_package.assert_any_call(
-            "test-package-2", tag_prefix_filter="stable__"
-        )
+        mock_loader.load_rhdh_plugins.assert_called_once()
+
+        updated_plugins = [
+            c.args[0] for c in mock_updater.update_rhdh_plugin.call_args_list
+        ]
+        assert updated_plugins == [mock_plugin1, mock_plugin2]
@@ -25,75 +25,112 @@ class TestRHDHPluginConfigUpdater:
         assert updater.config_path == "/custom/path.yaml"
         assert updater.config_location == "custom.location"
 
-    def test_update_plugin_version_in_content_success(
-        self, sample_yaml_content: "str", sample_plugin: "RHDHPlugin"
+    @pytest.mark.parametrize(
+        "plugin_fixture, new_version, must_contain, must_not_contain, changed",
+        [
+            pytest.param(
+                "sample_plugin",
+                Version("0.1.3"),
+                ["next__0.1.3"],
+                ["next__0.1.2"],
+                True,
+                id="success",
+            ),
+            pytest.param(
+                "sample_plugin",
+                Version("0.1.3"),
+                # check that structure is preserved
+                ["global:", "dynamic:", "plugins:", "disabled: false"],
+                [],
+                True,
+                id="preserves_formatting",
+            ),
+            pytest.param(
+                "non_existent_plugin",
+                Version("1.0.1"),
+                [],
+                [],
+                False,
+                id="no_match",
+            ),
+            pytest.param(
+                "catalog_mcp_tool_plugin",
+                Version("0.2.1"),
+                # the correct plugin is updated and the other one is not affected
+                [
+                    "software-catalog-mcp-tool:next__0.2.1",
+                    "mcp-actions-backend:next__0.1.2",
+                ],
+                [],
+                True,
+                id="updates_correct_plugin_only",
+            ),
+        ],
+    )
+    def test_update_plugin_version_in_content(
+        self,
+        request: "pytest.FixtureRequest",
+        updater: "RHDHPluginConfigUpdater",
+        sample_yaml_content: "str",
+        plugin_fixture: "str",
+        new_version: "Version",
+        must_contain: "list[str]",
+        must_not_contain: "list[str]",
+        changed: "bool",
     ) -> "None":
-        updater = RHDHPluginConfigUpdater()
-        new_version = Version("0.1.3")
+        plugin = request.getfixturevalue(plugin_fixture)
 
         updated_content = updater._update_plugin_version_in_content(
-            sample_yaml_content, sample_plugin, new_version
+            sample_yaml_content, plugin, new_version
         )
 
-        assert "next__0.1.3" in updated_content
-        assert "next__0.1.2" not in updated_content
-        assert updated_content != sample_yaml_content
+        for expected in must_contain:
+            assert expected in updated_content
+        for unexpected in must_not_contain:
+            assert unexpected not in updated_content
+        assert (updated_content != sample_yaml_content) is changed
 
-    def test_update_plugin_version_in_content_preserves_formatting(
-        self, sample_yaml_content: "str", sample_plugin: "RHDHPlugin"
+    def test_update_plugin_version_in_content_ignores_longer_tags(
+        self, updater: "RHDHPluginConfigUpdater", sample_plugin: "RHDHPlugin"
     ) -> "None":
-        updater = RHDHPluginConfigUpdater()
-        new_version = Version("0.1.3")
+        content = (
+            f"- package: oci://ghcr.io/org/{sample_plugin.plugin_name}:"
+            f"next__0.1.25!{sample_plugin.plugin_name}\n"
+        )
 
         updated_content = updater._update_plugin_version_in_content(
-            sample_yaml_content, sample_plugin, new_version
+            content, sample_plugin, Version("0.1.3")
         )
 
-        # check that structure is preserved
-        assert "global:" in updated_content
-        assert "dynamic:" in updated_content
-        assert "plugins:" in updated_content
-        assert "disabled: false" in updated_content
+        assert updated_content == content
 
-    def test_update_plugin_version_in_content_no_match(
-        self, sample_yaml_content: "str"
+    def test_update_plugin_version_in_content_flow_mapping(
+        self, updater: "RHDHPluginConfigUpdater", sample_plugin: "RHDHPlugin"
     ) -> "None":
-        updater = RHDHPluginConfigUpdater()
-        non_existent_plugin = RHDHPlugin(
-            package_name="rhdh-plugin-export-overlays/non-existent",
-            current_version=Version("1.0.0"),
-            plugin_name="non-existent-plugin",
-            disabled=False,
+        content = (
+            f"- {{package: oci://ghcr.io/org/{sample_plugin.plugin_name}:"
+            "next__0.1.2, disabled: false}\n"
         )
-        new_version = Version("1.0.1")
 
         updated_content = updater._update_plugin_version_in_content(
-            sample_yaml_content, non_existent_plugin, new_version
+            content, sample_plugin, Version("0.1.3")
         )
 
-        # content should be unchanged
-        assert updated_content == sample_yaml_content
+        assert updated_content == content.replace("next__0.1.2", "next__0.1.3")
 
-    def test_update_plugin_version_updates_correct_plugin_only(
-        self, sample_yaml_content: "str"
+    def test_update_plugin_version_in_content_no_match_skips_pattern(
+        self,
+        updater: "RHDHPluginConfigUpdater",
+        sample_yaml_content: "str",
+        non_existent_plugin: "RHDHPlugin",
     ) -> "None":
-        updater = RHDHPluginConfigUpdater()
-        plugin = RHDHPlugin(
-            package_name="rhdh-plugin-export-overlays/red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool",
-            current_version=Version("0.2.0"),
-            plugin_name="red-hat-developer-hub-backstage-plugin-software-catalog-mcp-tool",
-            disabled=False,
-        )
-        new_version = Version("0.2.1")
-
-        updated_content = updater._update_plugin_version_in_content(
-            sample_yaml_content, plugin, new_version
-        )
+        with patch("src.updater._plugin_prefixes_pattern") as mock_pattern:
+            updated_content = updater._update_plugin_version_in_content(
+                sample_yaml_content, non_existent_plugin, Version("1.0.1")
+            )
 
-        # check that the correct plugin was updated
-        assert "software-catalog-mcp-tool:next__0.2.1" in updated_content
-        # check that other plugin was not affected
-        assert "mcp-actions-backend:next__0.1.2" in updated_content
+        mock_pattern.assert_not_called()
+        assert updated_content == sample_yaml_content
 
     def test_update_rhdh_plugin(
         self, temp_yaml_file: "Any", sample_plugin: "RHDHPlugin"
@@ -106,6 +143,70 @@ class TestRHDHPluginConfigUpdater:
         assert "next__0.1.3" in updated_content
         assert "next__0.1.2" not in updated_content
 
+    def test_update_rhdh_plugin_reads_config_once(
+        self, temp_yaml_file: "Any", sample_plugin: "RHDHPlugin"
+    ) -> "None":
+        updater = RHDHPluginConfigUpdater(config_path=temp_yaml_file)
+
+        with patch("builtins.open", wraps=open) as mock_open:
+            first = updater.update_rhdh_plugin(sample_plugin, Version("0.1.3"))
+            second = updater.update_rhdh_plugin(sample_plugin, Version("0.1.4"))
+
+        assert mock_open.call_count == 1
+        # every update starts from the original content
+        assert "next__0.1.3" in first
+        assert "next__0.1.4" in second
+        assert "next__0.1.3" not in second
+
+    def test_update_rhdh_plugin_rereads_modified_config(
+        self, temp_yaml_file: "Any", sample_plugin: "RHDHPlugin"
+    ) -> "None":
+        import os
+
+        updater = RHDHPluginConfigUpdater(config_path=temp_yaml_file)
+        updater.update_rhdh_plugin(sample_plugin, Version("0.1.3"))
+
+        with open(temp_yaml_file, "r") as f:
+            content = f.read()
+        with open(temp_yaml_file, "w") as f:
+            f.write(content.replace("next__0.1.2", "next__0.1.5"))
+        stat = os.stat(temp_yaml_file)
+        os.utime(temp_yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        updated_content = updater.update_rhdh_plugin(sample_plugin, Version("0.1.3"))
+
+        assert "next__0.1.5" in updated_content
+
+    def test_update_rhdh_plugin_rereads_resized_config_with_same_mtime(
+        self, temp_yaml_file: "Any", sample_plugin: "RHDHPlugin"
+    ) -> "None":
+        import os
+
+        updater = RHDHPluginConfigUpdater(config_path=temp_yaml_file)
+        updater.update_rhdh_plugin(sample_plugin, Version("0.1.3"))
+
+        stat = os.stat(temp_yaml_file)
+        with open(temp_yaml_file, "r") as f:
+            content = f.read()
+        with open(temp_yaml_file, "w") as f:
+            f.write(content.replace("next__0.1.2", "next__0.2.10"))
+        os.utime(temp_yaml_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        updated_content = updater.update_rhdh_plugin(sample_plugin, Version("0.1.3"))
+
+        assert "next__0.2.10" in updated_content
+
+    def test_update_rhdh_plugin_with_given_content(
+        self, sample_yaml_content: "str", sample_plugin: "RHDHPlugin"
+    ) -> "None":
+        updater = RHDHPluginConfigUpdater(config_path="/nonexistent/path.yaml")
+
+        updated_content = updater.update_rhdh_plugin(
+            sample_plugin, Version("0.1.3"), content=sample_yaml_content
+        )
+
+        assert "next__0.1.3" in updated_content
+
     def test_bulk_update_rhdh_plugins(self, temp_yaml_file: "Any") -> "None":
         updater = RHDHPluginConfigUpdater(config_path=temp_yaml_file)
 
@@ -134,98 +235,65 @@ class TestRHDHPluginConfigUpdater:
         assert "next__0.1.2" not in updated_content
         assert "next__0.2.0" not in updated_content
 
-    def test_update_rhdh_plugin_file_not_found(self) -> "None":
-        updater = RHDHPluginConfigUpdater(config_path="/non/existent/file.yaml")
-        plugin = RHDHPlugin(
-            package_name="test",
-            current_version=Version("1.0.0"),
-            plugin_name="test-plugin",
-            disabled=False,
-        )
-
-        with pytest.raises(FileNotFoundError):
-            updater.update_rhdh_plugin(plugin, Version("1.0.1"))
-
-    def test_find_current_tag_prefix_with_next_prefix(
-        self, sample_yaml_content: "str", sample_plugin: "RHDHPlugin"
-    ) -> "None":
-        updater = RHDHPluginConfigUpdater()
-
-        result = updater._find_current_tag_prefix(sample_yaml_content, sample_plugin)
-
-        assert result == "next__"
-
-    def test_find_current_tag_prefix_with_multiple_prefixes(
+    def test_bulk_update_skips_scan_for_no_op_updates(
         self,
-        sample_yaml_content_with_multiple_prefixes: "str",
-        sample_plugin_with_stable_prefix: "RHDHPlugin",
+        updater: "RHDHPluginConfigUpdater",
+        sample_yaml_content: "str",
+        sample_plugin: "RHDHPlugin",
     ) -> "None":
-        from unittest.mock import patch
-
-        updater = RHDHPluginConfigUpdater()
+        updates = [
+            RHDHPluginUpdate(
+                rhdh_plugin=sample_plugin, new_version=sample_plugin.current_version
+            )
+        ]
 
-        with patch(
-            "src.types.RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX",
-            ["next__", "stable__", "previous__"],
-        ):
-            result = updater._find_current_tag_prefix(
-                sample_yaml_content_with_multiple_prefixes,
-                sample_plugin_with_stable_prefix,
+        with patch("src.updater.PACKAGE_LINE_PATTERN") as mock_pattern:
+            updated_content = updater._bulk_update_plugin_versions_in_content(
+                sample_yaml_content, updates
             )
 
-        assert result == "stable__"
+        mock_pattern.sub.assert_not_called()
+        assert updated_content is sample_yaml_content
 
-    def test_find_current_tag_prefix_with_previous_prefix(
-        self,
-        sample_yaml_content_with_multiple_prefixes: "str",
-        sample_plugin_with_previous_prefix: "RHDHPlugin",
+    def test_bulk_update_flow_mapping(
+        self, updater: "RHDHPluginConfigUpdater", sample_plugin: "RHDHPlugin"
     ) -> "None":
-        from unittest.mock import patch
-
-        updater = RHDHPluginConfigUpdater()
-
-        with patch(
-            "src.types.RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX",
-            ["next__", "stable__", "previous__"],
-        ):
-            result = updater._find_current_tag_prefix(
-                sample_yaml_content_with_multiple_prefixes,
-                sample_plugin_with_previous_prefix,
-            )
+        content = (
+            f"- {{package: oci://ghcr.io/org/{sample_plugin.plugin_name}:"
+            "next__0.1.2, disabled: false}\n"
+            f"- [{{package: oci://ghcr.io/org/{sample_plugin.plugin_name}:"
+            "next__0.1.2}]\n"
+        )
+        updates = [
+            RHDHPluginUpdate(rhdh_plugin=sample_plugin, new_version=Version("0.1.3"))
+        ]
 
-        assert result == "previous__"
+        updated_content = updater._bulk_update_plugin_versions_in_content(
+            content, updates
+        )
 
-    def test_find_current_tag_prefix_defaults_to_first_when_not_found(
-        self, sample_yaml_content: "str"
-    ) -> "None":
-        from unittest.mock import patch
+        assert updated_content == content.replace("next__0.1.2", "next__0.1.3")
 
-        updater = RHDHPluginConfigUpdater()
-        non_existent_plugin = RHDHPlugin(
-            package_name="rhdh-plugin-export-overlays/non-existent",
+    def test_update_rhdh_plugin_file_not_found(self) -> "None":
+        updater = RHDHPluginConfigUpdater(config_path="/non/existent/file.yaml")
+        plugin = RHDHPlugin(
+            package_name="test",
             current_version=Version("1.0.0"),
-            plugin_name="non-existent-plugin",
+            plugin_name="test-plugin",
             disabled=False,
         )
 
-        with patch(
-            "src.types.RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX",
-            ["next__", "stable__"],
-        ):
-            result = updater._find_current_tag_prefix(
-                sample_yaml_content, non_existent_plugin
-            )
-
-        assert result == "next__"
+        with pytest.raises(FileNotFoundError):
+            updater.update_rhdh_plugin(plugin, Version("1.0.1"))
 
     def test_update_plugin_version_preserves_original_prefix(
         self,
+        updater: "RHDHPluginConfigUpdater",
         sample_yaml_content_with_multiple_prefixes: "str",
         sample_plugin_with_stable_prefix: "RHDHPlugin",
     ) -> "None":
         from unittest.mock import patch
 
-        updater = RHDHPluginConfigUpdater()
         new_version = Version("0.2.1")
 
         with patch(
@@ -245,12 +313,12 @@ class TestRHDHPluginConfigUpdater:
 
     def test_update_plugin_version_with_different_prefixes(
         self,
+        updater: "RHDHPluginConfigUpdater",
         sample_yaml_content_with_multiple_prefixes: "str",
         sample_plugin_with_previous_prefix: "RHDHPlugin",
     ) -> "None":
         from unittest.mock import patch
 
-        updater = RHDHPluginConfigUpdater()
         new_version = Version("1.1.0")
 
         with patch(
@@ -268,16 +336,18 @@ class TestRHDHPluginConfigUpdater:
         assert "next__0.1.2" in updated_content
         assert "stable__0.2.0" in updated_content
 
-    def test_build_version_string_with_single_version(self) -> "None":
-        updater = RHDHPluginConfigUpdater()
+    def test_build_version_string_with_single_version(
+        self, updater: "RHDHPluginConfigUpdater"
+    ) -> "None":
         version = Version("1.42.5")
 
         result = updater._build_version_string(version)
 
         assert result == "1.42.5"
 
-    def test_build_version_string_with_dual_version(self) -> "None":
-        updater = RHDHPluginConfigUpdater()
+    def test_build_version_string_with_dual_version(
+        self, updater: "RHDHPluginConfigUpdater"
+    ) -> "None":
         version = Version("1.42.5")
         second_version = Version("0.1.0")
 
@@ -285,8 +355,9 @@ class TestRHDHPluginConfigUpdater:
 
         assert result == "1.42.5__0.1.0"
 
-    def test_build_version_string_with_none_second_version(self) -> "None":
-        updater = RHDHPluginConfigUpdater()
+    def test_build_version_string_with_none_second_version(
+        self, updater: "RHDHPluginConfigUpdater"
+    ) -> "None":
         version = Version("1.42.5")
 
         result = updater._build_version_string(version, None)
@@ -294,9 +365,10 @@ class TestRHDHPluginConfigUpdater:
         assert result == "1.42.5"
 
     def test_update_plugin_version_with_dual_version(
-        self, sample_yaml_content_with_dual_versions: "str"
+        self,
+        updater: "RHDHPluginConfigUpdater",
+        sample_yaml_content_with_dual_versions: "str",
     ) -> "None":
-        updater = RHDHPluginConfigUpdater()
         plugin = RHDHPlugin(
             package_name="rhdh-plugin-export-overlays/dual-version-plugin",
             current_version=Version("1.42.5"),
@@ -318,9 +390,10 @@ class TestRHDHPluginConfigUpdater:
         assert "next__1.42.5__0.1.0" not in updated_content
 
     def test_update_plugin_version_from_dual_to_single(
-        self, sample_yaml_content_with_dual_versions: "str"
+        self,
+        updater: "RHDHPluginConfigUpdater",
+        sample_yaml_content_with_dual_versions: "str",
     ) -> "None":
-        updater = RHDHPluginConfigUpdater()
         plugin = RHDHPlugin(
             package_name="rhdh-plugin-export-overlays/dual-version-plugin",
             current_version=Version("1.42.5"),
@@ -339,9 +412,11 @@ class TestRHDHPluginConfigUpdater:
         assert "next__1.42.5__0.1.0" not in updated_content
 
     def test_update_plugin_version_from_single_to_dual(
-        self, sample_yaml_content: "str", sample_plugin: "RHDHPlugin"
+        self,
+        updater: "RHDHPluginConfigUpdater",
+        sample_yaml_content: "str",
+        sample_plugin: "RHDHPlugin",
     ) -> "None":
-        updater = RHDHPluginConfigUpdater()
         new_version = Version("0.2.0")
         new_second_version = Version("1.0.0")
 
@@ -352,24 +427,6 @@ class TestRHDHPluginConfigUpdater:
         assert "next__0.2.0__1.0.0" in updated_content
         assert "next__0.1.2" not in updated_content
 
-    def test_find_current_tag_prefix_with_dual_version(
-        self, sample_yaml_content_with_dual_versions: "str"
-    ) -> "None":
-        updater = RHDHPluginConfigUpdater()
-        plugin = RHDHPlugin(
-            package_name="rhdh-plugin-export-overlays/dual-version-plugin",
-            current_version=Version("1.42.5"),
-            plugin_name="dual-version-plugin",
-            disabled=False,
-            current_second_version=Version("0.1.0"),
-        )
-
-        result = updater._find_current_tag_prefix(
-            sample_yaml_content_with_dual_versions, plugin
-        )
-
-        assert result == "next__"
-
     def test_bulk_update_with_dual_versions(
         self, temp_yaml_file_with_dual_versions: "Any"
     ) -> "None":
@@ -432,10 +489,10 @@ class TestRHDHPluginConfigUpdater:
 
     def test_update_plugin_version_without_exclamation(
         self,
+        updater: "RHDHPluginConfigUpdater",
         sample_yaml_content_without_exclamation: "str",
         sample_plugin: "RHDHPlugin",
     ) -> "None":
-        updater = RHDHPluginConfigUpdater()
         new_version = Version("0.1.3")
 
         updated_content = updater._update_plugin_version_in_content(
@@ -446,19 +503,6 @@ class TestRHDHPluginConfigUpdater:
         assert "next__0.1.2" not in updated_content
         assert updated_content != sample_yaml_content_without_exclamation
 
-    def test_find_current_tag_prefix_without_exclamation(
-        self,
-        sample_yaml_content_without_exclamation: "str",
-        sample_plugin: "RHDHPlugin",
-    ) -> "None":
-        updater = RHDHPluginConfigUpdater()
-
-        result = updater._find_current_tag_prefix(
-            sample_yaml_content_without_exclamation, sample_plugin
-        )
-
-        assert result == "next__"
-
     def test_bulk_update_without_exclamation(
         self, temp_yaml_file_without_exclamation: "Any"
     ) -> "None":
@@ -491,8 +535,9 @@ class TestRHDHPluginConfigUpdater:
         assert "next__0.1.2" not in updated_content
         assert "next__0.2.0" not in updated_content
 
-    def test_update_plugin_does_not_match_substring_plugin_name(self) -> "None":
-        updater = RHDHPluginConfigUpdater()
+    def test_update_plugin_does_not_match_substring_plugin_name(
+        self, updater: "RHDHPluginConfigUpdater"
+    ) -> "None":
         # known issue where if one plugin's name is a substring of another, it may
         # incorrectly match and update the wrong plugin.
         content = """global:
@@ -532,3 +577,140 @@ class TestRHDHPluginConfigUpdater:
             "oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/red-hat-developer-hub-backstage-plugin-lightspeed-backend:bs_1.45.3__1.2.3"
             in updated_content
         )
+
+    def test_bulk_update_plugins_with_suffix_plugin_names(
+        self, tmp_path: "Any"
+    ) -> "None":
+        # one plugin name is a suffix of the other and both use the same tag
+        config_file = tmp_path / "dynamic-plugins.yaml"
+        config_file.write_text(
+            """global:
+  dynamic:
+    plugins:
+      - disabled: false
+        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/red-hat-developer-hub-backstage-plugin-lightspeed:next__1.0.0
+      - disabled: false
+        package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/backstage-plugin-lightspeed:next__1.0.0
+"""
+        )
+        updater = RHDHPluginConfigUpdater(config_path=str(config_file))
+
+        long_name_plugin = RHDHPlugin(
+            package_name="rhdh-plugin-export-overlays/red-hat-developer-hub-backstage-plugin-lightspeed",
+            current_version=Version("1.0.0"),
+            plugin_name="red-hat-developer-hub-backstage-plugin-lightspeed",
+            disabled=False,
+        )
+        short_name_plugin = RHDHPlugin(
+            package_name="rhdh-plugin-export-overlays/backstage-plugin-lightspeed",
+            current_version=Version("1.0.0"),
+            plugin_name="backstage-plugin-lightspeed",
+            disabled=False,
+        )
+
+        updates = [
+            RHDHPluginUpdate(
+                rhdh_plugin=short_name_plugin, new_version=Version("1.2.0")
+            ),
+            RHDHPluginUpdate(
+                rhdh_plugin=long_name_plugin, new_version=Version("1.1.0")
+            ),
+        ]
+
+        updated_content = updater.bulk_update_rhdh_plugins(updates)
+
+        assert (
+            "/red-hat-developer-hub-backstage-plugin-lightspeed:next__1.1.0"
+            in updated_content
+        )
+        assert "/backstage-plugin-lightspeed:next__1.2.0" in updated_content
+        assert "next__1.0.0" not in updated_content
+
+    def test_bulk_update_keeps_each_plugin_tag_prefix(self, tmp_path: "Any") -> "None":
+        config_file = tmp_path / "dynamic-plugins.yaml"
+        config_file.write_text(
+            """global:
+  dynamic:
+    plugins:
+      - package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/plugin-a:next__1.0.0!plugin-a
+      - package: oci://ghcr.io/redhat-developer/rhdh-plugin-export-overlays/plugin-b:stable__1.0.0!plugin-b
+"""
+        )
+        updater = RHDHPluginConfigUpdater(config_path=str(config_file))
+
+        updates = [
+            RHDHPluginUpdate(
+                rhdh_plugin=RHDHPlugin(
+                    package_name=f"rhdh-plugin-export-overlays/{name}",
+                    current_version=Version("1.0.0"),
+                    plugin_name=name,
+                    disabled=False,
+                ),
+                new_version=Version("2.0.0"),
+            )
+            for name in ("plugin-a", "plugin-b")
+        ]
+
+        with patch(
+            "src.types.RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX",
+            ["next__", "stable__"],
+        ):
+            updated_content = updater.bulk_update_rhdh_plugins(updates)
+
+        assert "/plugin-a:next__2.0.0!plugin-a" in updated_content
+        assert "/plugin-b:stable__2.0.0!plugin-b" in updated_content
+
+    def test_bulk_update_same_plugin_under_two_prefixes(
+        self, updater: "RHDHPluginConfigUpdater", caplog: "Any"
+    ) -> "None":
+        content = (
+            "- package: oci://ghcr.io/org/foo:next__1.0.0!foo\n"
+            "- package: oci://ghcr.io/org/foo:previous__1.0.0!foo\n"
+        )
+        updates = [
+            RHDHPluginUpdate(
+                rhdh_plugin=RHDHPlugin(
+                    package_name="rhdh-plugin-export-overlays/foo",
+                    current_version=Version("1.0.0"),
+                    plugin_name="foo",
+                    disabled=False,
+                    current_tag_prefix=prefix,
+                ),
+                new_version=Version(new_version),
+            )
+            for prefix, new_version in (("next__", "2.0.0"), ("previous__", "1.5.0"))
+        ]
+
+        updated_content = updater._bulk_update_plugin_versions_in_content(
+            content, updates
+        )
+
+        assert updated_content == (
+            "- package: oci://ghcr.io/org/foo:next__2.0.0!foo\n"
+            "- package: oci://ghcr.io/org/foo:previous__1.5.0!foo\n"
+        )
+        assert "no match found" not in caplog.text
+
+    def test_update_plugin_version_keeps_other_prefix_lines(
+        self, updater: "RHDHPluginConfigUpdater"
+    ) -> "None":
+        content = (
+            "- package: oci://ghcr.io/org/foo:next__1.0.0!foo\n"
+            "- package: oci://ghcr.io/org/foo:previous__1.0.0!foo\n"
+        )
+        plugin = RHDHPlugin(
+            package_name="rhdh-plugin-export-overlays/foo",
+            current_version=Version("1.0.0"),
+            plugin_name="foo",
+            disabled=False,
+            current_tag_prefix="next__",
+        )
+
+        updated_content = updater._update_plugin_version_in_content(
+            content, plugin, Version("2.0.0")
+        )
+
+        assert updated_content == (
+            "- package: oci://ghcr.io/org/foo:next__2.0.0!foo\n"
+            "- package: oci://ghcr.io/org/foo:previous__1.0.0!foo\n"
+        )
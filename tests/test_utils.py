@@ -8,7 +8,10 @@ from src.utils import (
     compare_versions,
     get_plugins_list_from_dict,
     parse_dual_version,
+    parse_version,
     rhdh_plugin_needs_update,
+    tag_prefix_matcher,
+    version_sort_key,
 )
 
 
@@ -63,31 +66,41 @@ class TestRHDHPluginNeedsUpdate:
     handles all tests for rhdh_plugin_needs_update function.
     """
 
-    def test_returns_true_when_latest_greater(self) -> "None":
-        latest = Version("1.2.0")
-        current = Version("1.1.0")
-        assert rhdh_plugin_needs_update(latest, current) is True
+    @pytest.mark.parametrize(
+        "latest, current, expected",
+        [
+            pytest.param("1.2.0", "1.1.0", True, id="latest_greater"),
+            pytest.param("1.1.0", "1.1.0", False, id="versions_equal"),
+            pytest.param("1.0.0", "1.1.0", False, id="current_greater"),
+            pytest.param("2.0.0", "1.9.9", True, id="semantic_major"),
+            pytest.param("1.0.1", "1.0.0", True, id="semantic_patch"),
+            pytest.param("1.10.0", "1.9.0", True, id="semantic_numeric_minor"),
+            pytest.param("1.0.0", "1.0.0rc1", True, id="release_after_prerelease"),
+            pytest.param("1.0.0rc2", "1.0.0rc1", True, id="prerelease_order"),
+        ],
+    )
+    def test_needs_update(
+        self, latest: "str", current: "str", expected: "bool"
+    ) -> "None":
+        assert rhdh_plugin_needs_update(Version(latest), Version(current)) is expected
 
-    def test_returns_false_when_versions_equal(self) -> "None":
-        latest = Version("1.1.0")
-        current = Version("1.1.0")
-        assert rhdh_plugin_needs_update(latest, current) is False
 
-    def test_returns_false_when_current_greater(self) -> "None":
-        latest = Version("1.0.0")
-        current = Version("1.1.0")
-        assert rhdh_plugin_needs_update(latest, current) is False
+class TestParseVersion:
+    """
+    handles all tests for parse_version function.
+    """
 
-    def test_handles_semantic_versioning(self) -> "None":
-        assert rhdh_plugin_needs_update(Version("2.0.0"), Version("1.9.9")) is True
-        assert rhdh_plugin_needs_update(Version("1.0.1"), Version("1.0.0")) is True
-        assert rhdh_plugin_needs_update(Version("1.10.0"), Version("1.9.0")) is True
+    def test_parses_version(self) -> "None":
+        assert parse_version("1.42.5") == Version("1.42.5")
 
-    def test_handles_prerelease_versions(self) -> "None":
-        assert rhdh_plugin_needs_update(Version("1.0.0"), Version("1.0.0rc1")) is True
-        assert (
-            rhdh_plugin_needs_update(Version("1.0.0rc2"), Version("1.0.0rc1")) is True
-        )
+    def test_reuses_cached_version(self) -> "None":
+        assert parse_version("1.42.5") is parse_version("1.42.5")
+
+    def test_raises_on_invalid_version(self) -> "None":
+        from packaging.version import InvalidVersion
+
+        with pytest.raises(InvalidVersion):
+            parse_version("not-a-version")
 
 
 class TestParseDualVersion:
@@ -95,6 +108,11 @@ class TestParseDualVersion:
     handles all tests for parse_dual_version function.
     """
 
+    def test_reuses_cached_result(self) -> "None":
+        assert parse_dual_version("1.42.5__0.1.0") is parse_dual_version(
+            "1.42.5__0.1.0"
+        )
+
     def test_parses_single_version(self) -> "None":
         version_string = "1.42.5"
         primary, secondary = parse_dual_version(version_string)
@@ -137,65 +155,64 @@ class TestCompareVersions:
     handles all tests for compare_versions function.
     """
 
-    def test_compares_primary_versions_greater(self) -> "None":
-        result = compare_versions(Version("2.0.0"), Version("1.0.0"))
-        assert result > 0
-
-    def test_compares_primary_versions_less(self) -> "None":
-        result = compare_versions(Version("1.0.0"), Version("2.0.0"))
-        assert result < 0
-
-    def test_compares_primary_versions_equal(self) -> "None":
-        result = compare_versions(Version("1.0.0"), Version("1.0.0"))
-        assert result == 0
-
-    def test_compares_secondary_when_primary_equal(self) -> "None":
-        result = compare_versions(
-            Version("1.0.0"),
-            Version("1.0.0"),
-            Version("0.2.0"),
-            Version("0.1.0"),
-        )
-        assert result > 0
-
-    def test_compares_secondary_less_when_primary_equal(self) -> "None":
-        result = compare_versions(
-            Version("1.0.0"),
-            Version("1.0.0"),
-            Version("0.1.0"),
-            Version("0.2.0"),
-        )
-        assert result < 0
-
-    def test_compares_secondary_equal_when_both_equal(self) -> "None":
-        result = compare_versions(
-            Version("1.0.0"),
-            Version("1.0.0"),
-            Version("0.1.0"),
-            Version("0.1.0"),
-        )
-        assert result == 0
-
-    def test_version_with_secondary_greater_than_without(self) -> "None":
-        result = compare_versions(
-            Version("1.0.0"), Version("1.0.0"), Version("0.1.0"), None
-        )
-        assert result > 0
-
-    def test_version_without_secondary_less_than_with(self) -> "None":
-        result = compare_versions(
-            Version("1.0.0"), Version("1.0.0"), None, Version("0.1.0")
-        )
-        assert result < 0
-
-    def test_primary_version_takes_precedence(self) -> "None":
+    @pytest.mark.parametrize(
+        "latest, current, latest_second, current_second, sign",
+        [
+            pytest.param("2.0.0", "1.0.0", None, None, 1, id="primary_greater"),
+            pytest.param("1.0.0", "2.0.0", None, None, -1, id="primary_less"),
+            pytest.param("1.0.0", "1.0.0", None, None, 0, id="primary_equal"),
+            pytest.param("1.0.0", "1.0.0", "0.2.0", "0.1.0", 1, id="secondary_greater"),
+            pytest.param("1.0.0", "1.0.0", "0.1.0", "0.2.0", -1, id="secondary_less"),
+            pytest.param("1.0.0", "1.0.0", "0.1.0", "0.1.0", 0, id="both_equal"),
+            pytest.param(
+                "1.0.0",
+                "1.0.0",
+                "0.1.0",
+                None,
+                1,
+                id="with_secondary_greater_than_without",
+            ),
+            pytest.param(
+                "1.0.0",
+                "1.0.0",
+                None,
+                "0.1.0",
+                -1,
+                id="without_secondary_less_than_with",
+            ),
+            pytest.param(
+                "1.0.0",
+                "1.0.0",
+                None,
+                "0.dev0",
+                -1,
+                id="without_secondary_less_than_dev_secondary",
+            ),
+            pytest.param(
+                "1.0.0",
+                "2.0.0",
+                "10.0.0",
+                "0.1.0",
+                -1,
+                id="primary_takes_precedence",
+            ),
+        ],
+    )
+    def test_compares_versions(
+        self,
+        latest: "str",
+        current: "str",
+        latest_second: "str | None",
+        current_second: "str | None",
+        sign: "int",
+    ) -> "None":
         result = compare_versions(
-            Version("1.0.0"),
-            Version("2.0.0"),
-            Version("10.0.0"),
-            Version("0.1.0"),
+            Version(latest),
+            Version(current),
+            Version(latest_second) if latest_second else None,
+            Version(current_second) if current_second else None,
         )
-        assert result < 0
+        assert (result > 0) - (result < 0) == sign
 
 
 class TestRHDHPluginNeedsUpdateWithDualVersions:
@@ -203,80 +220,64 @@ class TestRHDHPluginNeedsUpdateWithDualVersions:
     handles tests for rhdh_plugin_needs_update with dual version support.
     """
 
-    def test_update_needed_when_primary_version_greater(self) -> "None":
-        assert (
-            rhdh_plugin_needs_update(
-                Version("1.43.0"),
-                Version("1.42.5"),
-                Version("0.1.0"),
-                Version("0.1.0"),
-            )
-            is True
-        )
-
-    def test_update_not_needed_when_versions_equal(self) -> "None":
-        assert (
-            rhdh_plugin_needs_update(
-                Version("1.42.5"),
-                Version("1.42.5"),
-                Version("0.1.0"),
-                Version("0.1.0"),
-            )
-            is False
-        )
-
-    def test_update_needed_when_secondary_version_greater(self) -> "None":
-        assert (
-            rhdh_plugin_needs_update(
-                Version("1.42.5"),
-                Version("1.42.5"),
-                Version("0.2.0"),
-                Version("0.1.0"),
-            )
-            is True
-        )
-
-    def test_update_not_needed_when_secondary_version_less(self) -> "None":
-        assert (
-            rhdh_plugin_needs_update(
-                Version("1.42.5"),
-                Version("1.42.5"),
-                Version("0.1.0"),
-                Version("0.2.0"),
-            )
-            is False
-        )
-
-    def test_update_needed_when_latest_has_secondary_current_does_not(
-        self,
-    ) -> "None":
-        assert (
-            rhdh_plugin_needs_update(
-                Version("1.42.5"), Version("1.42.5"), Version("0.1.0"), None
-            )
-            is True
-        )
-
-    def test_update_not_needed_when_current_has_secondary_latest_does_not(
+    @pytest.mark.parametrize(
+        "latest, current, latest_second, current_second, expected",
+        [
+            pytest.param(
+                "1.43.0", "1.42.5", "0.1.0", "0.1.0", True, id="primary_greater"
+            ),
+            pytest.param(
+                "1.42.5", "1.42.5", "0.1.0", "0.1.0", False, id="versions_equal"
+            ),
+            pytest.param(
+                "1.42.5", "1.42.5", "0.2.0", "0.1.0", True, id="secondary_greater"
+            ),
+            pytest.param(
+                "1.42.5", "1.42.5", "0.1.0", "0.2.0", False, id="secondary_less"
+            ),
+            pytest.param(
+                "1.42.5",
+                "1.42.5",
+                "0.1.0",
+                None,
+                True,
+                id="latest_has_secondary_current_does_not",
+            ),
+            pytest.param(
+                "1.42.5",
+                "1.42.5",
+                None,
+                "0.1.0",
+                False,
+                id="current_has_secondary_latest_does_not",
+            ),
+            # even though current has higher secondary, latest has higher primary
+            pytest.param(
+                "1.43.0",
+                "1.42.5",
+                "0.1.0",
+                "10.0.0",
+                True,
+                id="primary_takes_precedence_over_secondary",
+            ),
+        ],
+    )
+    def test_needs_update(
         self,
+        latest: "str",
+        current: "str",
+        latest_second: "str | None",
+        current_second: "str | None",
+        expected: "bool",
     ) -> "None":
         assert (
             rhdh_plugin_needs_update(
-                Version("1.42.5"), Version("1.42.5"), None, Version("0.1.0")
+                Version(latest),
+                Version(current),
+                Version(latest_second) if latest_second else None,
+                Version(current_second) if current_second else None,
             )
-            is False
-        )
-
-    def test_primary_version_takes_precedence_over_secondary(self) -> "None":
-        # even though current has higher secondary, latest has higher primary
-        assert (
-            rhdh_plugin_needs_update(
-                Version("1.43.0"),
-                Version("1.42.5"),
-                Version("0.1.0"),
-                Version("10.0.0"),
-            )
-            is True
+            is expected
         )
 
 
@@ -296,3 +297,75 @@ class TestBuildVersionString:
     def test_none_second_version(self) -> "None":
         result = build_version_string(Version("1.0.0"), None)
         assert result == "1.0.0"
+
+    def test_equal_versions_keep_their_own_spelling(self) -> "None":
+        # 1.0 == 1.0.0, but the config tags must be rebuilt exactly
+        assert build_version_string(Version("1.0")) == "1.0"
+        assert build_version_string(Version("1.0.0")) == "1.0.0"
+
+
+class TestVersionSortKey:
+    """
+    handles all tests for version_sort_key function.
+    """
+
+    def test_orders_release_versions(self) -> "None":
+        assert version_sort_key(Version("1.10.0")) > version_sort_key(Version("1.9.0"))
+
+    def test_ignores_trailing_zeros(self) -> "None":
+        assert version_sort_key(Version("1.0")) == version_sort_key(Version("1.0.0"))
+
+    def test_orders_prerelease_before_release(self) -> "None":
+        assert version_sort_key(Version("1.0.0rc1")) < version_sort_key(Version("1.0"))
+        assert version_sort_key(Version("1.0.0.post1")) > version_sort_key(
+            Version("1.0.0")
+        )
+
+    def test_version_with_secondary_greater_than_without(self) -> "None":
+        # previously failed comparing a Version against an empty string
+        assert version_sort_key(Version("1.0.0"), Version("0.1.0")) > version_sort_key(
+            Version("1.0.0")
+        )
+
+    def test_matches_compare_versions(self) -> "None":
+        versions = [
+            (Version("1.0.0"), None),
+            (Version("1.0.0"), Version("0.2.0")),
+            (Version("1.0.0"), Version("0.10.0")),
+            (Version("1.1.0rc1"), None),
+            (Version("1.1.0"), None),
+            (Version("2.0.0"), Version("0.1.0")),
+        ]
+
+        for a in versions:
+            for b in versions:
+                key_a, key_b = version_sort_key(*a), version_sort_key(*b)
+                expected = compare_versions(a[0], b[0], a[1], b[1])
+                assert (key_a > key_b) - (key_a < key_b) == expected
+
+
+class TestTagPrefixMatcher:
+    """
+    handles all tests for tag_prefix_matcher function.
+    """
+
+    def test_matches_longest_configured_prefix(self) -> "None":
+        from unittest.mock import patch
+
+        with patch(
+            "src.types.RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX",
+            ["next__", "next__rc__"],
+        ):
+            match_tag_prefix = tag_prefix_matcher()
+
+        assert match_tag_prefix("next__rc__1.0.0") == "next__rc__"
+        assert match_tag_prefix("next__1.0.0") == "next__"
+        assert match_tag_prefix("v1.0.0") is None
+
+    def test_matches_nothing_without_prefixes(self) -> "None":
+        from unittest.mock import patch
+
+        with patch("src.types.RHDHPluginUpdaterConfig.GH_PACKAGE_TAG_PREFIX", []):
+            match_tag_prefix = tag_prefix_matcher()
+
+        assert match_tag_prefix("next__1.0.0") is None